@@ -0,0 +1,198 @@
+"""
+Local mock of the directory for offline benchmarks.
+
+Serves generated pages that follow the markup read by `scraptolib.utils.selectors`:
+search pages with `rel="next"` pagination, practitioner profiles with several
+locations, and "Retry later" error pages. Pages are deterministic for a given seed,
+so two runs of the benchmarks scrape exactly the same content.
+"""
+import html, random, threading, time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, urlencode
+
+FIRST_NAMES = ["Camille", "Jean", "Léa", "Hugo", "Manon", "Louis", "Chloé", "Lucas", "Inès", "Paul"]
+LAST_NAMES = ["Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau"]
+STREETS = ["Avenue de Bordeaux", "Rue de la Paix", "Boulevard Victor Hugo", "Rue du Port", "Place de la Mairie"]
+SKILLS = ["Ostéopathie du sport", "Ostéopathie crânienne", "Kinesio Taping", "Ostéopathie pédiatrique", "Troubles digestifs"]
+LANGUAGES = ["Anglais", "Espagnol", "Allemand", "Italien"]
+
+RETRY_LATER_PAGE = "<html><body><pre>Retry later</pre></body></html>"
+
+def _slug(name:str):
+    return name.lower().replace(" ", "-").replace("é", "e").replace("è", "e").replace("ï", "i")
+
+def _practitioner(n:int, seed:int):
+    rng = random.Random(seed * 1_000_003 + n)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    return rng, name, f"{_slug(name)}-{n}"
+
+def search_page(place:str, query:str, page:int, pages:int, cards_per_page:int, seed:int=0):
+    cards = []
+    for i in range(cards_per_page):
+        n = (page - 1) * cards_per_page + i
+        rng, name, slug = _practitioner(n, seed)
+        cards.append(
+            f"""
+            <div class="dl-card dl-card-variant-default">
+                <a href="/{query}/{place}/{slug}?pid=practice-{n}&amp;source=search"></a>
+                <div class="p-16">
+                    <h2>{html.escape(name)}</h2>
+                    <p>{html.escape(query.capitalize())}</p>
+                    <p>{rng.randint(1, 120)} {rng.choice(STREETS)}</p>
+                    <p>{rng.randint(10, 95)}000 {html.escape(place.capitalize())}</p>
+                </div>
+            </div>"""
+        )
+
+    def link(number:int, rel:str=""):
+        query_string = urlencode({"location": place, "speciality": query, "page": number})
+        return f'<a {rel}href="/search?{query_string}">{number}</a>'
+
+    pagination = "".join(link(number) for number in range(1, pages + 1))
+    if page < pages:
+        pagination += link(page + 1, rel='rel="next" ')
+
+    return f"""<html><head><title>{query} {place}</title>
+<script>window.__STATE__ = {{"page": {page}}};</script></head>
+<body><div class="results">{"".join(cards)}</div>
+<nav class="pagination">{pagination}</nav></body></html>"""
+
+def profile_page(query:str, place:str, slug:str, n:int, location:int, locations:int, seed:int=0):
+    rng, name, _ = _practitioner(n, seed)
+    location_rng = random.Random(seed * 7 + n * 31 + location)
+
+    # the first location is the page linked from the search results
+    pills = "".join(
+        f'<a href="/{query}/{place}/{slug}?pid=practice-{n}{f"-{k}" if k else ""}">Cabinet {k + 1}</a>'
+        for k in range(locations)
+    )
+    skills = "".join(f"<div>{skill}</div>" for skill in rng.sample(SKILLS, 3))
+    languages = ", ".join(rng.sample(LANGUAGES, 2))
+    prices = "".join(
+        f"<li><span>{act}</span><br><span>{location_rng.randint(40, 90)} €</span></li>"
+        for act in ("Consultation au cabinet", "Consultation à domicile")
+    )
+    history = "".join(
+        f"""<div class="dl-profile-history"><h3>{section}</h3>
+        {"".join(f"<div>{rng.randint(1995, 2024)}</div><div>{label} {k}</div>" for k in range(3))}</div>"""
+        for section, label in (("Diplômes nationaux et universitaires", "Diplôme"), ("Expérience", "Cabinet"))
+    )
+
+    return f"""<html><head><title>{html.escape(name)}</title></head><body>
+<div class="dl-profile-header"><span itemprop="name">{html.escape(name)}</span>
+<div class="dl-profile-header-speciality">{html.escape(query.capitalize())}</div></div>
+<div class="dl-pill-list">{pills}</div>
+<div data-test="location-address">{location_rng.randint(1, 120)} {location_rng.choice(STREETS)}, {location_rng.randint(10, 95)}000 {html.escape(place.capitalize())}</div>
+<div class="dl-profile-skills">{skills}</div>
+<div><h3>Langues parlées</h3><div>Français, {languages}</div></div>
+<div class="dl-profile-bio">{html.escape(name)} vous accueille au cabinet.<br>Consultations du lundi au samedi.</div>
+<div><h3>Site web</h3><a href="https://{slug}.example.org/">Site</a></div>
+<div><h3>Coordonnées</h3><div>0{location_rng.randint(1, 9)} {location_rng.randint(10, 99)} {location_rng.randint(10, 99)} {location_rng.randint(10, 99)} {location_rng.randint(10, 99)}</div></div>
+<div><h2>Tarifs</h2><ul>{prices}</ul></div>
+{history}
+</body></html>"""
+
+class MockSite:
+    """
+    Threaded HTTP server of the mock directory, on localhost.
+
+    Methods
+    -------
+    __init__(pages: int = 5, cards_per_page: int = 20, locations: int = 3, retry_every: int = 0, seed: int = 0, port: int = 0, latency: float = 0)
+        `retry_every` > 0 answers every n-th request with a "Retry later" page. `port` 0 picks a free port.
+        `latency` delays every response by that many seconds, like a remote server would.
+
+    start() -> str
+        Starts serving in a background thread and returns the base URL.
+
+    stop()
+        Stops the server. The site is also a context manager.
+
+    search_url(place: str, query: str, page: int = 1) -> str
+        URL of a search page.
+    """
+
+    def __init__(self, pages:int=5, cards_per_page:int=20, locations:int=3, retry_every:int=0, seed:int=0, port:int=0, latency:float=0):
+        self.pages = pages
+        self.cards_per_page = cards_per_page
+        self.locations = locations
+        self.retry_every = retry_every
+        self.seed = seed
+        self.port = port
+        self.latency = latency
+        self.requests = 0
+        self.retry_later_served = 0
+        self.url = None
+
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def render(self, path:str, query:dict):
+        with self._lock:
+            self.requests += 1
+            if self.retry_every and self.requests % self.retry_every == 0:
+                self.retry_later_served += 1
+                return RETRY_LATER_PAGE
+
+        if path == "/search":
+            return search_page(
+                place=query.get("location", ["paris"])[0],
+                query=query.get("speciality", ["osteopathe"])[0],
+                page=int(query.get("page", ["1"])[0]),
+                pages=self.pages,
+                cards_per_page=self.cards_per_page,
+                seed=self.seed
+            )
+
+        parts = path.strip("/").split("/")
+        pid = query.get("pid", [""])[0]
+        if len(parts) == 3 and pid.startswith("practice-"):
+            ids = pid.removeprefix("practice-").split("-")
+            location = int(ids[1]) if len(ids) > 1 else 0
+            return profile_page(parts[0], parts[1], parts[2], int(ids[0]), location, self.locations, self.seed)
+
+        return None
+
+    def start(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if site.latency:
+                    time.sleep(site.latency)
+                parts = urlsplit(self.path)
+                page = site.render(parts.path, parse_qs(parts.query))
+                body = (page or "<html><body>Not found</body></html>").encode("utf-8")
+
+                self.send_response(200 if page is not None else 404)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        return self.url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def search_url(self, place:str, query:str, page:int=1):
+        query_string = urlencode({"location": place, "speciality": query, "page": page})
+        return f"{self.url}/search?{query_string}"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,269 @@
+"""
+Offline benchmarks of the extraction and output paths, against the local `MockSite`.
+
+    python benchmarks/run_benchmarks.py --output bench_results.json
+
+Every case reports its wall time, throughput and tracemalloc memory peak, and the whole
+run is written as JSON so results can be compared across versions. The HTTP cases only
+need the "http" extra; `--driver path/to/chromedriver` adds end-to-end Selenium scrapes.
+"""
+import argparse, datetime, json, platform, statistics, sys, tempfile, time, tracemalloc
+from importlib import metadata
+from pathlib import Path
+
+from mock_site import MockSite
+
+from scraptolib.parsers.HtmlParser import HtmlParser
+from scraptolib.utils.columnar import ColumnarWriter, pa
+from scraptolib.utils.fetchers import HttpFetcher
+from scraptolib.utils.helpers import store_json_data
+from scraptolib.utils.metrics import Metrics
+from scraptolib.utils.ratelimit import RateLimiter
+from scraptolib.utils.selectors import PROFILE_XPATHS
+from scraptolib.utils.sinks import JsonlSink
+
+PLACE = "paris"
+QUERY = "osteopathe"
+
+def measure(func, *args, **kwargs):
+    """
+    Runs `func` and returns its result, wall time and tracemalloc peak (bytes).
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, seconds, peak
+
+def field_readers(parser:HtmlParser):
+    return {
+        "locations": parser.get_locations,
+        "name": lambda: parser.text(PROFILE_XPATHS["name"]),
+        "speciality": lambda: parser.text(PROFILE_XPATHS["speciality"]),
+        "address": lambda: parser.text(PROFILE_XPATHS["address"]),
+        "skills": lambda: parser.text(PROFILE_XPATHS["skills"]),
+        "languages": lambda: parser.text(PROFILE_XPATHS["languages"]),
+        "summary": lambda: parser.text(PROFILE_XPATHS["summary"]),
+        "website": lambda: parser.href(parser.first(PROFILE_XPATHS["website"])),
+        "contact_details": lambda: parser.text(PROFILE_XPATHS["contact_details"]),
+        "prices": lambda: parser.texts(PROFILE_XPATHS["prices"]),
+        "history": lambda: parser.texts(PROFILE_XPATHS["history"]),
+    }
+
+def crawl_search(site:MockSite, fetcher:HttpFetcher):
+    cards, parse_times = [], []
+    url = site.search_url(PLACE, QUERY)
+    while url is not None:
+        html = fetcher.fetch(url)
+        start = time.perf_counter()
+        parser = HtmlParser(html, base_url=url)
+        cards += parser.get_cards(QUERY, PLACE)
+        url = parser.get_next_page()
+        parse_times.append(time.perf_counter() - start)
+    return cards, parse_times
+
+def bench_search(site:MockSite, fetcher:HttpFetcher):
+    (cards, parse_times), seconds, peak = measure(crawl_search, site, fetcher)
+    return {
+        "pages": len(parse_times),
+        "cards": len(cards),
+        "seconds": round(seconds, 4),
+        "pages_per_second": round(len(parse_times) / seconds, 2),
+        "parse_ms_per_page": round(1000 * statistics.mean(parse_times), 3),
+        "memory_peak_bytes": peak,
+    }, cards
+
+def bench_fetch_pages(site:MockSite, fetcher:HttpFetcher, workers:int, target_dir:Path):
+    from scraptolib.scrapers.CardsScraper import CardsScraper
+
+    # an unbounded limiter replaces the human-like pauses between pages
+    limiter = RateLimiter(rate=1e6, max_rate=1e6, burst=workers)
+    scraper = CardsScraper(None, rate_limiter=limiter, fetcher=fetcher)
+    scraper.base_url = site.url
+    report, seconds, peak = measure(
+        scraper.fetch_pages, PLACE, QUERY,
+        workers=workers,
+        target_path=str(target_dir / f"cards_pages_{workers}.json")
+    )
+    return {
+        "workers": workers,
+        "pages": report["pages"],
+        "cards": report["cards"],
+        "seconds": round(seconds, 4),
+        "pages_per_second": round(report["pages"] / seconds, 2),
+        "memory_peak_bytes": peak,
+    }
+
+def scrape_profiles(hrefs:list[str], fetcher:HttpFetcher):
+    latencies = {}
+    records = []
+    for href in hrefs:
+        parser = HtmlParser(fetcher.fetch(href), base_url=href)
+        for field, read in field_readers(parser).items():
+            start = time.perf_counter()
+            read()
+            latencies.setdefault(field, []).append(time.perf_counter() - start)
+
+        locations = parser.get_locations()
+        data = parser.get_profile_data()
+        records.append({"location": locations[0], **data})
+        for location in locations[1:]:
+            other = HtmlParser(fetcher.fetch(location[1]), base_url=location[1])
+            records.append({"location": location, **data, **other.get_location_data()})
+    return records, latencies
+
+def bench_profiles(hrefs:list[str], fetcher:HttpFetcher, locations:int):
+    (records, latencies), seconds, peak = measure(scrape_profiles, hrefs, fetcher)
+    pages = len(hrefs) * locations
+    return {
+        "profiles": len(hrefs),
+        "pages": pages,
+        "records": len(records),
+        "seconds": round(seconds, 4),
+        "pages_per_second": round(pages / seconds, 2),
+        "field_latency_ms": {
+            field: round(1000 * statistics.mean(values), 4)
+            for field, values in latencies.items()
+        },
+        "memory_peak_bytes": peak,
+    }, records
+
+def bench_retry_later(fetcher:HttpFetcher, pages:int, retry_every:int):
+    with MockSite(retry_every=retry_every) as site:
+        def detect():
+            detected = 0
+            for page in range(pages):
+                url = site.search_url(PLACE, QUERY, page % site.pages + 1)
+                detected += HtmlParser(fetcher.fetch(url), base_url=url).is_retry_later()
+            return detected
+
+        detected, seconds, peak = measure(detect)
+        served = site.retry_later_served
+
+    return {
+        "pages": pages,
+        "retry_later_served": served,
+        "retry_later_detected": detected,
+        "seconds": round(seconds, 4),
+        "memory_peak_bytes": peak,
+    }
+
+def bench_outputs(records:list[dict], kind:str, target_dir:Path):
+    writers = {
+        "json": lambda path: store_json_data(records, path),
+        "jsonl": lambda path: write_jsonl(records, path),
+    }
+    if pa is not None:
+        writers["parquet"] = lambda path: write_columnar(records, path, kind)
+
+    results = {}
+    for fmt, write in writers.items():
+        path = target_dir / f"{kind}.{fmt}"
+        path.unlink(missing_ok=True)
+        _, seconds, peak = measure(write, path)
+        results[fmt] = {
+            "records": len(records),
+            "seconds": round(seconds, 4),
+            "bytes": path.stat().st_size,
+            "memory_peak_bytes": peak,
+        }
+    return results
+
+def write_jsonl(records:list[dict], path:Path):
+    with JsonlSink(path, append=False, flush_every=len(records) or 1) as sink:
+        sink.write_many(records)
+
+def write_columnar(records:list[dict], path:Path, kind:str):
+    with ColumnarWriter(path, kind=kind) as writer:
+        writer.write_many(records)
+
+def bench_browser(site:MockSite, driver_path:str, hrefs:list[str], target_dir:Path):
+    from scraptolib.scrapers.CardsScraper import CardsScraper
+    from scraptolib.scrapers.ProfileScraper import ProfileScraper
+
+    results = {}
+    for extraction in ("wait", "script", "html"):
+        metrics = Metrics()
+        scraper = CardsScraper(driver_path, metrics=metrics, driver_profile="fast")
+        scraper.base_url = site.url
+        _, seconds, peak = measure(
+            scraper.run_scraping, PLACE, QUERY,
+            target_path=str(target_dir / f"cards_{extraction}.json"),
+            extraction=extraction
+        )
+        results[f"cards[{extraction}]"] = {
+            "seconds": round(seconds, 4),
+            "pages_per_second": round(site.pages / seconds, 2),
+            "memory_peak_bytes": peak,
+            "metrics": metrics.summary(),
+        }
+
+    for extraction in ("wait", "script", "html"):
+        metrics = Metrics()
+        scraper = ProfileScraper(driver_path, metrics=metrics, driver_profile="fast")
+        scraper.base_url = site.url
+        scraper.start_driver()
+        _, seconds, peak = measure(lambda: [scraper.run_scraping(href, extraction=extraction) for href in hrefs])
+        scraper.stop_driver()
+        results[f"profiles[{extraction}]"] = {
+            "seconds": round(seconds, 4),
+            "profiles_per_second": round(len(hrefs) / seconds, 2),
+            "memory_peak_bytes": peak,
+            "metrics": metrics.summary(),
+        }
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="bench_results.json", help="JSON results file")
+    parser.add_argument("--pages", type=int, default=20, help="search pages of the mock site")
+    parser.add_argument("--cards-per-page", type=int, default=20)
+    parser.add_argument("--profiles", type=int, default=50, help="profiles scraped")
+    parser.add_argument("--locations", type=int, default=3, help="locations per profile")
+    parser.add_argument("--workers", type=int, default=4, help="threads of the concurrent search case")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every response of the mock site")
+    parser.add_argument("--retry-every", type=int, default=4, help="1 page out of n is a 'Retry later' page")
+    parser.add_argument("--driver", help="chromedriver path, adds the Selenium end-to-end cases")
+    args = parser.parse_args(argv)
+
+    results = {}
+    fetcher = HttpFetcher()
+    with MockSite(pages=args.pages, cards_per_page=args.cards_per_page, locations=args.locations, latency=args.latency) as site, \
+         tempfile.TemporaryDirectory() as tmp:
+        results["search_http"], cards = bench_search(site, fetcher)
+        results["search_http_concurrent"] = bench_fetch_pages(site, fetcher, args.workers, Path(tmp))
+
+        hrefs = [card["Page_doctolib"] for card in cards[:args.profiles]]
+        results["profiles_http"], records = bench_profiles(hrefs, fetcher, args.locations)
+
+        results["retry_later"] = bench_retry_later(fetcher, args.pages, args.retry_every)
+        results["output_cards"] = bench_outputs(cards, "card", Path(tmp))
+        results["output_profiles"] = bench_outputs(records, "profile", Path(tmp))
+
+        if args.driver:
+            results["browser"] = bench_browser(site, args.driver, hrefs[:5], Path(tmp))
+    fetcher.close()
+
+    try:
+        version = metadata.version("scraptolib")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+
+    report = {
+        "scraptolib": version,
+        "python": platform.python_version(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "config": vars(args),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4, ensure_ascii=False)
+    json.dump(results, sys.stdout, indent=4, ensure_ascii=False)
+    print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+from pathlib import Path
+from scraptolib.scrapers.CardsScraper import CardsScraper
+from scraptolib.utils.sinks import JsonlSink
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+chromedriver_path = BASE_DIR / "chromedriver.exe"
+output_path = BASE_DIR / "scrapers" / "mock_data" / "href_results.jsonl"
+
+pairs = [
+    ('example_place', 'example_query'), # change it !
+    ('other_place', 'example_query'), # change it !
+]
+
+scpr = CardsScraper(
+    driver_path=str(chromedriver_path)
+)
+
+with JsonlSink(output_path) as sink:
+    reports = scpr.run_sweep(
+        pairs=pairs,
+        only_href=True,
+        sink=sink
+    )
+
+print(reports)
@@ -0,0 +1,26 @@
+from pathlib import Path
+from scraptolib.scrapers.CardsScraper import CardsScraper
+from scraptolib.scrapers.ProfilePool import ProfilePool
+from scraptolib.scrapers.Pipeline import Pipeline
+from scraptolib.utils.sinks import JsonlSink
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+chromedriver_path = BASE_DIR / "chromedriver.exe"
+output_path = BASE_DIR / "scrapers" / "mock_data" / "profile_results.jsonl"
+
+pipeline = Pipeline(
+    cards_scraper=CardsScraper(driver_path=str(chromedriver_path)),
+    profile_pool=ProfilePool(driver_path=str(chromedriver_path), workers=2),
+    max_pending=20
+)
+
+# profiles are scraped while the search is still being paginated
+with JsonlSink(output_path) as sink:
+    report = pipeline.run(
+        place_input="Bordeaux",
+        query_input="osteopathe",
+        sink=sink
+    )
+
+print(report)
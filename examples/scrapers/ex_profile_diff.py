@@ -0,0 +1,16 @@
+from pathlib import Path
+from scraptolib.utils.diff import write_change_feed
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+previous_path = BASE_DIR / "scrapers" / "mock_data" / "profile_results.json"
+current_path = BASE_DIR / "scrapers" / "mock_data" / "profile_results_new.json" # change it !
+feed_path = BASE_DIR / "scrapers" / "mock_data" / "profile_changes.jsonl"
+
+counts = write_change_feed(
+    old_path=previous_path,
+    new_path=current_path,
+    target_path=feed_path
+)
+
+print(counts)
@@ -0,0 +1,29 @@
+from pathlib import Path
+from scraptolib.scrapers.ProfilePool import ProfilePool
+import json
+from scraptolib.utils.helpers import store_json_data
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+chromedriver_path = BASE_DIR / "chromedriver.exe"
+input_path = BASE_DIR / "scrapers" / "mock_data" / "href_results.json"
+output_path = BASE_DIR / "scrapers" / "mock_data" / "profile_results.json"
+
+with open(input_path) as f:
+    data = json.load(f)
+
+pool = ProfilePool(
+    driver_path=str(chromedriver_path),
+    workers=3
+)
+
+results = pool.run_many(
+    hrefs=[profile['Page_doctolib'] for profile in data]
+)
+
+print(pool.failed)
+
+store_json_data(
+    data=results,
+    target_path=output_path
+)
@@ -0,0 +1,33 @@
+from pathlib import Path
+from scraptolib.scrapers.ProfilePool import run_worker
+import json
+from scraptolib.utils.sinks import JsonlSink
+from scraptolib.utils.taskqueue import TaskQueue
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+chromedriver_path = BASE_DIR / "chromedriver.exe"
+input_path = BASE_DIR / "scrapers" / "mock_data" / "href_results.json"
+queue_path = BASE_DIR / "scrapers" / "mock_data" / "tasks.sqlite"
+output_path = BASE_DIR / "scrapers" / "mock_data" / "profile_results.jsonl"
+
+# Publisher: queue the profiles (a CardsScraper can also publish directly with `sink=queue`)
+# Workers on other machines need a shared server instead: RedisTaskQueue("redis://host:6379/0")
+queue = TaskQueue(queue_path)
+
+with open(input_path) as f:
+    data = json.load(f)
+
+print(queue.publish([profile['Page_doctolib'] for profile in data]))
+
+# Worker: run this part in as many processes as needed, on the machine holding the queue file (any machine with Redis)
+with JsonlSink(output_path) as sink:
+    counts = run_worker(
+        task_queue=queue,
+        driver_path=str(chromedriver_path),
+        workers=2,
+        sink=sink
+    )
+
+print(counts, queue.stats())
+queue.close()
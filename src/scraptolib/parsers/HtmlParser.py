@@ -0,0 +1,190 @@
+import re
+from pathlib import Path
+from urllib.parse import urljoin
+
+try:
+    from lxml import html as lxml_html
+except ImportError: # optional dependency, see the "html" extra
+    lxml_html = None
+
+from scraptolib.utils.selectors import PROFILE_XPATHS, SEARCH_XPATHS, RETRY_LATER_XPATH
+from scraptolib.utils.formatters import format_profile, format_location, format_card
+from scraptolib.utils.helpers import page_number
+
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "tr", "ul",
+}
+SKIPPED_TAGS = {"script", "style", "noscript", "template"}
+
+# Marks a block boundary while walking the tree; runs of it collapse into one line break.
+_BLOCK_BREAK = "\x00"
+_WHITESPACE = re.compile(r"\s+")
+
+def inner_text(element):
+    """
+    Approximates the rendered text Selenium returns for `element.text`:
+    block elements go on their own line, <br> breaks the line and whitespace is collapsed.
+    """
+    parts = []
+
+    def walk(el):
+        tag = el.tag if isinstance(el.tag, str) else None
+        if tag in SKIPPED_TAGS:
+            return
+        if tag == "br":
+            parts.append("\n")
+        if tag in BLOCK_TAGS:
+            parts.append(_BLOCK_BREAK)
+        if tag and el.text:
+            parts.append(_WHITESPACE.sub(" ", el.text))
+        for child in el:
+            walk(child)
+            if child.tail:
+                parts.append(_WHITESPACE.sub(" ", child.tail))
+        if tag in BLOCK_TAGS:
+            parts.append(_BLOCK_BREAK)
+
+    walk(element)
+
+    lines = []
+    for chunk in "".join(parts).split("\n"):
+        blocks = [block.strip() for block in chunk.split(_BLOCK_BREAK)]
+        lines.append("\n".join(block for block in blocks if block))
+    return "\n".join(lines).strip()
+
+class HtmlParser:
+    """
+    Offline parser running the shared selectors against raw HTML with lxml.
+
+    Works on `driver.page_source` (one round trip instead of one per element) as well as on
+    saved HTML files, so parsing can be re-run and benchmarked without a browser.
+    Requires the optional `lxml` dependency (`pip install scraptolib[html]`).
+
+    Methods
+    -------
+    __init__(page_source: str, base_url: str = "")
+        Parses `page_source`. Relative links are resolved against `base_url`.
+
+    from_driver(driver) -> HtmlParser
+        Builds a parser from the current page of a Selenium driver.
+
+    from_file(path: str, base_url: str = "") -> HtmlParser
+        Builds a parser from a saved HTML file.
+
+    is_retry_later() -> bool
+        Detects "Retry later" or temporary error messages on the page.
+
+    get_locations() -> List[Tuple[str, str]]
+        Same output as `ProfileScraper.get_locations`.
+
+    get_raw_profile() -> Dict
+        Raw section texts, None for missing sections.
+
+    get_profile_data() -> Dict
+        Same output as `ProfileScraper.get_profile_data`.
+
+    get_raw_location() -> Dict
+        Raw texts of the location-level sections only (address, contact details, prices).
+
+    get_location_data() -> Dict
+        Formatted location-level fields, to complete the practitioner-level fields of another location.
+
+    get_next_page() -> str | None
+        URL of the next search page, None on the last one.
+
+    get_page_count() -> int | None
+        Highest page number linked from the search pagination, None without numbered links.
+
+    get_cards(query_input: str, place_input: str, only_href: bool = False) -> List[Dict]
+        Same records as `CardsScraper.run_scraping` for the current search page.
+    """
+
+    def __init__(self, page_source:str, base_url:str=""):
+        if lxml_html is None:
+            raise ImportError("HtmlParser requires lxml: pip install scraptolib[html]")
+
+        self.base_url = base_url
+        self.tree = lxml_html.fromstring(page_source)
+
+    @classmethod
+    def from_driver(cls, driver):
+        return cls(driver.page_source, base_url=driver.current_url)
+
+    @classmethod
+    def from_file(cls, path:str, base_url:str=""):
+        return cls(Path(path).read_text(encoding="utf-8"), base_url=base_url)
+
+    def first(self, xpath:str, node=None):
+        found = (self.tree if node is None else node).xpath(xpath)
+        return found[0] if found else None
+
+    def text(self, xpath:str):
+        node = self.first(xpath)
+        return None if node is None else inner_text(node)
+
+    def texts(self, xpath:str):
+        nodes = self.tree.xpath(xpath)
+        return [inner_text(node) for node in nodes] if nodes else None
+
+    def href(self, node):
+        if node is None or node.get("href") is None:
+            return None
+        return urljoin(self.base_url, node.get("href"))
+
+    def is_retry_later(self):
+        return self.first(RETRY_LATER_XPATH) is not None
+
+    def get_locations(self):
+        locations = self.tree.xpath(PROFILE_XPATHS["locations"])
+        if not locations:
+            return [("", self.base_url)]
+        return [(inner_text(elem), self.href(elem)) for elem in locations]
+
+    def get_raw_profile(self):
+        return {
+            "name": self.text(PROFILE_XPATHS["name"]),
+            "speciality": self.text(PROFILE_XPATHS["speciality"]),
+            "is_establishment": self.first(PROFILE_XPATHS["establishment_icon"]) is not None,
+            "address": self.text(PROFILE_XPATHS["address"]),
+            "skills": self.text(PROFILE_XPATHS["skills"]),
+            "languages": self.text(PROFILE_XPATHS["languages"]),
+            "summary": self.text(PROFILE_XPATHS["summary"]),
+            "website": self.href(self.first(PROFILE_XPATHS["website"])),
+            "contact_details": self.text(PROFILE_XPATHS["contact_details"]),
+            "prices": self.texts(PROFILE_XPATHS["prices"]),
+            "history": self.texts(PROFILE_XPATHS["history"]),
+        }
+
+    def get_profile_data(self):
+        return format_profile(self.get_raw_profile())
+
+    def get_raw_location(self):
+        return {
+            "address": self.text(PROFILE_XPATHS["address"]),
+            "contact_details": self.text(PROFILE_XPATHS["contact_details"]),
+            "prices": self.texts(PROFILE_XPATHS["prices"]),
+        }
+
+    def get_location_data(self):
+        return format_location(self.get_raw_location())
+
+    def get_next_page(self):
+        return self.href(self.first(SEARCH_XPATHS["next_page"]))
+
+    def get_page_count(self):
+        numbers = [page_number(self.href(link)) for link in self.tree.xpath(SEARCH_XPATHS["page_links"])]
+        return max(numbers, default=None)
+
+    def get_cards(self, query_input:str, place_input:str, only_href:bool=False):
+        cards = []
+        for card in self.tree.xpath(SEARCH_XPATHS["cards"]):
+            href = self.href(self.first(SEARCH_XPATHS["card_link"], node=card))
+            content = []
+            if not only_href:
+                texts = [inner_text(ele) for ele in card.xpath(SEARCH_XPATHS["card_content"])]
+                content = [text for text in texts if text != ""]
+            cards.append(format_card(href, content, query_input, place_input, only_href))
+        return cards
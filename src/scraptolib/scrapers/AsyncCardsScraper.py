@@ -0,0 +1,109 @@
+import asyncio, json, time
+from pathlib import Path
+
+from scraptolib.scrapers.AsyncScraper import AsyncScraper
+from scraptolib.scrapers.CardsScraper import CardsScraper
+from scraptolib.utils.helpers import store_json_data
+
+class AsyncCardsScraper(AsyncScraper):
+    """
+    Async variant of `CardsScraper`, running several searches concurrently on `browsers` browsers.
+
+    Each browser handles the cookie banner on its first search only.
+
+    Methods
+    -------
+    __init__(driver_path: str, browsers: int = 2, extraction: str = "wait", ...)
+        Same options as `AsyncScraper`, plus the extraction mode of `CardsScraper.run_scraping`.
+
+    search(place_input: str, query_input: str, only_href: bool = False, target_path: str = "results_cards.json", sink: JsonlSink | None = None) -> Dict
+        Runs one search on the first free browser and returns its report
+        (`place`, `query`, `status`, `cards`, `seconds`, `error`, as in `CardsScraper.run_sweep`).
+        Without `sink`, the search writes its own part file, appended to `target_path` once done
+        (one search at a time), so concurrent searches never rewrite the file together.
+
+    run_sweep(pairs: List[Tuple[str, str]], only_href: bool = False, target_path: str = "results_cards.json", sink: JsonlSink | None = None) -> List[Dict]
+        Runs every (place, query) pair concurrently and returns the reports in the order of `pairs`.
+    """
+
+    def __init__(self, driver_path:str, browsers:int=2, extraction:str="wait", frontier=None, rate_limiter=None, metrics=None, driver_profile="default", fetcher=None, driver_pool=None):
+        super().__init__(
+            driver_path=driver_path,
+            browsers=browsers,
+            frontier=frontier,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+            driver_profile=driver_profile,
+            fetcher=fetcher,
+            driver_pool=driver_pool
+        )
+        self.extraction = extraction
+        self._cookies_handled = set()
+        self._store_lock = asyncio.Lock()
+
+    def make_scraper(self):
+        return CardsScraper(
+            driver_path=self.driver_path,
+            frontier=self.frontier,
+            rate_limiter=self.rate_limiter,
+            metrics=self.metrics,
+            driver_profile=self.driver_profile,
+            fetcher=self.fetcher,
+            driver_pool=self.driver_pool
+        )
+
+    def merge_part(self, part_path:str, target_path:str):
+        with open(part_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        store_json_data(data, target_path)
+        Path(part_path).unlink()
+
+    async def search(self, place_input:str, query_input:str, only_href:bool=False, target_path:str="results_cards.json", sink=None):
+        part_path = f"{target_path}.{place_input}.{query_input}.part.json"
+        if sink is None:
+            Path(part_path).unlink(missing_ok=True) # left by an interrupted run
+
+        async with self.lease() as scraper:
+            start = time.perf_counter()
+            error = None
+            try:
+                nb_cards = await self.run_blocking(
+                    scraper.scrape_search,
+                    place_input=place_input,
+                    query_input=query_input,
+                    get_cards=scraper.get_cards_method(self.extraction),
+                    only_href=only_href,
+                    target_path=part_path,
+                    # concurrent searches must not share a checkpoint file
+                    checkpoint_path=f"{target_path}.{place_input}.{query_input}.checkpoint.json",
+                    sink=sink,
+                    handle_cookies=id(scraper) not in self._cookies_handled
+                )
+            except Exception as e:
+                self.lg.error(f"place: {place_input} and query: {query_input} failed: {e!r}")
+                nb_cards = None
+                error = repr(e)
+
+            if nb_cards is not None:
+                self._cookies_handled.add(id(scraper))
+
+            if sink is None and Path(part_path).exists():
+                async with self._store_lock:
+                    await self.run_blocking(self.merge_part, part_path, target_path)
+
+            return {
+                "place": place_input,
+                "query": query_input,
+                "status": "failed" if error else ("no_results" if nb_cards is None else "ok"),
+                "cards": nb_cards or 0,
+                "seconds": round(time.perf_counter() - start, 3),
+                "error": error
+            }
+
+    async def run_sweep(self, pairs:list[tuple[str, str]], only_href:bool=False, target_path:str="results_cards.json", sink=None):
+        return await asyncio.gather(
+            *[
+                self.search(place_input, query_input, only_href=only_href, target_path=target_path, sink=sink)
+                for place_input, query_input in pairs
+            ]
+        )
@@ -0,0 +1,80 @@
+import asyncio
+
+from scraptolib.scrapers.AsyncScraper import AsyncScraper
+from scraptolib.scrapers.ProfileScraper import ProfileScraper
+
+class AsyncProfileScraper(AsyncScraper):
+    """
+    Async variant of `ProfileScraper`, scraping profiles concurrently on `browsers` browsers.
+
+    Methods
+    -------
+    __init__(driver_path: str, browsers: int = 2, extraction: str = "wait", ...)
+        Same options as `AsyncScraper`, plus the extraction mode of `ProfileScraper.run_scraping`.
+
+    scrape(profile_href: str, sink: JsonlSink | None = None) -> List[Dict]
+        Scrapes one profile on the first free browser.
+
+    run_many(hrefs: List[str], sink: JsonlSink | None = None) -> List[Dict]
+        Scrapes every href concurrently and returns the merged records, in the order of `hrefs`.
+        Failed hrefs are logged and collected in `failed`.
+
+    Example
+    -------
+    async with AsyncProfileScraper(driver_path, browsers=4) as scraper:
+        records = await scraper.run_many(hrefs)
+    """
+
+    def __init__(self, driver_path:str, browsers:int=2, extraction:str="wait", frontier=None, rate_limiter=None, metrics=None, driver_profile="default", fetcher=None, driver_pool=None, page_cache=None, as_records:bool=False):
+        super().__init__(
+            driver_path=driver_path,
+            browsers=browsers,
+            frontier=frontier,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+            driver_profile=driver_profile,
+            fetcher=fetcher,
+            driver_pool=driver_pool
+        )
+        self.extraction = extraction
+        self.page_cache = page_cache
+        self.as_records = as_records
+        self.failed = []
+
+    def make_scraper(self):
+        return ProfileScraper(
+            driver_path=self.driver_path,
+            frontier=self.frontier,
+            rate_limiter=self.rate_limiter,
+            metrics=self.metrics,
+            driver_profile=self.driver_profile,
+            fetcher=self.fetcher,
+            driver_pool=self.driver_pool,
+            page_cache=self.page_cache,
+            as_records=self.as_records
+        )
+
+    async def scrape(self, profile_href:str, sink=None):
+        async with self.lease() as scraper:
+            return await self.run_blocking(
+                scraper.run_scraping,
+                profile_href=profile_href,
+                extraction=self.extraction,
+                sink=sink
+            )
+
+    async def run_many(self, hrefs:list[str], sink=None):
+        self.failed = []
+        results = await asyncio.gather(
+            *[self.scrape(href, sink=sink) for href in hrefs],
+            return_exceptions=True
+        )
+
+        output = []
+        for href, records in zip(hrefs, results):
+            if isinstance(records, Exception):
+                self.lg.error(f"Failed on {href}: {records!r}")
+                self.failed.append((href, repr(records)))
+            else:
+                output += records
+        return output
@@ -0,0 +1,112 @@
+import asyncio, functools
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from scraptolib.utils.helpers import init_logger
+from scraptolib.utils.metrics import Metrics
+
+class AsyncScraper(ABC):
+    """
+    Abstract asyncio front for a set of Selenium scrapers, one browser each.
+
+    Selenium only offers a blocking client, so every WebDriver call of a browser runs in that
+    browser's executor thread: `WebDriverWait` polling, `time.sleep` and rate limiter waits block
+    that thread, never the event loop. One event loop can therefore drive all the browsers
+    concurrently with `asyncio.gather`, each coroutine leasing a free browser for its job.
+    A shared `RateLimiter` paces every navigation of every browser; its `acquire_async`
+    is available to coroutines that need to pace themselves.
+
+    Subclasses must implement `make_scraper`.
+
+    Methods
+    -------
+    __init__(driver_path: str, browsers: int = 2, frontier: Frontier | None = None, rate_limiter: RateLimiter | None = None,
+             metrics: Metrics | None = None, driver_profile: str | Dict = "default", fetcher: HttpFetcher | None = None, driver_pool: DriverPool | None = None)
+        Same options as `Scraper`, shared by the `browsers` scrapers.
+
+    start()
+        Starts every browser concurrently. If one fails to start, the others are stopped
+        and its error is raised.
+
+    stop()
+        Stops every browser.
+
+    lease() -> Scraper
+        Async context manager handing out a free scraper, waiting for one if they are all busy.
+
+    run_blocking(func: Callable, *args, **kwargs)
+        Awaits `func(*args, **kwargs)`, run in the executor threads dedicated to the browsers.
+
+    The class is an async context manager: `async with AsyncProfileScraper(...) as scraper:`
+    starts the browsers and stops them on exit.
+    """
+
+    def __init__(self, driver_path:str, browsers:int=2, frontier=None, rate_limiter=None, metrics=None, driver_profile="default", fetcher=None, driver_pool=None):
+        self.lg = init_logger()
+        self.driver_path = driver_path
+        self.browsers = browsers
+        self.frontier = frontier
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.driver_profile = driver_profile
+        self.fetcher = fetcher
+        self.driver_pool = driver_pool
+
+        self.scrapers = []
+        self._free = None
+        self._executor = None
+
+    @abstractmethod
+    def make_scraper(self):
+        pass
+
+    async def start(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.browsers, thread_name_prefix="browser")
+        self._free = asyncio.Queue()
+        self.scrapers = [self.make_scraper() for _ in range(self.browsers)]
+
+        results = await asyncio.gather(
+            *[self.run_blocking(scraper.start_driver) for scraper in self.scrapers],
+            return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            self.lg.error(f"{len(errors)}/{self.browsers} browser(s) failed to start: {errors[0]!r}")
+            started = [scraper for scraper, result in zip(self.scrapers, results) if not isinstance(result, BaseException)]
+            await asyncio.gather(
+                *[self.run_blocking(scraper.stop_driver) for scraper in started],
+                return_exceptions=True
+            )
+            self._executor.shutdown(wait=True)
+            self.scrapers = []
+            raise errors[0]
+
+        for scraper in self.scrapers:
+            self._free.put_nowait(scraper)
+
+    async def stop(self):
+        await asyncio.gather(
+            *[self.run_blocking(scraper.stop_driver) for scraper in self.scrapers]
+        )
+        self._executor.shutdown(wait=True)
+        self.scrapers = []
+
+    @asynccontextmanager
+    async def lease(self):
+        scraper = await self._free.get()
+        try:
+            yield scraper
+        finally:
+            self._free.put_nowait(scraper)
+
+    async def run_blocking(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
@@ -1,11 +1,55 @@
+import os, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException
 
-from scraptolib.utils.helpers import human_delay, store_json_data
+from scraptolib.utils.helpers import store_json_data, save_checkpoint, load_checkpoint, page_number, page_url
+from scraptolib.utils.formatters import format_card
+from scraptolib.utils.records import Card
+from scraptolib.utils.selectors import SEARCH_XPATHS, RETRY_LATER_XPATH
+from scraptolib.utils.sinks import JsonlSink, QueueSink, SinkClosed, read_jsonl
+from scraptolib.utils.metrics import timed
+from scraptolib.parsers.HtmlParser import HtmlParser
 from scraptolib.scrapers.Scraper import Scraper
 
+# Every card of the page in a single round trip, with the text `WebElement.text` would give
+CARDS_EXTRACTION_SCRIPT = """
+const all = (xpath, context) => {
+    const snapshot = document.evaluate(
+        xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    const nodes = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+    return nodes;
+};
+const xpaths = arguments[0];
+const onlyHref = arguments[1];
+
+return all(xpaths.cards, document).map((card) => {
+    const links = all(xpaths.card_link, card);
+    return {
+        href: links.length ? links[0].href : null,
+        content: onlyHref ? [] : all(xpaths.card_content, card)
+            .map((node) => node.innerText.trim())
+            .filter((text) => text !== "")
+    };
+});
+"""
+
+# Hrefs of the numbered pagination links, in one round trip
+PAGE_LINKS_SCRIPT = """
+const snapshot = document.evaluate(
+    arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+);
+const hrefs = [];
+for (let i = 0; i < snapshot.snapshotLength; i++) hrefs.push(snapshot.snapshotItem(i).href);
+return hrefs;
+"""
+
 class CardsScraper(Scraper):
     """
     Scraper designed to extract physician cards from Doctolib search pages (https://www.doctolib.fr/search?location=xxx&speciality=xxx).
@@ -18,14 +62,34 @@ class CardsScraper(Scraper):
 
     Methods
     -------
-    __init__(driver_path: str)
-        Initializes the CardsScraper with the path to the Chrome driver.
+    __init__(driver_path: str, frontier: Frontier | None = None, rate_limiter: RateLimiter | None = None, metrics: Metrics | None = None, driver_profile: str | Dict = "default", fetcher: HttpFetcher | None = None, driver_pool: DriverPool | None = None, as_records: bool = False)
+        Initializes the CardsScraper with the path to the Chrome driver, optional shared `Frontier`, `RateLimiter`, `Metrics`
+        and `HttpFetcher`, the driver profile ("default" or "fast", see `Scraper.start_driver`) and an optional `DriverPool` to lease drivers from.
+        With `as_records`, the cards collected in memory (and streamed to `sink`) are slotted `Card`
+        records instead of dicts; they are written in the usual JSON layout.
     
     look_for_next_page() -> str | None
         Checks for the presence of a "next page" button on the current search page.
+
+    get_page_count() -> int | None
+        Highest page number linked from the pagination of the current search page, None without numbered links.
+
+    find_next_page(current_page: str, parser: HtmlParser | None = None) -> str | None
+        URL of the page after `current_page`, generated from its `page=N` pattern. The last page is
+        recognized as soon as no numbered link goes beyond it, without waiting for a "next" button;
+        pages without numbered links fall back to `look_for_next_page` (or `parser.get_next_page`).
         Returns the URL of the next page if it exists, else returns None.
 
-    run_scraping(place_input: str, query_input: str, only_href: bool = False, target_path: str = "results_cards.json")
+    get_cards(query_input: str, place_input: str, only_href: bool = False) -> List[Dict]
+        Extracts the cards of the current search page through live WebDriver elements.
+
+    get_cards_by_script(query_input: str, place_input: str, only_href: bool = False) -> List[Dict]
+        Extracts every card of the current search page with a single `execute_script` call.
+
+    get_cards_from_html(query_input: str, place_input: str, only_href: bool = False) -> List[Dict]
+        Extracts the cards of the current search page offline with `HtmlParser`, from a single `page_source` fetch.
+
+    run_scraping(place_input: str, query_input: str, only_href: bool = False, target_path: str = "results_cards.json", extraction: str = "wait", sink: JsonlSink | None = None, resume: bool = False, checkpoint_path: str | None = None, start_page: int = 1)
         Starts the scraper and runs the full scraping process for the given location
         (`place_input`) and specialty (`query_input`).
         
@@ -39,6 +103,33 @@ class CardsScraper(Scraper):
             If True, only retrieves the profile URLs without full details (default False).
         target_path : str, optional
             Path to store the resulting JSON file (default "results_cards.json").
+        extraction : str, optional
+            "wait" reads every card through live WebDriver elements (default).
+            "script" reads the whole page in one JavaScript evaluation with `get_cards_by_script`.
+            "html" parses the page source with `get_cards_from_html` (requires lxml).
+        sink : JsonlSink, optional
+            If given, the cards of each page are streamed into it instead of being kept
+            in memory and written to `target_path` at the end.
+        resume : bool, optional
+            If True, continues from the last page completed by a previous, interrupted run
+            of the same search instead of starting from page 1 (default False).
+        checkpoint_path : str, optional
+            Where progress is saved after each page (default "<target_path>.checkpoint.json").
+            Holds the next page URL and the number of cards retrieved. Without `sink`, the cards
+            are appended page by page to "<checkpoint_path>.cards.jsonl", whose size is saved
+            in the checkpoint. Both files are removed once the search completes.
+            With `sink`, the page being scraped when the run stopped may be streamed again on resume.
+        start_page : int, optional
+            Page number to start from, e.g. to split a search between runs (default 1).
+
+        With an `HttpFetcher`, pages after the first are fetched over HTTP and parsed with
+        `HtmlParser`; Selenium loads a page only when the response holds no card.
+
+        The time spent extracting each page's cards is logged and recorded in `metrics` under
+        `page_extraction`, to compare the extraction modes.
+
+        With a `Frontier`, every profile URL found is registered in it as pending,
+        so `ProfileScraper` fetches each practitioner once across overlapping searches.
         
         Returns
         -------
@@ -46,115 +137,458 @@ class CardsScraper(Scraper):
             If no results are found for the query.
         Stores
         -------
-        JSON file at `target_path` containing a list of dictionaries with either:
+        JSON file at `target_path` (or records in `sink`) containing a list of dictionaries with either:
         - Only URLs (`Page_doctolib`, `Nom_Recherche`, `Lieu_Recherche`) if `only_href=True`
         - Full physician data (`Pratiquant`, `Intitulé`, `Adresse`, `Ville`, `Page_doctolib`, `Nom_Recherche`, `Lieu_Recherche`) otherwise
+
+    run_sweep(pairs: List[Tuple[str, str]], only_href: bool = False, target_path: str = "results_cards.json", extraction: str = "wait", sink: JsonlSink | None = None, on_pair: Callable | None = None) -> List[Dict]
+        Runs `scrape_search` for every (place, query) pair with a single warm driver:
+        the browser is started once and the cookie banner handled once for the whole sweep.
+        Results are stored after each pair (or streamed into `sink`). When a pair fails with the
+        browser session gone (crash, `InvalidSessionIdException`), the driver is restarted
+        before the next pair.
+
+        Returns
+        -------
+        List[Dict]
+            One report per pair: `place`, `query`, `status` ("ok", "no_results" or "failed"),
+            `cards` (number retrieved), `seconds` (wall time) and `error`.
+            `on_pair` is called with each report as soon as the pair is done.
+
+    iter_cards(place_input: str, query_input: str, only_href: bool = False, extraction: str = "wait", max_pending: int = 100, start_page: int = 1) -> Iterator[Dict | Card]
+        Generator version of `run_scraping`: the search is scraped in a background thread and
+        each page's cards are yielded as soon as they are extracted. At most `max_pending` cards
+        wait to be consumed; the scraper pauses when the consumer falls behind. Closing the
+        generator early stops the scraping and the driver.
+        No checkpoint is written: pages are extracted ahead of the consumer, so only the consumer
+        knows what was really processed. Restart an interrupted stream with `start_page`.
+
+    fetch_pages(place_input: str, query_input: str, pages: Iterable[int] | None = None, workers: int = 4, only_href: bool = False, target_path: str = "results_cards.json", sink: JsonlSink | None = None) -> Dict
+        Fetches search pages concurrently over HTTP, without a browser (requires an `HttpFetcher`).
+        By default the page count is read from the first page and every other page is fetched by
+        `workers` threads; `pages` restricts the run to given page numbers, in any order.
+        Cards are stored in page order, as with `run_scraping`.
+
+        Returns
+        -------
+        Dict
+            `pages` fetched, `cards` retrieved and `missing`: the page numbers whose response held
+            no card (e.g. "Retry later"), to pass again as `pages`.
+
+    scrape_search(place_input: str, query_input: str, get_cards: Callable, ..., handle_cookies: bool = True, start_page: int = 1, checkpoint: bool = True) -> int | None
+        Pagination loop of `run_scraping` on an already started driver.
+        With `checkpoint=False`, progress is neither saved nor resumed.
+        Returns the number of cards retrieved, None if the search returned no results.
     """
 
-    def __init__(self, driver_path:str):
+    def __init__(self, driver_path:str, frontier=None, rate_limiter=None, metrics=None, driver_profile="default", fetcher=None, driver_pool=None, as_records:bool=False):
         super().__init__(
-            driver_path=driver_path
+            driver_path=driver_path,
+            frontier=frontier,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+            driver_profile=driver_profile,
+            fetcher=fetcher,
+            driver_pool=driver_pool
         )
+        self.as_records = as_records
 
+    @timed("look_for_next_page")
     def look_for_next_page(self):
         try:
             next_page_btn = WebDriverWait(self.driver, 15.0).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, '//a[@rel="next"]')
+                    (By.XPATH, SEARCH_XPATHS["next_page"])
                 )
             )
             next_page_href = next_page_btn.get_attribute("href")
 
         except TimeoutException:
+            self.metrics.incr("timeouts", "look_for_next_page")
             self.lg.info("Next page button not found")
             next_page_href = None
 
         return next_page_href
-        
-    def run_scraping(self, place_input:str, query_input:str, only_href:bool=False, target_path:str="results_cards.json"):
+
+    def get_page_count(self):
+        hrefs = self.driver.execute_script(PAGE_LINKS_SCRIPT, SEARCH_XPATHS["page_links"])
+        return max((page_number(href) for href in hrefs if href), default=None)
+
+    def find_next_page(self, current_page:str, parser=None):
+        if parser is not None:
+            last_page = parser.get_page_count()
+        else:
+            self.wait_until_ready([SEARCH_XPATHS["page_links"], RETRY_LATER_XPATH])
+            last_page = self.get_page_count()
+
+        if last_page is None:
+            return parser.get_next_page() if parser is not None else self.look_for_next_page()
+
+        number = page_number(current_page)
+        if number >= last_page:
+            self.lg.info(f"Last page reached ({number})")
+            return None
+        return page_url(current_page, number + 1)
+
+    @timed("get_cards")
+    def get_cards(self, query_input:str, place_input:str, only_href:bool=False):
+        cards = self.driver.find_elements(By.XPATH, SEARCH_XPATHS["cards"])
+
+        output = []
+        for card in cards:
+            # physician's page link
+            href = card.find_elements(By.XPATH, SEARCH_XPATHS["card_link"])[0].get_attribute("href")
+
+            content = []
+            if not only_href:
+                # physician's data
+                elements = card.find_elements(By.XPATH, SEARCH_XPATHS["card_content"])
+                content = [ele.text.strip() for ele in elements if ele.text.strip() != ""]
+
+            output.append(format_card(href, content, query_input, place_input, only_href))
+        return output
+
+    @timed("get_cards_by_script")
+    def get_cards_by_script(self, query_input:str, place_input:str, only_href:bool=False):
+        cards = self.driver.execute_script(CARDS_EXTRACTION_SCRIPT, SEARCH_XPATHS, only_href)
+        return [
+            format_card(card["href"], card["content"], query_input, place_input, only_href)
+            for card in cards
+        ]
+
+    @timed("get_cards_from_html")
+    def get_cards_from_html(self, query_input:str, place_input:str, only_href:bool=False):
+        parser = HtmlParser.from_driver(self.driver)
+        return parser.get_cards(query_input, place_input, only_href)
+
+    def get_cards_method(self, extraction:str):
+        if extraction == "wait":
+            return self.get_cards
+        elif extraction == "script":
+            return self.get_cards_by_script
+        elif extraction == "html":
+            return self.get_cards_from_html
+        raise ValueError(f"Unknown extraction mode: {extraction}")
+
+    def run_scraping(self, place_input:str, query_input:str, only_href:bool=False, target_path:str="results_cards.json", extraction:str="wait", sink=None, resume:bool=False, checkpoint_path:str|None=None, start_page:int=1):
+        get_cards = self.get_cards_method(extraction)
+
         self.start_driver()
-        
-        retrieved_data = []
+        try:
+            nb_cards = self.scrape_search(
+                place_input=place_input,
+                query_input=query_input,
+                get_cards=get_cards,
+                only_href=only_href,
+                target_path=target_path,
+                sink=sink,
+                resume=resume,
+                checkpoint_path=checkpoint_path,
+                start_page=start_page
+            )
+        finally:
+            self.stop_driver()
+
+        if nb_cards is not None:
+            self.lg.info("Successful job.")
+
+    def iter_cards(self, place_input:str, query_input:str, only_href:bool=False, extraction:str="wait", max_pending:int=100, start_page:int=1):
+        get_cards = self.get_cards_method(extraction)
+        stream = QueueSink(max_pending)
+
+        def produce():
+            error = None
+            try:
+                self.start_driver()
+                self.scrape_search(
+                    place_input=place_input,
+                    query_input=query_input,
+                    get_cards=get_cards,
+                    only_href=only_href,
+                    sink=stream,
+                    start_page=start_page,
+                    checkpoint=False
+                )
+            except SinkClosed:
+                self.lg.info("Cards stream closed by the consumer")
+            except Exception as e:
+                error = e
+            finally:
+                self.stop_driver()
+                stream.close(error)
+
+        producer = threading.Thread(target=produce, name="cards-producer", daemon=True)
+        producer.start()
+        try:
+            yield from stream
+        finally:
+            stream.cancel()
+            producer.join()
+
+    def run_sweep(self, pairs:list[tuple[str, str]], only_href:bool=False, target_path:str="results_cards.json", extraction:str="wait", sink=None, on_pair=None):
+        get_cards = self.get_cards_method(extraction)
+
+        self.start_driver()
+
+        reports = []
+        cookies_handled = False
+        try:
+            for place_input, query_input in pairs:
+                start = time.perf_counter()
+                error = None
+                try:
+                    nb_cards = self.scrape_search(
+                        place_input=place_input,
+                        query_input=query_input,
+                        get_cards=get_cards,
+                        only_href=only_href,
+                        target_path=target_path,
+                        sink=sink,
+                        handle_cookies=not cookies_handled
+                    )
+                except Exception as e:
+                    self.lg.error(f"place: {place_input} and query: {query_input} failed: {e!r}")
+                    nb_cards = None
+                    error = repr(e)
+
+                    if not self.is_driver_alive():
+                        self.lg.warning("Browser session lost, restarting the driver")
+                        self.metrics.incr("driver_restarts")
+                        self.stop_driver()
+                        self.start_driver()
+                        cookies_handled = False
+
+                if nb_cards is not None:
+                    cookies_handled = True
+
+                report = {
+                    "place": place_input,
+                    "query": query_input,
+                    "status": "failed" if error else ("no_results" if nb_cards is None else "ok"),
+                    "cards": nb_cards or 0,
+                    "seconds": round(time.perf_counter() - start, 3),
+                    "error": error
+                }
+                self.lg.info(f"Sweep {len(reports)+1}/{len(pairs)} -- {report['place']} x {report['query']}: {report['cards']} card(s) in {report['seconds']}s")
+                reports.append(report)
+
+                if on_pair is not None:
+                    on_pair(report)
+        finally:
+            self.stop_driver()
+        return reports
+
+    def fetch_pages(self, place_input:str, query_input:str, pages=None, workers:int=4, only_href:bool=False, target_path:str="results_cards.json", sink=None):
+        if self.fetcher is None:
+            raise ValueError("fetch_pages requires an HttpFetcher (fetcher=...)")
+
         query_input = query_input.lower().replace(" ", "-")
         place_input = place_input.lower().replace(" ", "-")
+        page_link = f"{self.base_url}/search?location={place_input}&speciality={query_input}"
+
+        def fetch(page:int):
+            self.pace()
+            return page, self.fetch_parser(page_url(page_link, page), [SEARCH_XPATHS["cards"]])
+
+        # without explicit pages, the count is read from page 1, then from every batch
+        # (the pagination may only link a window of pages around the current one)
+        discover = pages is None
+        todo = [1] if discover else sorted(set(pages))
+        requested = set(todo)
+
+        retrieved_data = []
+        seen_hrefs = set()
+        missing = []
+        nb_pages = nb_cards = 0
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while todo:
+                last_page = 0
+                for page, parser in executor.map(fetch, todo):
+                    if parser is None:
+                        missing.append(page)
+                        continue
+                    nb_pages += 1
 
-        page_link = f"https://www.doctolib.fr/search?location={place_input}&speciality={query_input}"
+                    start = time.perf_counter()
+                    cards = parser.get_cards(query_input, place_input, only_href)
+                    self.metrics.record("page_extraction", time.perf_counter() - start)
+                    last_page = max(last_page, parser.get_page_count() or page)
 
-        self.lg.info(page_link)
+                    page_cards = [
+                        card for card in cards
+                        if card["Page_doctolib"] not in seen_hrefs
+                    ]
+                    seen_hrefs.update(card["Page_doctolib"] for card in page_cards)
 
-        self.driver.get(page_link)
+                    if self.frontier is not None:
+                        self.frontier.add([card["Page_doctolib"] for card in page_cards])
+                    nb_cards += len(page_cards)
+                    if self.as_records:
+                        page_cards = [Card.from_dict(card) for card in page_cards]
 
-        if self.driver.current_url == "https://www.doctolib.fr/":
-            self.lg.warning(
-                f"place: {place_input} and query: {query_input} didn't return any results."
+                    if sink is None:
+                        retrieved_data += page_cards
+                    else:
+                        sink.write_many(page_cards)
+                        sink.flush()
+                    self.on_page_success()
+
+                todo = []
+                if discover:
+                    todo = [page for page in range(1, last_page + 1) if page not in requested]
+                    requested.update(todo)
+                    if todo:
+                        self.lg.info(f"{last_page} page(s) found -- fetching {len(todo)} more with {workers} worker(s)")
+
+        if sink is None:
+            store_json_data(
+                data=retrieved_data,
+                target_path=target_path
             )
-            return None
 
-        human_delay()
+        missing.sort()
+        if missing:
+            self.lg.warning(f"No cards in the response of page(s) {missing}, fetch them again with pages={missing}")
+        self.lg.info(f"{nb_pages} page(s) fetched -- {nb_cards} profile(s) retrieved")
+        return {"pages": nb_pages, "cards": nb_cards, "missing": missing}
 
-        self.handle_cookies()
+    def scrape_search(self, place_input:str, query_input:str, get_cards, only_href:bool=False, target_path:str="results_cards.json", sink=None, resume:bool=False, checkpoint_path:str|None=None, handle_cookies:bool=True, start_page:int=1, checkpoint:bool=True):
+        retrieved_data = []
+        seen_hrefs = set()
+        nb_cards = 0
+        query_input = query_input.lower().replace(" ", "-")
+        place_input = place_input.lower().replace(" ", "-")
 
-        current_page = page_link
+        page_link = f"{self.base_url}/search?location={place_input}&speciality={query_input}"
+        save_progress = checkpoint
+        checkpoint_path = checkpoint_path or f"{target_path}.checkpoint.json"
+        # without a sink, cards are kept on disk page by page so a resumed run gets them back
+        cards_path = f"{checkpoint_path}.cards.jsonl"
 
-        while True:
-            next_page_href = self.look_for_next_page()
-            
-            if (next_page_href is None) and (self.is_retry_later()):
-                self.handle_retry_later(current_page)
-                next_page_href = self.look_for_next_page()
+        checkpoint = load_checkpoint(checkpoint_path) if (resume and save_progress) else None
+        if checkpoint and (checkpoint["page_link"] != page_link or checkpoint["only_href"] != only_href):
+            self.lg.warning(f"Checkpoint {checkpoint_path} belongs to another search, starting from page 1")
+            checkpoint = None
 
-            try:
-                """Fetching CARDS"""
-                cards = self.driver.find_elements(By.CSS_SELECTOR, "div.dl-card-variant-default")
-
-                for card in cards:
-                    # physician's page link
-                    href = card.find_elements(By.TAG_NAME, "a")[0].get_attribute("href")
-
-                    if only_href:
-                        retrieved_data.append(
-                            {
-                                "Page_doctolib":href.split('&')[0],
-                                "Nom_Recherche":query_input,
-                                "Lieu_Recherche":place_input
-                            }
-                        )
-                    else:
-                        # physician's data
-                        elements = card.find_elements(By.CSS_SELECTOR, "div.p-16 h2, div.p-16 p")
-                        content = [ele.text.strip() for ele in elements if ele.text.strip() != ""]
-
-                        retrieved_data.append(
-                            {
-                                "Pratiquant":content[0],
-                                "Intitulé":content[1],
-                                "Adresse":content[2],
-                                "Ville":content[3],
-                                "Page_doctolib":href.split('&')[0],
-                                "Nom_Recherche":query_input,
-                                "Lieu_Recherche":place_input
-                            }
-                        )
+        if checkpoint:
+            nb_cards = checkpoint["cards"]
+            if sink is None and "cards_offset" in checkpoint:
+                # drop the cards of a page whose checkpoint was not saved
+                os.truncate(cards_path, checkpoint["cards_offset"])
+                retrieved_data = list(read_jsonl(cards_path))
+                seen_hrefs = {card["Page_doctolib"] for card in retrieved_data}
+                if self.as_records:
+                    retrieved_data = [Card.from_dict(card) for card in retrieved_data]
+            current_page = checkpoint["next_page_href"]
+            self.lg.info(f"Resuming after {checkpoint['pages_done']} page(s) -- {nb_cards} cards already scraped")
+        else:
+            current_page = page_url(page_link, start_page) if start_page > 1 else page_link
+            checkpoint = {
+                "page_link": page_link,
+                "only_href": only_href,
+                "pages_done": 0
+            }
 
-            except Exception as e:
-                raise e
+        self.lg.info(current_page or page_link)
+
+        if current_page is not None:
+            self.navigate(current_page)
 
-            if not next_page_href:
-                store_json_data(
-                    data=retrieved_data,
-                    target_path=target_path
+            if self.driver.current_url == f"{self.base_url}/":
+                self.lg.warning(
+                    f"place: {place_input} and query: {query_input} didn't return any results."
                 )
-                self.lg.info(f"{len(retrieved_data)} profile(s) retrieved")
-                self.stop_driver()
-                self.lg.info("Successful job.")
-                break
-            else:
-                human_delay(alpha=20)
+                return None
+
+            self.pace()
+
+            if handle_cookies:
+                self.handle_cookies()
+
+        parser = None # set when the current page was fetched over HTTP
+        cards_log = None
+        if save_progress and sink is None:
+            cards_log = JsonlSink(cards_path, append="cards_offset" in checkpoint)
+        try:
+            while current_page is not None:
+                next_page_href = self.find_next_page(current_page, parser)
+                if (parser is None) and (next_page_href is None) and (self.is_retry_later()):
+                    self.handle_retry_later(current_page)
+                    next_page_href = self.find_next_page(current_page)
+
+                try:
+                    """Fetching CARDS"""
+                    start = time.perf_counter()
+                    if parser is not None:
+                        cards = parser.get_cards(query_input, place_input, only_href)
+                    else:
+                        cards = get_cards(query_input, place_input, only_href)
+                    elapsed = time.perf_counter() - start
+                    self.metrics.record("page_extraction", elapsed)
+                    self.lg.info(f"{len(cards)} card(s) extracted in {elapsed:.3f}s")
+
+                    page_cards = [
+                        card for card in cards
+                        if card["Page_doctolib"] not in seen_hrefs
+                    ]
+                    seen_hrefs.update(card["Page_doctolib"] for card in page_cards)
+
+                    if self.frontier is not None:
+                        self.frontier.add([card["Page_doctolib"] for card in page_cards])
+                    nb_cards += len(page_cards)
+                    if self.as_records:
+                        page_cards = [Card.from_dict(card) for card in page_cards]
+
+                    if sink is None:
+                        retrieved_data += page_cards
+                    else:
+                        sink.write_many(page_cards)
+                        sink.flush()
+
+                except Exception as e:
+                    raise e
+
+                if save_progress:
+                    checkpoint.update(
+                        {
+                            "pages_done": checkpoint["pages_done"] + 1,
+                            "next_page_href": next_page_href,
+                            "cards": nb_cards
+                        }
+                    )
+                    if cards_log is not None:
+                        cards_log.write_many(page_cards)
+                        cards_log.flush()
+                        checkpoint["cards_offset"] = os.path.getsize(cards_path)
+                    save_checkpoint(checkpoint, checkpoint_path)
+                self.on_page_success()
+
+                if next_page_href:
+                    self.pace(alpha=20)
+
+                    parser = self.fetch_parser(next_page_href, [SEARCH_XPATHS["cards"]])
+                    if parser is None:
+                        self.navigate(next_page_href)
+                    current_page_nb = page_number(next_page_href)
+                    self.lg.info(f"Scraping page {current_page_nb} -- {nb_cards} cards scraped")
 
-                self.driver.get(next_page_href)
                 current_page = next_page_href
-                current_page_nb = current_page.split("page=")[-1]
-                self.lg.info(f"Scraping page {current_page_nb} -- {(int(current_page_nb)-1)*20} cards scraped")
+        finally:
+            if cards_log is not None:
+                cards_log.close()
+
+        if sink is None:
+            store_json_data(
+                data=retrieved_data,
+                target_path=target_path
+            )
+        if save_progress:
+            Path(checkpoint_path).unlink(missing_ok=True)
+            Path(cards_path).unlink(missing_ok=True)
+
+        self.lg.info(f"{nb_cards} profile(s) retrieved")
+        return nb_cards
 
 if __name__ == '__main__':
     print("test")
\ No newline at end of file
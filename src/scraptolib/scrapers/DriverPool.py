@@ -0,0 +1,251 @@
+import queue, threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
+
+from scraptolib.utils.helpers import init_logger
+from scraptolib.utils.metrics import Metrics
+from scraptolib.utils.selectors import COOKIES_REFUSE_XPATH
+from scraptolib.scrapers.Scraper import Scraper, build_driver
+
+HEAP_SIZE_SCRIPT = "return performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+class DriverPool:
+    """
+    Pool of pre-launched, warm Chrome drivers leased to scrapers.
+
+    Browsers are started once, ahead of the jobs, and warmed on `warm_url`: the cookie banner
+    is refused there, so the consent cookie is already set when a scraper gets the driver.
+    A scraper given the pool leases a driver in `start_driver` and hands it back in
+    `stop_driver` instead of launching and quitting Chrome. Drivers are health-checked when
+    leased and recycled (quit and replaced by a fresh warm one) after `max_pages` pages or
+    when the page's JavaScript heap exceeds `max_heap_mb`. A replacement that fails to launch
+    `launch_attempts` times leaves an empty slot, relaunched by a later `acquire` once no idle
+    driver is left. The pool is thread-safe.
+
+    Methods
+    -------
+    __init__(driver_path: str, size: int = 2, driver_profile: str | Dict = "default", warm_url: str | None = Scraper.base_url,
+             max_pages: int | None = 200, max_heap_mb: float | None = 512, metrics: Metrics | None = None, launch_attempts: int = 3)
+        `size` drivers are launched by `start`. None disables the warm-up or a recycling limit.
+
+    start()
+        Launches and warms every driver concurrently.
+
+    acquire(timeout: float | None = None) -> WebDriver
+        Leases a healthy driver, waiting for one if they are all leased.
+        Raises RuntimeError if no driver can be launched to fill an empty slot.
+
+    release(driver, pages: int = 0)
+        Hands a driver back after `pages` page loads, recycling it if it reached its limits.
+
+    lease(timeout: float | None = None)
+        Context manager around `acquire`/`release`.
+
+    is_warm(driver) -> bool
+        True if the driver's cookie banner was already handled by the pool.
+
+    mark_cold(driver)
+        Forgets that the driver is warm, e.g. once its cookies were cleared: scrapers handle the banner again.
+
+    stats() -> Dict
+        Drivers launched, recycled, idle and leased, and empty slots.
+
+    close()
+        Quits every driver, the leased ones included. The pool is also a context manager.
+    """
+
+    def __init__(self, driver_path:str, size:int=2, driver_profile="default", warm_url:str|None=Scraper.base_url, max_pages:int|None=200, max_heap_mb:float|None=512, metrics=None, launch_attempts:int=3):
+        self.lg = init_logger()
+        self.driver_path = driver_path
+        self.size = size
+        self.driver_profile = driver_profile
+        self.warm_url = warm_url
+        self.max_pages = max_pages
+        self.max_heap_mb = max_heap_mb
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.launch_attempts = launch_attempts
+
+        self.launched = 0
+        self.recycled = 0
+
+        self._drivers = {}
+        self._empty_slots = 0
+        self._idle = queue.Queue()
+        self._pages = {}
+        self._warm = set()
+        self._leased = set()
+        self._lock = threading.Lock()
+
+    def launch(self):
+        with self.metrics.timer("driver_start"):
+            driver = build_driver(self.driver_path, self.driver_profile)
+
+        warm = False
+        if self.warm_url is not None:
+            with self.metrics.timer("driver_warm_up"):
+                warm = self.warm_up(driver)
+
+        with self._lock:
+            self.launched += 1
+            self._drivers[id(driver)] = driver
+            self._pages[id(driver)] = 0
+            if warm:
+                self._warm.add(id(driver))
+        return driver
+
+    def warm_up(self, driver):
+        try:
+            driver.get(self.warm_url)
+            WebDriverWait(driver, 5).until(
+                EC.element_to_be_clickable((By.XPATH, COOKIES_REFUSE_XPATH))
+            ).click()
+        except TimeoutException:
+            self.lg.info("No cookies banner while warming the driver up")
+        except Exception as e:
+            self.lg.warning(f"Driver warm-up failed: {e!r}")
+            return False
+        return True
+
+    def start(self):
+        try:
+            with ThreadPoolExecutor(max_workers=self.size) as executor:
+                for driver in executor.map(lambda _: self.launch(), range(self.size)):
+                    self._idle.put(driver)
+        except Exception:
+            self.close()
+            raise
+        self.lg.info(f"Driver pool ready -- {self.size} driver(s)")
+
+    def is_healthy(self, driver):
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def needs_recycling(self, driver):
+        if self.max_pages is not None and self._pages.get(id(driver), 0) >= self.max_pages:
+            return True
+
+        if self.max_heap_mb is not None:
+            try:
+                heap = driver.execute_script(HEAP_SIZE_SCRIPT)
+            except Exception:
+                return True
+            if heap is not None and heap / 1e6 > self.max_heap_mb:
+                return True
+        return False
+
+    def discard(self, driver):
+        with self._lock:
+            self._drivers.pop(id(driver), None)
+            self._pages.pop(id(driver), None)
+            self._warm.discard(id(driver))
+            self._leased.discard(id(driver))
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def recycle(self, driver, reason:str):
+        self.lg.info(f"Recycling a driver ({reason})")
+        self.metrics.incr("driver_recycled", reason)
+        with self._lock:
+            self.recycled += 1
+        self.discard(driver)
+        return self.replace()
+
+    def replace(self):
+        for attempt in range(1, self.launch_attempts + 1):
+            try:
+                return self.launch()
+            except Exception as e:
+                self.metrics.incr("driver_launch_failed")
+                self.lg.warning(f"Driver launch failed (attempt {attempt}/{self.launch_attempts}): {e!r}")
+
+        with self._lock:
+            self._empty_slots += 1
+        self.lg.error("Could not replace a driver, its slot stays empty until the next acquire")
+        return None
+
+    def next_driver(self, timeout:float|None=None):
+        with self._lock:
+            relaunch = self._empty_slots > 0 and self._idle.empty()
+            if relaunch:
+                self._empty_slots -= 1
+        if not relaunch:
+            return self._idle.get(timeout=timeout)
+        return self.replace()
+
+    def acquire(self, timeout:float|None=None):
+        with self.metrics.timer("driver_lease"):
+            driver = self.next_driver(timeout)
+            if driver is not None and not self.is_healthy(driver):
+                driver = self.recycle(driver, "unhealthy")
+        if driver is None:
+            raise RuntimeError("No driver available: the pool could not launch a replacement")
+
+        with self._lock:
+            self._leased.add(id(driver))
+        return driver
+
+    def release(self, driver, pages:int=0):
+        with self._lock:
+            self._leased.discard(id(driver))
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + pages
+
+        if not self.is_healthy(driver):
+            driver = self.recycle(driver, "unhealthy")
+        elif self.needs_recycling(driver):
+            driver = self.recycle(driver, "limits")
+        if driver is not None:
+            self._idle.put(driver)
+
+    @contextmanager
+    def lease(self, timeout:float|None=None):
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def is_warm(self, driver):
+        return id(driver) in self._warm
+
+    def mark_cold(self, driver):
+        with self._lock:
+            self._warm.discard(id(driver))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": self.size,
+                "launched": self.launched,
+                "recycled": self.recycled,
+                "idle": self._idle.qsize(),
+                "leased": len(self._leased),
+                "empty_slots": self._empty_slots
+            }
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+        with self._lock:
+            drivers = list(self._drivers.values())
+        for driver in drivers:
+            self.discard(driver)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
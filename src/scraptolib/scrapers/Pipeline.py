@@ -0,0 +1,94 @@
+import time
+
+from scraptolib.utils.helpers import init_logger
+from scraptolib.scrapers.CardsScraper import CardsScraper
+from scraptolib.scrapers.ProfilePool import ProfilePool
+
+class Pipeline:
+    """
+    Streams search cards straight into profile scraping.
+
+    The `CardsScraper` paginates the search in its own thread while the `ProfilePool` workers
+    already scrape the profiles of the first pages: each page's hrefs go through a bounded queue
+    to the workers instead of waiting for the whole search to be written to JSON. Queues are
+    bounded on both sides (`max_pending`), so memory stays flat whatever the number of pages:
+    the search pauses when the workers fall behind, and the workers pause when the consumer does.
+
+    Methods
+    -------
+    __init__(cards_scraper: CardsScraper, profile_pool: ProfilePool, cards_extraction: str = "wait", max_pending: int = 50)
+        Profiles are scraped with the pool's own workers and extraction mode,
+        cards with `cards_extraction` (see `CardsScraper.run_scraping`).
+
+    iter_profiles(place_input: str, query_input: str) -> Iterator[Tuple[str, List[Dict]]]
+        Yields `(href, records)` for every profile of the search, as soon as it is scraped.
+        Closing the generator early stops both the search and the workers.
+        The search is not checkpointed (see `CardsScraper.iter_cards`).
+
+    run(place_input: str, query_input: str, sink: JsonlSink | None = None, on_result: Callable | None = None) -> Dict
+        Runs the whole pipeline, streaming records into `sink` and/or `on_result(href, records)`.
+
+        Returns
+        -------
+        Dict
+            `profiles` and `records` scraped, `failed` profiles, `seconds` (wall time)
+            and `first_profile_seconds` (time until the first profile was scraped).
+    """
+
+    def __init__(self, cards_scraper:CardsScraper, profile_pool:ProfilePool, cards_extraction:str="wait", max_pending:int=50):
+        self.lg = init_logger()
+        self.cards_scraper = cards_scraper
+        self.profile_pool = profile_pool
+        self.cards_extraction = cards_extraction
+        self.max_pending = max_pending
+
+    def iter_hrefs(self, place_input:str, query_input:str):
+        cards = self.cards_scraper.iter_cards(
+            place_input=place_input,
+            query_input=query_input,
+            only_href=True,
+            extraction=self.cards_extraction,
+            max_pending=self.max_pending
+        )
+        try:
+            for card in cards:
+                yield card["Page_doctolib"] if isinstance(card, dict) else card.page
+        finally:
+            cards.close()
+
+    def iter_profiles(self, place_input:str, query_input:str):
+        return self.profile_pool.iter_profiles(
+            self.iter_hrefs(place_input, query_input),
+            max_pending=self.max_pending
+        )
+
+    def run(self, place_input:str, query_input:str, sink=None, on_result=None):
+        start = time.perf_counter()
+        first_profile_seconds = None
+        profiles = records_count = 0
+
+        for href, records in self.iter_profiles(place_input, query_input):
+            if first_profile_seconds is None:
+                first_profile_seconds = time.perf_counter() - start
+                self.profile_pool.metrics.record("time_to_first_profile", first_profile_seconds)
+                self.lg.info(f"First profile scraped after {first_profile_seconds:.1f}s")
+
+            profiles += 1
+            records_count += len(records)
+            if sink is not None:
+                sink.write_many(records)
+            if on_result is not None:
+                on_result(href, records)
+
+        if sink is not None:
+            sink.flush()
+
+        report = {
+            "profiles": profiles,
+            "records": records_count,
+            "failed": len(self.profile_pool.failed),
+            "seconds": round(time.perf_counter() - start, 3),
+            "first_profile_seconds": None if first_profile_seconds is None else round(first_profile_seconds, 3)
+        }
+        self.lg.info(f"Pipeline done -- {profiles} profile(s), {records_count} record(s), {report['failed']} failed in {report['seconds']}s")
+        return report
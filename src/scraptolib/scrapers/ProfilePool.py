@@ -0,0 +1,386 @@
+import queue, threading, time
+
+from scraptolib.utils.helpers import init_logger
+from scraptolib.utils.metrics import Metrics
+from scraptolib.utils.sinks import QueueSink, SinkClosed
+from scraptolib.utils.taskqueue import default_worker_id
+from scraptolib.scrapers.ProfileScraper import ProfileScraper
+
+class ProfilePool:
+    """
+    Runs several `ProfileScraper` instances in parallel, each one driving its own Chrome.
+
+    Hrefs are handed out from a shared queue, so a worker stuck in `handle_retry_later`
+    (each worker has its own backoff loop) doesn't stall the others.
+
+    Methods
+    -------
+    __init__(driver_path: str, workers: int = 2, extraction: str = "wait", frontier: Frontier | None = None, rate_limiter: RateLimiter | None = None, metrics: Metrics | None = None, driver_profile: str | Dict = "default", fetcher: HttpFetcher | None = None, driver_pool: DriverPool | None = None, page_cache: PageCache | None = None, as_records: bool = False)
+        Initializes the pool with the path to the Chrome driver, the number of drivers
+        and the extraction mode passed to `ProfileScraper.run_scraping`.
+        A `Frontier` is shared by all workers, so each URL is fetched once.
+        A `RateLimiter` is shared too, keeping the whole pool under one request budget;
+        each worker still runs its own "Retry later" backoff.
+        All workers record their timings in the pool's `metrics`, start their driver with `driver_profile`
+        and share the `fetcher` and `page_cache`; `as_records` makes them return `Profile` records.
+        With a `DriverPool`, workers lease warm drivers from it instead of launching their own.
+
+    run_many(hrefs: List[str], workers: int | None = None, on_result: Callable | None = None, sink: JsonlSink | None = None) -> List[Dict]
+        Scrapes every href and returns the merged records, in the order of `hrefs`.
+
+        Parameters
+        ----------
+        hrefs : List[str]
+            URLs of the practitioners' profile pages.
+        workers : int, optional
+            Overrides the number of drivers given at init.
+        on_result : Callable, optional
+            Called with `(href, records)` as soon as a profile is scraped (calls are serialized).
+        sink : JsonlSink, optional
+            If given, records are streamed into it as they are produced and not kept in memory:
+            the returned list is then empty.
+
+    iter_profiles(hrefs: Iterable[str], workers: int | None = None, max_pending: int | None = None) -> Iterator[Tuple[str, List[Dict]]]
+        Streaming version of `run_many`: yields `(href, records)` as profiles are scraped (in completion order).
+        `hrefs` is consumed lazily, so it can be a generator still being produced, e.g. hrefs from
+        `CardsScraper.iter_cards`. At most `max_pending` hrefs (2 per worker by default) wait for a
+        worker and `max_pending` results wait for the consumer, which holds back both sides when one is slower.
+
+    run_queue(task_queue: TaskQueue | RedisTaskQueue, workers: int | None = None, sink: JsonlSink | None = None, on_result: Callable | None = None,
+              idle_timeout: float = 60, poll_interval: float = 2) -> Dict
+        Worker mode of a distributed crawl: every worker claims tasks from `task_queue`, scrapes them,
+        then acks them (or nacks them if scraping raised, so they are retried). Leases are renewed while
+        a task runs; a worker that lost its lease drops its records. Records go to `sink`
+        and/or `on_result`. Workers stop once the queue has been empty for `idle_timeout` seconds.
+        Returns the number of tasks done and records produced.
+
+    A worker whose driver fails to start stops; the others go on. If no driver starts, `run_many`
+    records every href in `failed` with the startup error, while `iter_profiles` and `run_queue` raise it.
+
+    Attributes
+    ----------
+    failed : List[Tuple[str, str]]
+        Hrefs whose scraping raised, with the error, for the last `run_many` or `run_queue` call.
+    """
+
+    def __init__(self, driver_path:str, workers:int=2, extraction:str="wait", frontier=None, rate_limiter=None, metrics=None, driver_profile="default", fetcher=None, driver_pool=None, page_cache=None, as_records:bool=False):
+        self.lg = init_logger()
+        self.driver_path = driver_path
+        self.workers = workers
+        self.extraction = extraction
+        self.frontier = frontier
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.driver_profile = driver_profile
+        self.fetcher = fetcher
+        self.driver_pool = driver_pool
+        self.page_cache = page_cache
+        self.as_records = as_records
+        self.failed = []
+
+    def make_scraper(self):
+        return ProfileScraper(
+            driver_path=self.driver_path,
+            frontier=self.frontier,
+            rate_limiter=self.rate_limiter,
+            metrics=self.metrics,
+            driver_profile=self.driver_profile,
+            fetcher=self.fetcher,
+            driver_pool=self.driver_pool,
+            page_cache=self.page_cache,
+            as_records=self.as_records
+        )
+
+    def _start_scraper(self, worker_id, startup_errors, lock):
+        scraper = self.make_scraper()
+        try:
+            scraper.start_driver()
+        except Exception as e:
+            self.lg.error(f"Worker {worker_id} couldn't start its driver: {e!r}")
+            scraper.stop_driver()
+            with lock:
+                startup_errors.append(e)
+            return None
+        return scraper
+
+    def _work(self, worker_id, hrefs_queue, results, on_result, sink, lock, startup_errors):
+        scraper = self._start_scraper(worker_id, startup_errors, lock)
+        if scraper is None:
+            return
+        try:
+            while True:
+                try:
+                    index, href = hrefs_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    records = scraper.run_scraping(
+                        profile_href=href,
+                        extraction=self.extraction
+                    )
+                except Exception as e:
+                    self.lg.error(f"Worker {worker_id} failed on {href}: {e!r}")
+                    with lock:
+                        self.failed.append((href, repr(e)))
+                    continue
+
+                with lock:
+                    if sink is None:
+                        results[index] = records
+                    else:
+                        sink.write_many(records)
+                    if on_result is not None:
+                        on_result(href, records)
+        finally:
+            scraper.stop_driver()
+
+    def _work_stream(self, worker_id, hrefs_queue, results, stop, lock, startup_errors, errors, workers):
+        scraper = self._start_scraper(worker_id, startup_errors, lock)
+        if scraper is None:
+            with lock:
+                if len(startup_errors) == workers:
+                    # no worker left to consume the hrefs: end the stream with the error
+                    errors.append(startup_errors[0])
+                    stop.set()
+            return
+        try:
+            while not stop.is_set():
+                try:
+                    href = hrefs_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                if href is None:
+                    break
+
+                try:
+                    records = scraper.run_scraping(
+                        profile_href=href,
+                        extraction=self.extraction
+                    )
+                except Exception as e:
+                    self.lg.error(f"Worker {worker_id} failed on {href}: {e!r}")
+                    with lock:
+                        self.failed.append((href, repr(e)))
+                    continue
+
+                results.write((href, records))
+        except SinkClosed:
+            pass
+        finally:
+            scraper.stop_driver()
+
+    def _feed(self, hrefs, hrefs_queue, workers, stop, errors):
+        def put(item):
+            while not stop.is_set():
+                try:
+                    hrefs_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        hrefs = iter(hrefs)
+        try:
+            for href in hrefs:
+                if not put(href):
+                    break
+        except Exception as e:
+            errors.append(e)
+        finally:
+            # a generator (e.g. `iter_cards`) stops its own producer when closed
+            if hasattr(hrefs, "close"):
+                hrefs.close()
+            for _ in range(workers):
+                put(None)
+
+    def iter_profiles(self, hrefs, workers:int|None=None, max_pending:int|None=None):
+        workers = workers or self.workers
+        max_pending = max_pending or 2 * workers
+        self.failed = []
+
+        hrefs_queue = queue.Queue(max_pending)
+        results = QueueSink(max_pending)
+        stop = threading.Event()
+        errors = []
+        startup_errors = []
+        lock = threading.Lock()
+
+        feeder = threading.Thread(
+            target=self._feed,
+            args=(hrefs, hrefs_queue, workers, stop, errors),
+            name="profile-feeder",
+            daemon=True
+        )
+        threads = [
+            threading.Thread(
+                target=self._work_stream,
+                args=(worker_id, hrefs_queue, results, stop, lock, startup_errors, errors, workers),
+                name=f"profile-stream-{worker_id}",
+                daemon=True
+            )
+            for worker_id in range(workers)
+        ]
+
+        def close():
+            for thread in [feeder, *threads]:
+                thread.join()
+            results.close(errors[0] if errors else None)
+
+        closer = threading.Thread(target=close, name="profile-stream-closer", daemon=True)
+        for thread in [feeder, *threads, closer]:
+            thread.start()
+
+        try:
+            yield from results
+        finally:
+            stop.set()
+            results.cancel()
+            closer.join()
+
+    def _work_queue(self, worker_id, task_queue, sink, on_result, idle_timeout, poll_interval, counts, lock, startup_errors):
+        scraper = self._start_scraper(worker_id, startup_errors, lock)
+        if scraper is None:
+            return
+        lease_owner = default_worker_id()
+        idle_since = time.monotonic()
+        try:
+            while True:
+                tasks = task_queue.claim(lease_owner)
+                if not tasks:
+                    if time.monotonic() - idle_since > idle_timeout:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+                idle_since = time.monotonic()
+
+                task = tasks[0]
+                done = threading.Event()
+                heartbeat = threading.Thread(
+                    target=self._keep_lease,
+                    args=(task_queue, task["id"], lease_owner, done),
+                    name=f"queue-lease-{worker_id}",
+                    daemon=True
+                )
+                heartbeat.start()
+                try:
+                    records = scraper.run_scraping(
+                        profile_href=task["href"],
+                        extraction=self.extraction
+                    )
+                except Exception as e:
+                    self.lg.error(f"Worker {worker_id} failed on {task['href']} (attempt {task['attempts']}): {e!r}")
+                    task_queue.nack(task["id"], repr(e), worker_id=lease_owner)
+                    with lock:
+                        self.failed.append((task["href"], repr(e)))
+                    continue
+                finally:
+                    done.set()
+                    heartbeat.join()
+
+                # another worker took over the task once its lease expired: keep one result only
+                if not task_queue.ack(task["id"], len(records), worker_id=lease_owner):
+                    self.lg.warning(f"Worker {worker_id} lost the lease of {task['href']}, dropping its records")
+                    continue
+
+                with lock:
+                    if sink is not None:
+                        sink.write_many(records)
+                    if on_result is not None:
+                        on_result(task["href"], records)
+                    counts["tasks"] += 1
+                    counts["records"] += len(records)
+        finally:
+            scraper.stop_driver()
+
+    def _keep_lease(self, task_queue, task_id, lease_owner, done):
+        # renews the lease while the task runs, e.g. through a long "Retry later" backoff
+        while not done.wait(task_queue.lease_seconds / 3):
+            if not task_queue.extend(task_id, lease_owner):
+                self.lg.warning(f"Lease of task {task_id} lost")
+                return
+
+    def run_queue(self, task_queue, workers:int|None=None, sink=None, on_result=None, idle_timeout:float=60, poll_interval:float=2):
+        workers = workers or self.workers
+        self.failed = []
+        counts = {"tasks": 0, "records": 0}
+        startup_errors = []
+        lock = threading.Lock()
+
+        threads = [
+            threading.Thread(
+                target=self._work_queue,
+                args=(worker_id, task_queue, sink, on_result, idle_timeout, poll_interval, counts, lock, startup_errors),
+                name=f"queue-worker-{worker_id}",
+                daemon=True
+            )
+            for worker_id in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if len(startup_errors) == workers:
+            raise startup_errors[0]
+
+        if sink is not None:
+            sink.flush()
+
+        self.lg.info(f"{counts['tasks']} task(s) done, {len(self.failed)} failed, {counts['records']} record(s) -- queue: {task_queue.stats()}")
+        return counts
+
+    def run_many(self, hrefs:list[str], workers:int|None=None, on_result=None, sink=None):
+        workers = min(workers or self.workers, len(hrefs))
+        self.failed = []
+
+        hrefs_queue = queue.Queue()
+        for item in enumerate(hrefs):
+            hrefs_queue.put(item)
+
+        results = [[] for _ in hrefs]
+        startup_errors = []
+        lock = threading.Lock()
+
+        threads = [
+            threading.Thread(
+                target=self._work,
+                args=(worker_id, hrefs_queue, results, on_result, sink, lock, startup_errors),
+                name=f"profile-worker-{worker_id}",
+                daemon=True
+            )
+            for worker_id in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # left over when every driver failed to start
+        while not hrefs_queue.empty():
+            index, href = hrefs_queue.get_nowait()
+            self.failed.append((href, repr(startup_errors[0])))
+
+        if sink is not None:
+            sink.flush()
+
+        self.lg.info(f"{len(hrefs) - len(self.failed)}/{len(hrefs)} profile(s) scraped with {workers} worker(s)")
+        return [record for records in results for record in records]
+
+def run_worker(task_queue, driver_path:str, workers:int=1, extraction:str="wait", sink=None, idle_timeout:float=60, **kwargs):
+    """
+    Shortcut for `ProfilePool(driver_path, workers, extraction, **kwargs).run_queue(task_queue, sink=sink, idle_timeout=idle_timeout)`,
+    e.g. the entry point of each worker process of a distributed crawl.
+    """
+    pool = ProfilePool(driver_path, workers=workers, extraction=extraction, **kwargs)
+    return pool.run_queue(task_queue, sink=sink, idle_timeout=idle_timeout)
+
+def run_many(hrefs:list[str], driver_path:str, workers:int=2, extraction:str="wait", on_result=None, sink=None):
+    """
+    Shortcut for `ProfilePool(driver_path, workers, extraction).run_many(hrefs, on_result=on_result, sink=sink)`.
+    """
+    return ProfilePool(
+        driver_path=driver_path,
+        workers=workers,
+        extraction=extraction
+    ).run_many(hrefs, on_result=on_result, sink=sink)
@@ -1,13 +1,67 @@
-import time, datetime
+import datetime
 
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-
-from scraptolib.utils.helpers import human_delay
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+
+from scraptolib.utils.formatters import (
+    format_skills, format_languages, format_contact_details, format_prices, format_history,
+    format_profile, missing_sections
+)
+from scraptolib.utils.selectors import PROFILE_XPATHS, PROFILE_READY_XPATHS, LOCATION_FIELDS
+from scraptolib.utils.cache import content_hash
+from scraptolib.utils.records import Profile
+from scraptolib.utils.metrics import timed
+from scraptolib.parsers.HtmlParser import HtmlParser, lxml_html
 from scraptolib.scrapers.Scraper import Scraper
 
+# Evaluated in the page by `get_profile_data_by_script`: collects the raw texts of every
+# profile section in a single WebDriver round trip. Missing sections come back as null.
+PROFILE_EXTRACTION_SCRIPT = """
+const first = (xpath) => document.evaluate(
+    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+const all = (xpath) => {
+    const snapshot = document.evaluate(
+        xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    const nodes = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+    return nodes;
+};
+const text = (node) => node
+    ? node.innerText.split("\\n").map((line) => line.trim()).join("\\n").trim()
+    : null;
+const texts = (nodes) => nodes.length ? nodes.map(text) : null;
+const xpaths = arguments[0];
+const website = first(xpaths.website);
+
+return {
+    name: text(first(xpaths.name)),
+    speciality: text(first(xpaths.speciality)),
+    is_establishment: first(xpaths.establishment_icon) !== null,
+    address: text(first(xpaths.address)),
+    skills: text(first(xpaths.skills)),
+    languages: text(first(xpaths.languages)),
+    summary: text(first(xpaths.summary)),
+    website: website ? website.href : null,
+    contact_details: text(first(xpaths.contact_details)),
+    prices: texts(all(xpaths.prices)),
+    history: texts(all(xpaths.history))
+};
+"""
+
+# Fetches a page from the page's origin, with its cookies; its HTML, or null on failure
+LOCATION_FETCH_SCRIPT = """
+const url = arguments[0];
+const done = arguments[arguments.length - 1];
+fetch(url, {credentials: "include"})
+    .then((response) => response.ok ? response.text() : null)
+    .catch(() => null)
+    .then(done);
+"""
+
 class ProfileScraper(Scraper):
     """
     Scraper designed to extract detailed profile information from Doctolib practitioner pages.
@@ -20,8 +74,12 @@ class ProfileScraper(Scraper):
 
     Methods
     -------
-    __init__(driver_path: str)
-        Initializes the ProfileScraper with the path to the Chrome driver.
+    __init__(driver_path: str, frontier: Frontier | None = None, rate_limiter: RateLimiter | None = None, metrics: Metrics | None = None, driver_profile: str | Dict = "default", fetcher: HttpFetcher | None = None, driver_pool: DriverPool | None = None, page_cache: PageCache | None = None, as_records: bool = False)
+        Initializes the ProfileScraper with the path to the Chrome driver, optional shared `Frontier`, `RateLimiter`, `Metrics`
+        and `HttpFetcher`, the driver profile ("default" or "fast", see `Scraper.start_driver`) and an optional `DriverPool` to lease drivers from.
+        With a `PageCache`, a first page that hasn't changed since the last run is not extracted again.
+        With `as_records`, scraped locations are returned (and streamed) as slotted `Profile` records
+        instead of dicts; `Profile.to_dict` gives back the dict layout.
     
     get_locations() -> List[Tuple[str, str]]
         Returns a list of tuples containing the location name and URL for each associated location.
@@ -58,13 +116,77 @@ class ProfileScraper(Scraper):
     get_history() -> Dict[str, List[Tuple[str, str]]] | str
         Returns a structured history dictionary (education, experience, associations).
 
-    run_scraping(profile_href: str) -> List[Dict]
+    get_profile_data() -> Dict
+        Returns every profile field by calling each `get_*` method in turn.
+
+    get_profile_data_by_script() -> Dict
+        Returns every profile field at once, gathered by a single `execute_script` call.
+        Missing sections are logged together and returned as empty strings, without any timeout.
+
+    get_profile_data_from_html() -> Dict
+        Returns every profile field parsed offline by `HtmlParser` from a single `page_source` fetch.
+
+    run_scraping(profile_href: str, extraction: str = "wait", sink: JsonlSink | None = None, tabs: int = 1, from_cache: bool = False, share_fields: bool = True) -> List[Dict]
         Navigates to the practitioner's page and scrapes all available details for each associated location.
 
         Parameters
         ----------
         profile_href : str
             URL of the practitioner's profile page to start scraping.
+        extraction : str, optional
+            "wait" calls every `get_*` method, each one waiting up to 5s for its section (default).
+            "script" waits for the profile header once, then uses `get_profile_data_by_script`.
+            "html" uses `get_profile_data_from_html` (requires lxml).
+        sink : JsonlSink, optional
+            If given, each location record is written to it as soon as it is scraped.
+        tabs : int, optional
+            If above 1, the other locations of the practitioner load in parallel tabs of the
+            same browser (see `Scraper.scrape_in_tabs`) instead of one after another.
+
+        from_cache : bool, optional
+            If True and the profile is in the `PageCache`, its records are served from the cache
+            without loading any page (for development and repeat runs).
+        share_fields : bool, optional
+            If True (default), practitioner-level fields (name, speciality, skills, languages,
+            summary, website, history) are extracted from the first page only, and just the
+            location-level ones (address, contact details, prices) are fetched for the other
+            locations with `get_location_data`, without navigating to them. Locations that can't
+            be fetched this way, or all of them if lxml isn't installed, are loaded as before.
+
+        With an `HttpFetcher`, the other locations are first fetched over HTTP and parsed with
+        `HtmlParser`; Selenium loads them only when the response lacks the profile content.
+
+        With a `PageCache`, the first page is hashed once loaded: if the hash matches the cached one,
+        that page's fields are taken from the cached record without extraction. The other locations
+        have their own pages and are always fetched. The page and its new records are then stored in the cache.
+
+        With a `Frontier`, already scraped profiles and locations are skipped
+        (an empty list is returned for a profile scraped within the frontier's TTL),
+        and every scraped URL is marked done, or failed if scraping raised.
+
+    scrape_locations(profile_href: str, get_profile_data: Callable, sink: JsonlSink | None = None, tabs: int = 1, share_fields: bool = True) -> List[Dict]
+        Loads the profile and checks the page cache, then runs `extract_locations`.
+
+    extract_locations(profile_href: str, get_profile_data: Callable, sink: JsonlSink | None = None, tabs: int = 1, share_fields: bool = True) -> List[Dict]
+        Scraping loop over the practitioner's locations, the first one being the loaded page.
+
+    get_location_data(locations: List[Tuple[str, str]], required_fields: List[str] = ("address",)) -> List[Dict | None]
+        Location-level fields (`LOCATION_FIELDS`) of each location, fetched over HTTP with the
+        `HttpFetcher` if any, else from the loaded page with `fetch_location_pages`, and parsed
+        by `HtmlParser`. None for the locations that couldn't be fetched or whose page lacks one of
+        the `required_fields` sections (e.g. rendered client-side), which are then navigated to.
+        `extract_locations` requires the sections found on the first location's page.
+
+    fetch_location_pages(urls: List[str]) -> List[str | None]
+        HTML of every URL, fetched by the browser (`fetch()` with the page's cookies) without
+        navigating away, one `execute_async_script` call per URL paced like a page load.
+
+    run_many_in_tabs(hrefs: List[str], tabs: int = 3, extraction: str = "wait", sink: JsonlSink | None = None) -> List[Dict]
+        Scrapes several profiles with a single browser, `tabs` pages loading at once.
+        Each profile's other locations are queued as soon as its first page is scraped,
+        and pages are extracted in the order they finish loading. A page whose extraction raises
+        is logged, counted in `metrics` (`tab_failed`, by page kind) and its profile marked failed
+        in the `Frontier`; the other tabs go on.
 
         Returns
         -------
@@ -84,45 +206,58 @@ class ProfileScraper(Scraper):
                 - scrap_timestamp: str (YYYY-MM-DD HH:MM:SS)
     """
 
-    def __init__(self, driver_path:str):
+    def __init__(self, driver_path:str, frontier=None, rate_limiter=None, metrics=None, driver_profile="default", fetcher=None, driver_pool=None, page_cache=None, as_records:bool=False):
         super().__init__(
-            driver_path=driver_path
+            driver_path=driver_path,
+            frontier=frontier,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+            driver_profile=driver_profile,
+            fetcher=fetcher,
+            driver_pool=driver_pool
         )
+        self.page_cache = page_cache
+        self.as_records = as_records
 
+    @timed("get_locations")
     def get_locations(self):
         try:
             locations = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_all_elements_located(
-                    (By.XPATH, "//div[contains(@class, 'dl-pill-list')]//a")
+                    (By.XPATH, PROFILE_XPATHS["locations"])
                 )
             )
             return [(elem.text, elem.get_attribute("href")) for elem in locations]
         except TimeoutException:
+            self.metrics.incr("timeouts", "get_locations")
             return [("", self.driver.current_url)]
         
+    @timed("get_name")
     def get_name(self):
         try:
             name = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, "//span[@itemprop='name']")
+                    (By.XPATH, PROFILE_XPATHS["name"])
                 )
             )
             return name.text
         except TimeoutException:
+            self.metrics.incr("timeouts", "get_name")
             return ""
 
+    @timed("get_specialty")
     def get_specialty(self):
         try:
             specialty = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, "//div[@class='dl-profile-header-speciality']")
+                    (By.XPATH, PROFILE_XPATHS["speciality"])
                 )
             )
 
             try:
                 specialty.find_element(
-                    By.XPATH, 
-                    "//div[@class='dl-profile-organization-icon']"
+                    By.XPATH,
+                    PROFILE_XPATHS["establishment_icon"]
                 )
                 is_establishment = True
             except NoSuchElementException:
@@ -130,175 +265,441 @@ class ProfileScraper(Scraper):
 
             return (specialty.text, is_establishment)
         except TimeoutException:
+            self.metrics.incr("timeouts", "get_specialty")
             return ""
 
+    @timed("get_address")
     def get_address(self):
         try:
             address = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, "//div[contains(@data-test, 'location')]")
+                    (By.XPATH, PROFILE_XPATHS["address"])
                 )
             )
             return address.text
         except TimeoutException:
+            self.metrics.incr("timeouts", "get_address")
             return ""
     
+    @timed("get_skills")
     def get_skills(self):
         try:
             skills = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, "//div[@class='dl-profile-skills']")
+                    (By.XPATH, PROFILE_XPATHS["skills"])
                 )
             )
 
-            return skills.text.split("\n")
+            return format_skills(skills.text)
         except TimeoutException:
+            self.metrics.incr("timeouts", "get_skills")
             return ""
     
+    @timed("get_summary")
     def get_summary(self):
         try:
             summary = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, "//div[contains(@class, 'dl-profile-bio')]")
+                    (By.XPATH, PROFILE_XPATHS["summary"])
                 )
             )
 
             return summary.text
         except TimeoutException:
+            self.metrics.incr("timeouts", "get_summary")
             return ""
 
+    @timed("get_languages")
     def get_languages(self):
         try:
             languages = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, "//h3[contains(text(), 'Langues parlées')]/parent::div")
+                    (By.XPATH, PROFILE_XPATHS["languages"])
                 )
             )
             
-            return languages.text.split('\n')[-1].replace(",", "").replace("et ", "").split()
+            return format_languages(languages.text)
         except TimeoutException:
+            self.metrics.incr("timeouts", "get_languages")
             return ""
 
+    @timed("get_website")
     def get_website(self):
         try:
             website = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, "//h3[contains(text(), 'Site web')]/parent::div//a")
+                    (By.XPATH, PROFILE_XPATHS["website"])
                 )
             )
         except TimeoutException:
+            self.metrics.incr("timeouts", "get_website")
             return ""
         
         return website.get_attribute("href")
     
+    @timed("get_contact_details")
     def get_contact_details(self):
         try:
             contact_details = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, "//h3[contains(text(), 'Coordonnées')]/parent::div//div")
+                    (By.XPATH, PROFILE_XPATHS["contact_details"])
                 )
             )
 
-            return contact_details.text.replace(" ", "")
+            return format_contact_details(contact_details.text)
         except TimeoutException:
+            self.metrics.incr("timeouts", "get_contact_details")
             return ""
 
     
+    @timed("get_prices")
     def get_prices(self):
         try:
             prices = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_all_elements_located(
-                    (By.XPATH, "//h2[contains(text(), 'Tarifs')]/parent::div/ul/li")
+                    (By.XPATH, PROFILE_XPATHS["prices"])
                 )
             )
 
-            extraction = [elem.text.split("\n") for elem in prices]
-            return {
-                elem[0]:elem[1]
-                for elem in extraction
-            }
+            return format_prices([elem.text for elem in prices])
         except TimeoutException:
+            self.metrics.incr("timeouts", "get_prices")
             return ""
         
+    @timed("get_history")
     def get_history(self):
         try:
             history = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_all_elements_located(
-                    (By.XPATH, "//div[contains(@class, 'dl-profile-history')]")
+                    (By.XPATH, PROFILE_XPATHS["history"])
                 )
             )
-            extraction = [elem.text.split('\n') for elem in history]
-            
-            output = {}
-            for elem in extraction:
-                key = elem[0]
-                try: # when there are dates
-                    value = [{"year":elem[i+1], "label":elem[i+2]} for i in range(0, len(elem)-1, 2)]
-                    output[key] = value
-                except IndexError: # when not
-                    output[key] = {"year":"undefined", "label":elem[1:]}
-            return output
-        
+            return format_history([elem.text for elem in history])
+
         except TimeoutException:
+            self.metrics.incr("timeouts", "get_history")
             return ""
-        
-    def run_scraping(self, profile_href:str):
-        self.driver.get(profile_href) # assert href format
-        if self.is_retry_later():
-            self.handle_retry_later(
-                current_page=profile_href
-            )
 
-        self.driver.execute_script("document.body.style.zoom='1%'")
-        time.sleep(1.5)
+    def get_profile_data(self):
+        return {
+            "name": self.get_name(),
+            "speciality": self.get_specialty(),
+            "address": self.get_address(),
+            "skills": self.get_skills(),
+            "languages": self.get_languages(),
+            "summary": self.get_summary(),
+            "website": self.get_website(),
+            "contact_details": self.get_contact_details(),
+            "prices": self.get_prices(),
+            "history": self.get_history()
+        }
+
+    @timed("get_profile_data_by_script")
+    def get_profile_data_by_script(self):
+        try:
+            WebDriverWait(self.driver, 5).until(
+                EC.presence_of_element_located(
+                    (By.XPATH, PROFILE_XPATHS["name"])
+                )
+            )
+        except TimeoutException:
+            self.metrics.incr("timeouts", "get_profile_data_by_script")
+            self.lg.info("Profile header not found, extracting whatever is on the page")
+
+        raw = self.driver.execute_script(PROFILE_EXTRACTION_SCRIPT, PROFILE_XPATHS)
+        return self.format_raw_profile(raw)
+
+    @timed("get_profile_data_from_html")
+    def get_profile_data_from_html(self):
+        parser = HtmlParser.from_driver(self.driver)
+        return self.format_raw_profile(parser.get_raw_profile())
+
+    def format_raw_profile(self, raw:dict):
+        missing = missing_sections(raw)
+        if missing:
+            self.lg.info(f"Missing section(s): {', '.join(missing)}")
+
+        return format_profile(raw)
+
+    def get_profile_data_method(self, extraction:str):
+        if extraction == "wait":
+            return self.get_profile_data
+        elif extraction == "script":
+            return self.get_profile_data_by_script
+        elif extraction == "html":
+            return self.get_profile_data_from_html
+        raise ValueError(f"Unknown extraction mode: {extraction}")
+
+    def run_scraping(self, profile_href:str, extraction:str="wait", sink=None, tabs:int=1, from_cache:bool=False, share_fields:bool=True):
+        get_profile_data = self.get_profile_data_method(extraction)
+
+        if from_cache and self.page_cache is not None:
+            cached = self.page_cache.get(profile_href)
+            if cached is not None:
+                self.metrics.incr("cache_hits")
+                self.lg.info(f"{profile_href} served from the page cache")
+                if cached["records"] is None:
+                    records = [self.record_from_html(cached["html"], profile_href)]
+                else:
+                    records = self.typed_records(cached["records"])
+                if sink is not None:
+                    sink.write_many(records)
+                return records
+
+        if self.frontier is not None and not self.frontier.should_fetch(profile_href):
+            self.lg.info(f"{profile_href} already scraped, skipping it")
+            return []
 
-        locations = self.get_locations()
+        try:
+            output = self.scrape_locations(profile_href, get_profile_data, sink, tabs, share_fields)
+        except Exception as e:
+            if self.frontier is not None:
+                self.frontier.mark_failed(profile_href, repr(e))
+            raise
+
+        if self.frontier is not None:
+            self.frontier.mark_done(profile_href)
+        return output
 
+    def sort_locations(self, locations, profile_href:str):
         # avoid sending another useless request to doctolib
         for i, location in enumerate(locations):
             if location[1]==profile_href:
                 del locations[i]
                 locations.insert(0, location)
                 break
+        return locations
 
-        output = []
-        for i, location in enumerate(locations):
-            if i == 0: # avoid sending another useless request to doctolib
-                pass
+    def locations_to_fetch(self, locations):
+        if self.frontier is None:
+            return locations
+
+        to_fetch = []
+        for location in locations:
+            if self.frontier.should_fetch(location[1]):
+                to_fetch.append(location)
             else:
-                human_delay(alpha=5)
-                self.driver.get(location[1])
-                self.driver.execute_script("document.body.style.zoom='1%'")
-            
-            time.sleep(1.5)
-
-            name = self.get_name()
-            speciality = self.get_specialty()
-            address = self.get_address()
-            skills = self.get_skills()
-            languages = self.get_languages()
-            summary = self.get_summary()
-            website = self.get_website()
-            contact_details = self.get_contact_details()
-            prices = self.get_prices()
-            history = self.get_history()
-
-            output.append(
-                {
-                    "location": location,
-                    "name": name,
-                    "speciality": speciality,
-                    "address": address,
-                    "skills": skills,
-                    "languages": languages,
-                    "summary": summary,
-                    "website": website,
-                    "contact_details": contact_details,
-                    "prices": prices,
-                    "history": history,
-                    "scrap_timestamp":datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
+                self.lg.info(f"Location {location[1]} already scraped, skipping it")
+        return to_fetch
+
+    def build_record(self, location, get_profile_data, sink=None):
+        record = {
+            "location": location,
+            **get_profile_data(),
+            "scrap_timestamp":datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        if self.as_records:
+            record = Profile.from_dict(record)
+        self.on_page_success()
+
+        if sink is not None:
+            sink.write(record)
+        if self.frontier is not None:
+            self.frontier.mark_done(location[1])
+        return record
+
+    def record_from_html(self, html:str, profile_href:str):
+        parser = HtmlParser(html, base_url=profile_href)
+        location = self.sort_locations(parser.get_locations(), profile_href)[0]
+        record = {
+            "location": location,
+            **self.format_raw_profile(parser.get_raw_profile()),
+            "scrap_timestamp":datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        return Profile.from_dict(record) if self.as_records else record
+
+    def typed_records(self, records:list[dict]):
+        if self.as_records:
+            return [Profile.from_dict(record) for record in records]
+        return records
+
+    def scrape_locations(self, profile_href:str, get_profile_data, sink=None, tabs:int=1, share_fields:bool=True):
+        self.navigate(profile_href) # assert href format
+        if self.is_retry_later():
+            self.handle_retry_later(
+                current_page=profile_href
             )
+
+        self.driver.execute_script("document.body.style.zoom='1%'")
+        self.wait_until_ready(PROFILE_READY_XPATHS)
+
+        if self.page_cache is None:
+            return self.extract_locations(profile_href, get_profile_data, sink, tabs, share_fields)
+
+        html = self.driver.page_source
+        cached = self.page_cache.get(profile_href)
+        data = None
+        if cached is not None and cached["records"] and cached["hash"] == content_hash(html):
+            # only the page that was hashed is known to be unchanged: the other
+            # locations (address, prices, contact details) are still fetched
+            self.metrics.incr("cache_unchanged")
+            self.lg.info(f"{profile_href} unchanged since {datetime.datetime.fromtimestamp(cached['fetched_at']):%Y-%m-%d %H:%M:%S}, skipping its extraction")
+            data = {
+                field: value for field, value in cached["records"][0].items()
+                if field not in ("location", "scrap_timestamp")
+            }
+
+        output = self.extract_locations(profile_href, get_profile_data, sink, tabs, share_fields, data)
+        self.page_cache.put(profile_href, html, output)
+        return output
+
+    @timed("fetch_location_pages")
+    def fetch_location_pages(self, urls:list[str]):
+        pages = []
+        for url in urls:
+            self.pace(alpha=5)
+            if self.rate_limiter is not None:
+                with self.metrics.timer("rate_limit"):
+                    self.rate_limiter.acquire()
+
+            try:
+                pages.append(self.driver.execute_async_script(LOCATION_FETCH_SCRIPT, url))
+            except WebDriverException as e:
+                self.metrics.incr("timeouts", "fetch_location_pages")
+                self.lg.warning(f"In-page fetch of {url} failed: {e.__class__.__name__}")
+                pages.append(None)
+        return pages
+
+    def section_xpaths(self, fields):
+        # the profile header, plus the sections that will be extracted
+        return [PROFILE_XPATHS["name"], *(PROFILE_XPATHS[field] for field in fields if field != "name")]
+
+    def has_sections(self, parser, required_fields=("address",)):
+        if parser is None or parser.is_retry_later():
+            return False
+        if not any(parser.first(xpath) is not None for xpath in PROFILE_READY_XPATHS):
+            return False
+        return all(parser.first(PROFILE_XPATHS[field]) is not None for field in required_fields)
+
+    def location_data_from_parser(self, parser, required_fields=("address",)):
+        if not self.has_sections(parser, required_fields):
+            return None
+        return parser.get_location_data()
+
+    def location_data_from_html(self, html:str|None, url:str, required_fields=("address",)):
+        if not html:
+            return None
+        return self.location_data_from_parser(HtmlParser(html, base_url=url), required_fields)
+
+    def get_location_data(self, locations, required_fields=("address",)):
+        data = {}
+        if self.fetcher is not None:
+            for location in locations:
+                self.pace(alpha=5)
+                parser = self.fetch_parser(location[1], self.section_xpaths(required_fields))
+                location_data = self.location_data_from_parser(parser, required_fields)
+                if location_data is not None:
+                    data[location[1]] = location_data
+
+        urls = [location[1] for location in locations if location[1] not in data]
+        if urls:
+            for url, html in zip(urls, self.fetch_location_pages(urls)):
+                location_data = self.location_data_from_html(html, url, required_fields)
+                if location_data is not None:
+                    data[url] = location_data
+                    self.metrics.incr("in_page_fetches")
+                else:
+                    self.metrics.incr("in_page_fetch_fallback")
+
+        return [data.get(location[1]) for location in locations]
+
+    def extract_locations(self, profile_href:str, get_profile_data, sink=None, tabs:int=1, share_fields:bool=True, data=None):
+
+        locations = self.sort_locations(self.get_locations(), profile_href)
+
+        # the first location is the page already loaded (`data` if it was read from the page cache)
+        if data is None:
+            data = get_profile_data()
+        output = [self.build_record(locations[0], lambda: data, sink)]
+        other_locations = self.locations_to_fetch(locations[1:])
+
+        # sections found on the first page are expected on the others, else they weren't rendered yet
+        required_fields = [field for field in LOCATION_FIELDS if data.get(field)]
+        rejected = set() # already fetched without the sections: straight to the browser
+
+        if share_fields and other_locations and lxml_html is not None:
+            # practitioner-level fields are taken from the first page, only the
+            # location-level ones are fetched; failures go through a full navigation
+            remaining = []
+            for location, location_data in zip(other_locations, self.get_location_data(other_locations, required_fields)):
+                if location_data is None:
+                    remaining.append(location)
+                else:
+                    output.append(self.build_record(location, lambda: {**data, **location_data}, sink))
+            other_locations = remaining
+            rejected = {location[1] for location in remaining}
+
+        if tabs > 1:
+            self.scrape_in_tabs(
+                jobs=[(location[1], location) for location in other_locations],
+                tabs=tabs,
+                on_ready=lambda url, location: output.append(
+                    self.build_record(location, get_profile_data, sink)
+                ),
+                ready_xpaths=PROFILE_READY_XPATHS
+            )
+            return output
+
+        for location in other_locations:
+            self.pace(alpha=5)
+
+            if self.fetcher is not None and location[1] not in rejected:
+                # every section found on the first page, practitioner-level ones included
+                parser = self.fetch_parser(location[1], self.section_xpaths(
+                    [field for field in PROFILE_XPATHS if data.get(field)]
+                ))
+                if self.has_sections(parser, required_fields):
+                    location_data = self.format_raw_profile(parser.get_raw_profile())
+                    output.append(self.build_record(location, lambda: location_data, sink))
+                    continue
+
+            self.navigate(location[1])
+            self.driver.execute_script("document.body.style.zoom='1%'")
+            self.wait_until_ready(PROFILE_READY_XPATHS)
+
+            output.append(self.build_record(location, get_profile_data, sink))
+        return output
+
+    def run_many_in_tabs(self, hrefs:list[str], tabs:int=3, extraction:str="wait", sink=None):
+        get_profile_data = self.get_profile_data_method(extraction)
+        output = []
+
+        def scrape_page(url, kind, location, profile_href):
+            if kind == "location":
+                output.append(self.build_record(location, get_profile_data, sink))
+                return []
+
+            # first page of a profile: scrape it and queue its other locations
+            locations = self.sort_locations(self.get_locations(), url)
+            output.append(self.build_record(locations[0], get_profile_data, sink))
+            if self.frontier is not None:
+                self.frontier.mark_done(profile_href)
+            return [
+                (location[1], ("location", location, profile_href))
+                for location in self.locations_to_fetch(locations[1:])
+            ]
+
+        def on_ready(url, job):
+            kind, location, profile_href = job
+            try:
+                return scrape_page(url, kind, location, profile_href)
+            except Exception as e:
+                self.lg.error(f"{kind} page {url} of {profile_href} failed: {e!r}")
+                self.metrics.incr("tab_failed", kind)
+                if self.frontier is not None:
+                    self.frontier.mark_failed(profile_href, repr(e))
+                return []
+
+        hrefs = [
+            href for href in hrefs
+            if self.frontier is None or self.frontier.should_fetch(href)
+        ]
+        self.scrape_in_tabs(
+            jobs=[(href, ("profile", None, href)) for href in hrefs],
+            tabs=tabs,
+            on_ready=on_ready,
+            ready_xpaths=PROFILE_READY_XPATHS
+        )
         return output
 
 if __name__ == '__main__':
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections import deque
 import time
 
 from selenium import webdriver
@@ -10,6 +11,99 @@ from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException
 
 from scraptolib.utils.helpers import init_logger, human_delay
+from scraptolib.utils.selectors import COOKIES_REFUSE_XPATH, RETRY_LATER_XPATH
+from scraptolib.utils.metrics import Metrics, timed
+from scraptolib.utils.fetchers import HttpFetcher
+from scraptolib.parsers.HtmlParser import HtmlParser
+
+# Polled by `wait_until_ready`: true as soon as one of the given containers exists
+# or the document has finished loading.
+READY_SCRIPT = """
+for (const xpath of arguments[0]) {
+    const node = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    if (node) return true;
+}
+return document.readyState === "complete";
+"""
+
+# Same as READY_SCRIPT for a tab that was just told to navigate: its initial
+# about:blank document must not count as ready.
+TAB_READY_SCRIPT = """
+if (location.href === "about:blank") return false;
+""" + READY_SCRIPT
+
+# Blocked through CDP by the "fast" driver profile: media we never read and third-party trackers.
+FAST_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*criteo.com*", "*bing.com*",
+]
+
+DRIVER_PROFILES = {
+    "default": {
+        "headless": False,
+        "page_load_strategy": "normal",
+        "block_images": False,
+        "blocked_urls": [],
+    },
+    "fast": {
+        "headless": True,
+        "page_load_strategy": "eager",
+        "block_images": True,
+        "blocked_urls": FAST_BLOCKED_URLS,
+    },
+}
+
+# Evaluated after each navigation: bytes transferred and load time of the current page.
+PAGE_STATS_SCRIPT = """
+const navigation = performance.getEntriesByType("navigation")[0];
+const resources = performance.getEntriesByType("resource");
+return {
+    bytes: (navigation ? navigation.transferSize : 0)
+        + resources.reduce((total, entry) => total + (entry.transferSize || 0), 0),
+    requests: resources.length + 1,
+    load_ms: navigation
+        ? (navigation.loadEventEnd || navigation.domContentLoadedEventEnd) - navigation.startTime
+        : null
+};
+"""
+
+def build_driver(driver_path:str, profile:str|dict="default"):
+    """
+    Starts a Chrome WebDriver configured by a driver profile: the name of one of
+    `DRIVER_PROFILES` or a dict overriding some keys of the "default" one.
+    """
+    if isinstance(profile, str):
+        config = DRIVER_PROFILES[profile]
+    else:
+        config = {**DRIVER_PROFILES["default"], **profile}
+
+    service = Service(executable_path=driver_path)
+    options = Options()
+    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0 Safari/537.36")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.page_load_strategy = config["page_load_strategy"]
+
+    if config["headless"]:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+
+    if config["block_images"]:
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+
+    driver = webdriver.Chrome(service=service, options=options)
+
+    if config["blocked_urls"]:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": config["blocked_urls"]})
+
+    return driver
 
 class Scraper(ABC):
     """
@@ -25,14 +119,66 @@ class Scraper(ABC):
 
     Methods
     -------
-    __init__(driver_path: str)
+    __init__(driver_path: str, frontier: Frontier | None = None, rate_limiter: RateLimiter | None = None, metrics: Metrics | None = None, driver_profile: str | Dict = "default", fetcher: HttpFetcher | None = None, driver_pool: DriverPool | None = None)
         Initializes the scraper with the path to the Chrome driver and a logger.
+        If a `Frontier` is given, scrapers record the URLs they scrape in it and
+        skip the ones already scraped.
+        If a `RateLimiter` is given, it paces every navigation and the "Retry later" backoff
+        instead of `human_delay` and the fixed 1200s wait. It can be shared between scrapers.
+        Timings and events are recorded in `metrics` (a new `Metrics` unless one is given to share).
+        With an `HttpFetcher`, pages that don't need JavaScript are fetched over HTTP first (see `fetch_parser`).
+        With a `DriverPool`, drivers are leased from the pool instead of being launched and quit.
 
     start_driver()
-        Starts a Selenium Chrome WebDriver if not already started.
+        Starts a Selenium Chrome WebDriver if not already started, configured by `driver_profile`:
+        "default" (headed, full page loads) or "fast" (headless, eager page loads, images, fonts,
+        media and trackers blocked through CDP), or a dict overriding keys of `DRIVER_PROFILES["default"]`.
+        With a `DriverPool`, leases a warm driver from it instead (the pool's profile applies).
 
     stop_driver()
         Stops the WebDriver, ignoring any exceptions if driver is already closed.
+        A leased driver is handed back to its pool, with the number of pages it loaded.
+
+    is_driver_alive() -> bool
+        False if the browser session is gone (browser crashed, session closed or invalid).
+
+    navigate(url: str)
+        Loads `url`, after waiting for the rate limiter if there is one, and records the page stats.
+
+    page_stats() -> Dict
+        Bytes transferred, number of requests and load time of the current page (Performance API).
+        Cross-origin resources without Timing-Allow-Origin count as 0 bytes.
+
+    pace(alpha: float = 1)
+        Random `human_delay` between two actions. No-op with a rate limiter, which already paces `navigate`.
+
+    on_page_success()
+        Reports a cleanly loaded page to the rate limiter.
+
+    use_http_fetcher(**kwargs) -> HttpFetcher
+        Creates an `HttpFetcher` sharing the cookies and user agent of the started driver.
+
+    fetch_parser(url: str, required_xpaths: List[str]) -> HtmlParser | None
+        Fetches `url` over HTTP and returns its `HtmlParser` if every one of `required_xpaths` (the sections
+        the caller extracts) is in the response. Returns None without a fetcher, on error, on a "Retry later" page or when the content
+        needs JavaScript: the caller then loads the page with Selenium.
+
+    wait_until_ready(xpaths: List[str] = (), timeout: float | None = None) -> float
+        Returns as soon as one of `xpaths` is present or `document.readyState` is "complete",
+        waiting at most `timeout` (default `ready_timeout`, 10s). Logs and returns the time it took.
+
+    scrape_in_tabs(jobs: List[Tuple[str, Any]], tabs: int, on_ready: Callable, ready_xpaths: List[str] = ())
+        Loads the `(url, payload)` jobs in up to `tabs` browser tabs at once and calls
+        `on_ready(url, payload)` with the driver switched to whichever tab finished loading first.
+        `on_ready` may return new jobs, which are queued. Each tab is closed once handled.
+
+    Metrics
+    -------
+    Phases timed in `metrics`: driver_start, rate_limit, navigation, page_load[<profile>], sleep, ready,
+    cookies, retry_later_check, retry_later_backoff, plus every extraction method of the subclasses
+    (get_name, get_cards, ...). Events counted: retry_later, timeouts labelled by the method that
+    timed out, and pages, page_bytes and page_requests labelled by driver profile.
+    `compare_page_stats` turns two such summaries into the bytes and time saved per page.
 
     handle_cookies()
         Attempts to click the "Refuser" button on cookie consent banners if present.
@@ -40,64 +186,220 @@ class Scraper(ABC):
     is_retry_later() -> bool
         Detects "Retry later" or temporary error messages on the page.
         Returns True if such messages are found, False otherwise.
+        Hits are reported to `metrics` and the `RateLimiter` by `handle_retry_later`, once per page.
 
     handle_retry_later(current_page: str)
         Waits and retries loading the page if a temporary error ("Retry later") is detected.
         Clears cookies, localStorage, sessionStorage, reloads the page, and waits before retrying.
+        Waits 1200s per attempt, or an exponential backoff with jitter with a rate limiter.
 
     run_scraping()
         Abstract method. Subclasses must implement this to define the scraping workflow.
     """
 
-    def __init__(self, driver_path:str):
+    base_url = "https://www.doctolib.fr"
+    ready_timeout = 10.0
+
+    def __init__(self, driver_path:str, frontier=None, rate_limiter=None, metrics=None, driver_profile="default", fetcher=None, driver_pool=None):
         """
         
         """
         self.lg = init_logger()
         self.driver_path = driver_path
         self.driver = None
+        self.frontier = frontier
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.driver_profile = driver_profile
+        self.fetcher = fetcher
+        self.driver_pool = driver_pool
+        self.pages_loaded = 0
 
     def start_driver(self):
         if self.driver:
             pass
+        elif self.driver_pool is not None:
+            self.driver = self.driver_pool.acquire()
+            self.pages_loaded = 0
         else:
-            service = Service(executable_path=self.driver_path)
-            options = Options()
-            options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0 Safari/537.36")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            self.driver = webdriver.Chrome(service=service, options=options)
+            with self.metrics.timer("driver_start"):
+                self.driver = build_driver(self.driver_path, self.driver_profile)
 
     def stop_driver(self):
+        if self.driver_pool is not None and self.driver is not None:
+            self.driver_pool.release(self.driver, pages=self.pages_loaded)
+            self.driver = None
+            return
+
         try:
             self.driver.quit()
         except:
             pass
+        self.driver = None
+
+    def is_driver_alive(self):
+        try:
+            return self.driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def navigate(self, url:str):
+        if self.rate_limiter is not None:
+            with self.metrics.timer("rate_limit"):
+                self.rate_limiter.acquire()
+        with self.metrics.timer("navigation"):
+            self.driver.get(url)
+        self.pages_loaded += 1
+        self.record_page_stats()
+
+    def page_stats(self):
+        return self.driver.execute_script(PAGE_STATS_SCRIPT)
+
+    def record_page_stats(self):
+        try:
+            stats = self.page_stats()
+        except Exception:
+            return
+
+        profile = self.driver_profile if isinstance(self.driver_profile, str) else "custom"
+        self.metrics.incr("pages", profile)
+        self.metrics.incr("page_bytes", profile, int(stats["bytes"] or 0))
+        self.metrics.incr("page_requests", profile, int(stats["requests"] or 0))
+        if stats["load_ms"] is not None:
+            self.metrics.record(f"page_load[{profile}]", stats["load_ms"] / 1000)
+
+    def pace(self, alpha:float=1):
+        if self.rate_limiter is None:
+            with self.metrics.timer("sleep"):
+                human_delay(alpha=alpha)
+
+    def on_page_success(self):
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_success()
+
+    def use_http_fetcher(self, **kwargs):
+        self.fetcher = HttpFetcher.from_driver(self.driver, **kwargs)
+        return self.fetcher
+
+    def fetch_parser(self, url:str, required_xpaths:list[str]):
+        if self.fetcher is None:
+            return None
+
+        if self.rate_limiter is not None:
+            with self.metrics.timer("rate_limit"):
+                self.rate_limiter.acquire()
+
+        with self.metrics.timer("http_fetch"):
+            html = self.fetcher.fetch(url)
+
+        parser = HtmlParser(html, base_url=url) if html else None
+        if parser is None or parser.is_retry_later() or not all(parser.first(xpath) is not None for xpath in required_xpaths):
+            self.metrics.incr("http_fallback")
+            self.lg.info(f"HTTP response of {url} lacks the content, falling back to Selenium")
+            if self.driver is not None:
+                self.fetcher.update_cookies(self.driver)
+            return None
+
+        self.metrics.incr("http_pages")
+        return parser
+
+    def wait_until_ready(self, xpaths:list[str]=(), timeout:float|None=None):
+        start = time.perf_counter()
+        try:
+            WebDriverWait(self.driver, timeout or self.ready_timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(READY_SCRIPT, list(xpaths))
+            )
+        except TimeoutException:
+            self.metrics.incr("timeouts", "wait_until_ready")
+            self.lg.warning(f"Page not ready after {timeout or self.ready_timeout}s, scraping anyway")
+
+        elapsed = time.perf_counter() - start
+        self.metrics.record("ready", elapsed)
+        self.lg.info(f"Page ready in {elapsed:.2f}s")
+        return elapsed
     
+    def scrape_in_tabs(self, jobs, tabs:int, on_ready, ready_xpaths:list[str]=()):
+        jobs = deque(jobs)
+        main_handle = self.driver.current_window_handle
+        open_tabs = {} # handle -> (url, payload, started)
+
+        try:
+            while jobs or open_tabs:
+                while jobs and len(open_tabs) < tabs:
+                    url, payload = jobs.popleft()
+                    self.pace(alpha=5)
+                    if self.rate_limiter is not None:
+                        with self.metrics.timer("rate_limit"):
+                            self.rate_limiter.acquire()
+
+                    self.driver.switch_to.new_window("tab")
+                    # assigning location doesn't block, unlike driver.get
+                    self.driver.execute_script("window.location.href = arguments[0];", url)
+                    open_tabs[self.driver.current_window_handle] = (url, payload, time.perf_counter())
+
+                ready = []
+                for handle, (url, payload, started) in open_tabs.items():
+                    self.driver.switch_to.window(handle)
+                    elapsed = time.perf_counter() - started
+                    if self.driver.execute_script(TAB_READY_SCRIPT, list(ready_xpaths)):
+                        ready.append(handle)
+                    elif elapsed >= self.ready_timeout:
+                        self.metrics.incr("timeouts", "scrape_in_tabs")
+                        self.lg.warning(f"Tab {url} not ready after {self.ready_timeout}s, scraping anyway")
+                        ready.append(handle)
+
+                if not ready:
+                    time.sleep(0.1)
+                    continue
+
+                for handle in ready:
+                    url, payload, started = open_tabs.pop(handle)
+                    self.driver.switch_to.window(handle)
+                    self.metrics.record("tab_ready", time.perf_counter() - started)
+                    self.lg.info(f"Tab ready in {time.perf_counter() - started:.2f}s: {url}")
+
+                    try:
+                        if self.is_retry_later():
+                            self.handle_retry_later(current_page=url)
+                        jobs.extend(on_ready(url, payload) or [])
+                    finally:
+                        self.driver.close()
+                        # the closed tab can't open new windows: go back to the main one
+                        self.driver.switch_to.window(main_handle)
+        finally:
+            for handle in open_tabs:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except Exception:
+                    pass
+            self.driver.switch_to.window(main_handle)
+
+    @timed("cookies")
     def handle_cookies(self):
+        if self.driver_pool is not None and self.driver_pool.is_warm(self.driver):
+            return # consent already refused when the pool warmed the driver up
+
         try:
             refuse_cookies_btn = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[.//span[text()='Refuser']]"))
+                EC.element_to_be_clickable((By.XPATH, COOKIES_REFUSE_XPATH))
             )
             refuse_cookies_btn.click()
 
         except TimeoutException:
+            self.metrics.incr("timeouts", "handle_cookies")
             self.lg.info("No cookies banner, scraping still going on ...")
 
+    @timed("retry_later_check")
     def is_retry_later(self):
         try:        
             elem = WebDriverWait(self.driver, 0.1).until(
                 EC.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "//pre[contains(., 'Retry later')]"
-                        " | "
-                        "//span[contains(., \"Désolé, une erreur s'est produite.\")]"
-                    )
+                    (By.XPATH, RETRY_LATER_XPATH)
                 )
             )
 
             text = elem.text
-
             if "Retry later" in text:
                 self.lg.warning("Retry later détecté")
             elif "Désolé" in text:
@@ -109,22 +411,36 @@ class Scraper(ABC):
             return False
         
     def handle_retry_later(self, current_page):
-        backoff = 1200
+        attempt = 0
 
         while self.is_retry_later():
+            # reported here, once per page served: callers check the same page before handing it over
+            self.metrics.incr("retry_later")
+            if self.rate_limiter is not None:
+                self.rate_limiter.on_retry_later()
+
+            if self.rate_limiter is None:
+                backoff = 1200
+            else:
+                backoff = round(self.rate_limiter.backoff_delay(attempt), 1)
             self.lg.warning(f"Retry Later page detected -> waiting for {backoff}s")
-            time.sleep(backoff)
+            with self.metrics.timer("retry_later_backoff"):
+                time.sleep(backoff)
 
+            if self.driver_pool is not None:
+                # the consent cookie goes away too
+                self.driver_pool.mark_cold(self.driver)
             self.driver.delete_all_cookies()
             self.driver.execute_script("window.localStorage.clear();")
             self.driver.execute_script("window.sessionStorage.clear();")
             self.driver.execute_script("location.reload(true);")
-            self.driver.get(current_page)
+            self.navigate(current_page)
 
-            human_delay(alpha=20)
+            self.pace(alpha=20)
+            attempt += 1
         
         self.lg.info("Retry Later went away -> Scraper get back to work")
-        time.sleep(5)
+        self.wait_until_ready()
         self.handle_cookies()
 
     @abstractmethod
@@ -0,0 +1,150 @@
+import hashlib, json, re, sqlite3, threading, time, zlib
+
+from scraptolib.utils.frontier import normalize_url
+from scraptolib.utils.records import as_dict
+
+# Parts of a page that change on every load without the content changing
+_VOLATILE = re.compile(
+    r"<script\b.*?</script>|<style\b.*?</style>|<meta[^>]+csrf[^>]*>|<!--.*?-->",
+    re.IGNORECASE | re.DOTALL
+)
+_WHITESPACE = re.compile(r"\s+")
+_BETWEEN_TAGS = re.compile(r">\s+<")
+
+def content_hash(html:str):
+    """
+    SHA-256 of the page without scripts, styles, comments, CSRF tokens and whitespace changes.
+    """
+    content = _BETWEEN_TAGS.sub("><", _WHITESPACE.sub(" ", _VOLATILE.sub("", html))).strip()
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+class PageCache:
+    """
+    On-disk cache of raw pages (SQLite), keyed by normalized URL.
+
+    Each entry holds the zlib-compressed HTML, its `content_hash`, the fetch time and, optionally,
+    the records extracted from it. `ProfileScraper` uses it to skip extraction when a page hasn't
+    changed since the last run, and to serve repeat runs without a browser during development.
+    Entries older than `max_age` are dropped and the oldest ones are evicted once the
+    compressed pages exceed `max_bytes`. The cache is thread-safe.
+
+    Methods
+    -------
+    __init__(db_path: str = "page_cache.sqlite", max_bytes: int = 500_000_000, max_age: float | None = 30 * 24 * 3600)
+        Opens (or creates) the cache. `max_age` is in seconds, None keeps entries forever.
+
+    get(url: str) -> Dict | None
+        Returns `html`, `hash`, `fetched_at` and `records` (None if not stored) for `url`,
+        None if it isn't cached or is too old.
+
+    put(url: str, html: str, records: List[Dict] | None = None) -> str
+        Stores the page (and its records), evicts if needed, and returns its content hash.
+
+    is_unchanged(url: str, html: str) -> bool
+        True if `url` is cached with the same content hash as `html`.
+
+    evict()
+        Applies the age and size limits.
+
+    stats() -> Dict
+        Number of entries and total compressed size.
+
+    close()
+        Closes the database.
+    """
+
+    def __init__(self, db_path:str="page_cache.sqlite", max_bytes:int=500_000_000, max_age:float|None=30 * 24 * 3600):
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                html BLOB NOT NULL,
+                hash TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                records TEXT
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_fetched_at ON pages (fetched_at)")
+        self._conn.commit()
+
+    def get(self, url:str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT html, hash, fetched_at, records FROM pages WHERE url = ?",
+                (normalize_url(url),)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        html, page_hash, fetched_at, records = row
+        if self.max_age is not None and fetched_at < time.time() - self.max_age:
+            return None
+
+        return {
+            "html": zlib.decompress(html).decode("utf-8"),
+            "hash": page_hash,
+            "fetched_at": fetched_at,
+            "records": None if records is None else json.loads(records)
+        }
+
+    def put(self, url:str, html:str, records:list[dict]|None=None):
+        page_hash = content_hash(html)
+        compressed = zlib.compress(html.encode("utf-8"), 6)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, html, hash, fetched_at, size, records) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    normalize_url(url),
+                    compressed,
+                    page_hash,
+                    time.time(),
+                    len(compressed),
+                    None if records is None else json.dumps([as_dict(record) for record in records], ensure_ascii=False)
+                )
+            )
+            self._conn.commit()
+
+        self.evict()
+        return page_hash
+
+    def is_unchanged(self, url:str, html:str):
+        cached = self.get(url)
+        return cached is not None and cached["hash"] == content_hash(html)
+
+    def evict(self):
+        with self._lock:
+            if self.max_age is not None:
+                self._conn.execute("DELETE FROM pages WHERE fetched_at < ?", (time.time() - self.max_age,))
+
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                freed = 0
+                urls = []
+                for url, size in self._conn.execute("SELECT url, size FROM pages ORDER BY fetched_at"):
+                    if freed >= excess:
+                        break
+                    urls.append((url,))
+                    freed += size
+                self._conn.executemany("DELETE FROM pages WHERE url = ?", urls)
+
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages"
+            ).fetchone()
+        return {"entries": entries, "bytes": size}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
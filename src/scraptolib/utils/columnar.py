@@ -0,0 +1,216 @@
+import itertools, json, threading
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.feather as feather
+except ImportError: # optional dependency, see the "parquet" extra
+    pa = None
+
+from scraptolib.utils.records import Card, Profile, PriceEntry, HistoryEntry
+from scraptolib.utils.sinks import read_jsonl
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Columnar export requires pyarrow: pip install scraptolib[parquet]")
+
+def card_schema():
+    _require_pyarrow()
+    return pa.schema([
+        ("page", pa.string()),
+        ("query", pa.string()),
+        ("place", pa.string()),
+        ("practitioner", pa.string()),
+        ("title", pa.string()),
+        ("address", pa.string()),
+        ("city", pa.string()),
+    ])
+
+def profile_schema():
+    _require_pyarrow()
+    return pa.schema([
+        ("location_name", pa.string()),
+        ("location_url", pa.string()),
+        ("name", pa.string()),
+        ("speciality", pa.string()),
+        ("is_establishment", pa.bool_()),
+        ("address", pa.string()),
+        ("skills", pa.list_(pa.string())),
+        ("languages", pa.list_(pa.string())),
+        ("summary", pa.string()),
+        ("website", pa.string()),
+        ("contact_details", pa.string()),
+        ("prices", pa.list_(pa.struct([("label", pa.string()), ("price", pa.string())]))),
+        ("history", pa.list_(pa.struct([("section", pa.string()), ("year", pa.string()), ("label", pa.string())]))),
+        ("scrap_timestamp", pa.timestamp("s")),
+    ])
+
+SCHEMAS = {
+    "card": card_schema,
+    "profile": profile_schema,
+}
+
+RECORD_TYPES = {
+    "card": Card,
+    "profile": Profile,
+}
+
+class ColumnarWriter:
+    """
+    Batching Parquet (or Arrow IPC) writer for cards or profiles, with a typed schema.
+
+    Records (dicts as written by the scrapers, or `Card`/`Profile`) are buffered and written as one
+    row group every `batch_size` rows, so memory stays bounded whatever the dataset size and readers
+    can load only the columns they need. It has the `write`/`write_many` interface of `JsonlSink`,
+    so the scrapers can stream into it directly. The writer is thread-safe.
+
+    Methods
+    -------
+    __init__(target_path: str, kind: str = "profile", fmt: str = "parquet", batch_size: int = 10_000, compression: str = "zstd")
+        `kind` is "card" or "profile", `fmt` "parquet" or "arrow" (IPC file).
+
+    write(record: Dict | Card | Profile)
+        Appends one record.
+
+    write_many(records: List[Dict | Card | Profile])
+        Appends several records.
+
+    flush()
+        Writes the buffered rows as a row group.
+
+    close()
+        Flushes and closes the file. The writer is also a context manager.
+    """
+
+    def __init__(self, target_path:str, kind:str="profile", fmt:str="parquet", batch_size:int=10_000, compression:str="zstd"):
+        _require_pyarrow()
+        if kind not in SCHEMAS:
+            raise ValueError(f"Unknown record kind: {kind}")
+
+        self.kind = kind
+        self.schema = SCHEMAS[kind]()
+        self.batch_size = batch_size
+        self.count = 0
+
+        self._rows = []
+        self._lock = threading.Lock()
+        if fmt == "parquet":
+            self._writer = pq.ParquetWriter(str(target_path), self.schema, compression=compression)
+        elif fmt == "arrow":
+            self._sink = pa.OSFile(str(target_path), "wb")
+            self._writer = pa.ipc.new_file(
+                self._sink, self.schema, options=pa.ipc.IpcWriteOptions(compression=compression)
+            )
+        else:
+            raise ValueError(f"Unknown columnar format: {fmt}")
+        self.fmt = fmt
+
+    def _row(self, record):
+        if isinstance(record, dict):
+            record = RECORD_TYPES[self.kind].from_dict(record)
+        return record.to_row()
+
+    def write(self, record):
+        with self._lock:
+            self._rows.append(self._row(record))
+            self.count += 1
+            if len(self._rows) >= self.batch_size:
+                self._flush()
+
+    def write_many(self, records):
+        with self._lock:
+            for record in records:
+                self._rows.append(self._row(record))
+                self.count += 1
+                if len(self._rows) >= self.batch_size:
+                    self._flush()
+
+    def _flush(self):
+        if self._rows:
+            self._writer.write_table(pa.Table.from_pylist(self._rows, schema=self.schema))
+            self._rows = []
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            if self._writer is None:
+                return
+            self._flush()
+            self._writer.close()
+            if self.fmt == "arrow":
+                self._sink.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_table(source_path:str, columns:list[str]|None=None):
+    """
+    Reads a file written by `ColumnarWriter` (Parquet or Arrow IPC) as a `pyarrow.Table`,
+    loading only `columns` if given.
+    """
+    _require_pyarrow()
+    if str(source_path).endswith((".arrow", ".feather", ".ipc")):
+        return feather.read_table(str(source_path), columns=columns)
+    return pq.read_table(str(source_path), columns=columns)
+
+def _from_row(kind:str, row:dict):
+    if kind == "card":
+        return Card(**row)
+    row["prices"] = None if row["prices"] is None else [PriceEntry(**entry) for entry in row["prices"]]
+    row["history"] = None if row["history"] is None else [HistoryEntry(**entry) for entry in row["history"]]
+    return Profile(**row)
+
+def read_records(source_path:str, kind:str="profile"):
+    """
+    Yields the `Card`s or `Profile`s of a columnar file, batch by batch.
+    """
+    for batch in read_table(source_path).to_batches():
+        for row in batch.to_pylist():
+            yield _from_row(kind, row)
+
+def json_to_columnar(source_path:str, target_path:str, kind:str|None=None, fmt:str="parquet", batch_size:int=10_000):
+    """
+    Converts a JSON array or JSON Lines output of the scrapers to Parquet/Arrow.
+    `kind` is guessed from the first record if not given. Returns the number of records.
+    """
+    with open(source_path, "r", encoding="utf-8") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+
+    if first == "[":
+        with open(source_path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+    else:
+        records = read_jsonl(source_path)
+
+    records = iter(records)
+    first_record = next(records, None)
+    if first_record is None:
+        records = []
+    else:
+        records = itertools.chain([first_record], records)
+        if kind is None:
+            kind = "profile" if "location" in first_record else "card"
+    kind = kind or "card"
+
+    with ColumnarWriter(target_path, kind=kind, fmt=fmt, batch_size=batch_size) as writer:
+        writer.write_many(records)
+    return writer.count
+
+def columnar_to_json(source_path:str, target_path:str, kind:str="profile"):
+    """
+    Converts a columnar file back to the JSON array format of `store_json_data`.
+    """
+    with open(target_path, "w", encoding="utf-8") as f:
+        json.dump(
+            [record.to_dict() for record in read_records(source_path, kind)],
+            f, indent=4, ensure_ascii=False
+        )
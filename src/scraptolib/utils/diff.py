@@ -0,0 +1,167 @@
+import copy, json
+
+from scraptolib.utils.frontier import normalize_url
+from scraptolib.utils.records import as_dict
+from scraptolib.utils.sinks import JsonlSink, read_jsonl
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+# Stamped on every run, never a change in itself
+IGNORED_FIELDS = ("scrap_timestamp",)
+
+# Unordered lists, diffed item by item
+SET_FIELDS = ("skills", "languages")
+
+# Dicts (price per act, history per section), diffed key by key
+MAPPING_FIELDS = ("prices", "history")
+
+def record_key(record:dict):
+    """
+    Key of a profile record: the normalized URL of its location.
+    """
+    return normalize_url(record["location"][1])
+
+def load_snapshot(source_path:str):
+    """
+    Reads a run's profile records, from a JSON array (`store_json_data`) or a JSON Lines file
+    (`JsonlSink`), as a dict keyed by `record_key`.
+    """
+    with open(source_path, "r", encoding="utf-8") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+
+    if first == "[":
+        with open(source_path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+    else:
+        records = read_jsonl(source_path)
+
+    return {record_key(record): record for record in records}
+
+def diff_field(field:str, old, new):
+    """
+    Change of one field, None if equal.
+    Set fields are compared regardless of order and give `added`/`removed` items, mapping fields `added`/`removed`/`changed` keys,
+    any other field (or a field switching type, e.g. from "" when missing) its `old` and `new` values.
+    """
+    # tuples of freshly scraped records (location, speciality) are lists once read back from JSON
+    old = list(old) if isinstance(old, tuple) else old
+    new = list(new) if isinstance(new, tuple) else new
+    if old == new:
+        return None
+
+    if field in SET_FIELDS and isinstance(old, list) and isinstance(new, list):
+        added = [item for item in new if item not in old]
+        removed = [item for item in old if item not in new]
+        if not added and not removed:
+            return None # same items, reordered
+        return {ADDED: added, REMOVED: removed}
+
+    if field in MAPPING_FIELDS and isinstance(old, dict) and isinstance(new, dict):
+        return {
+            ADDED: {key: value for key, value in new.items() if key not in old},
+            REMOVED: {key: value for key, value in old.items() if key not in new},
+            CHANGED: {
+                key: {"old": old[key], "new": value}
+                for key, value in new.items()
+                if key in old and old[key] != value
+            }
+        }
+
+    return {"old": old, "new": new}
+
+def diff_record(old:dict, new:dict):
+    """
+    Changed fields between two records of the same location, as `{field: change}` (see `diff_field`).
+    """
+    changes = {}
+    for field in dict.fromkeys([*old, *new]):
+        if field in IGNORED_FIELDS:
+            continue
+        change = diff_field(field, old.get(field, ""), new.get(field, ""))
+        if change is not None:
+            changes[field] = change
+    return changes
+
+def diff_snapshots(old:dict, new, full:bool=True):
+    """
+    Yields the change events from snapshot `old` (as given by `load_snapshot`) to the records `new`
+    (a snapshot dict or any iterable of record dicts or `Profile`s):
+
+    - {"type": "added", "key", "scrap_timestamp", "record"} for a new location
+    - {"type": "changed", "key", "scrap_timestamp", "fields"} with the changed fields (see `diff_record`)
+    - {"type": "removed", "key"} for a location missing from `new`, only if `full`
+      (set it to False when `new` only covers part of the dataset)
+
+    Unchanged records yield nothing.
+    """
+    records = new.values() if isinstance(new, dict) else new
+
+    seen = set()
+    for record in records:
+        record = as_dict(record)
+        key = record_key(record)
+        seen.add(key)
+
+        previous = old.get(key)
+        if previous is None:
+            yield {"type": ADDED, "key": key, "scrap_timestamp": record.get("scrap_timestamp"), "record": record}
+            continue
+
+        fields = diff_record(previous, record)
+        if fields:
+            yield {"type": CHANGED, "key": key, "scrap_timestamp": record.get("scrap_timestamp"), "fields": fields}
+
+    if full:
+        for key in old:
+            if key not in seen:
+                yield {"type": REMOVED, "key": key}
+
+def apply_field(field:str, value, change:dict):
+    """
+    Applies a `diff_field` change to the old `value` of the field.
+    """
+    if "new" in change:
+        return change["new"]
+
+    if field in SET_FIELDS:
+        return [item for item in value if item not in change[REMOVED]] + change[ADDED]
+
+    value = {key: item for key, item in value.items() if key not in change[REMOVED]}
+    value.update({key: item["new"] for key, item in change[CHANGED].items()})
+    value.update(change[ADDED])
+    return value
+
+def apply_changes(snapshot:dict, changes):
+    """
+    Returns a copy of `snapshot` updated with change events, e.g. to rebuild the current dataset
+    from the last full snapshot and the change feeds written since.
+    """
+    snapshot = copy.deepcopy(snapshot)
+    for event in changes:
+        key = event["key"]
+        if event["type"] == ADDED:
+            snapshot[key] = event["record"]
+        elif event["type"] == REMOVED:
+            snapshot.pop(key, None)
+        else:
+            record = snapshot[key]
+            for field, change in event["fields"].items():
+                record[field] = apply_field(field, record.get(field, ""), change)
+            record["scrap_timestamp"] = event["scrap_timestamp"]
+    return snapshot
+
+def write_change_feed(old_path:str, new_path:str, target_path:str, full:bool=True):
+    """
+    Diffs two snapshot files and appends the change events to the JSON Lines file `target_path`.
+    Returns the number of events per type.
+    """
+    counts = {ADDED: 0, CHANGED: 0, REMOVED: 0}
+    with JsonlSink(target_path) as sink:
+        for event in diff_snapshots(load_snapshot(old_path), load_snapshot(new_path), full=full):
+            sink.write(event)
+            counts[event["type"]] += 1
+    return counts
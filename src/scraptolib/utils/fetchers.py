@@ -0,0 +1,108 @@
+import threading
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError: # optional dependency, see the "http" extra
+    requests = None
+
+try:
+    import httpx
+except ImportError: # optional, only needed for backend="httpx" (HTTP/2)
+    httpx = None
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0 Safari/537.36"
+
+class HttpFetcher:
+    """
+    Pooled HTTP client fetching server-rendered pages without a browser.
+
+    Connections are kept alive and reused, responses are gzip/deflate-compressed, and with the
+    "httpx" backend requests go over HTTP/2. Cookies and user agent can be copied from a
+    Selenium driver so requests share the browser session (consent, anti-bot cookies, ...).
+    Scrapers given a fetcher try it first and fall back to Selenium when the response lacks the
+    expected content (see `Scraper.fetch_parser`).
+
+    Methods
+    -------
+    __init__(backend: str = "requests", pool_size: int = 10, timeout: float = 15, user_agent: str = DEFAULT_USER_AGENT)
+        `backend` is "requests" (`pip install scraptolib[http]`) or "httpx" (HTTP/2, needs `httpx[http2]`).
+
+    from_driver(driver, **kwargs) -> HttpFetcher
+        Builds a fetcher sharing the cookies and user agent of a Selenium driver.
+
+    update_cookies(driver)
+        Copies the driver's current cookies into the session.
+
+    fetch(url: str) -> str | None
+        Returns the HTML of `url`, None on network error or non-200 status.
+
+    close()
+        Closes the pooled connections.
+    """
+
+    def __init__(self, backend:str="requests", pool_size:int=10, timeout:float=15, user_agent:str=DEFAULT_USER_AGENT):
+        self.backend = backend
+        self.timeout = timeout
+        self._lock = threading.Lock()
+
+        headers = {
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
+            "Accept-Encoding": "gzip, deflate",
+        }
+
+        if backend == "requests":
+            if requests is None:
+                raise ImportError("HttpFetcher requires requests: pip install scraptolib[http]")
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            self.session.headers.update(headers)
+        elif backend == "httpx":
+            if httpx is None:
+                raise ImportError("The httpx backend requires httpx: pip install httpx[http2]")
+            self.session = httpx.Client(
+                http2=True,
+                headers=headers,
+                timeout=timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            )
+        else:
+            raise ValueError(f"Unknown HTTP backend: {backend}")
+
+    @classmethod
+    def from_driver(cls, driver, **kwargs):
+        kwargs.setdefault("user_agent", driver.execute_script("return navigator.userAgent;"))
+        fetcher = cls(**kwargs)
+        fetcher.update_cookies(driver)
+        return fetcher
+
+    def update_cookies(self, driver):
+        with self._lock:
+            for cookie in driver.get_cookies():
+                self.session.cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain", ""),
+                    path=cookie.get("path", "/")
+                )
+
+    def fetch(self, url:str):
+        try:
+            if self.backend == "requests":
+                response = self.session.get(url, timeout=self.timeout)
+            else:
+                response = self.session.get(url)
+        except Exception:
+            return None
+
+        if response.status_code != 200:
+            return None
+        return response.text
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,99 @@
+"""
+Turn raw element texts into the values stored in scraped records.
+
+Every extraction path (live WebDriver getters, single-script extraction, ...)
+goes through these functions so they all produce the same output schema.
+"""
+
+def format_skills(text:str):
+    return text.split("\n")
+
+def format_languages(text:str):
+    return text.split('\n')[-1].replace(",", "").replace("et ", "").split()
+
+def format_contact_details(text:str):
+    return text.replace(" ", "")
+
+def format_prices(texts:list[str]):
+    extraction = [text.split("\n") for text in texts]
+    return {
+        elem[0]:elem[1]
+        for elem in extraction
+    }
+
+def format_history(texts:list[str]):
+    extraction = [text.split('\n') for text in texts]
+
+    output = {}
+    for elem in extraction:
+        key = elem[0]
+        try: # when there are dates
+            value = [{"year":elem[i+1], "label":elem[i+2]} for i in range(0, len(elem)-1, 2)]
+            output[key] = value
+        except IndexError: # when not
+            output[key] = {"year":"undefined", "label":elem[1:]}
+    return output
+
+def missing_sections(raw:dict):
+    """
+    Names of the sections absent from a raw profile (see `format_profile`).
+    """
+    return [
+        key for key, value in raw.items()
+        if key != "is_establishment" and value is None
+    ]
+
+def format_profile(raw:dict):
+    """
+    Build the profile fields from raw texts, as returned by the in-page extraction
+    script or `HtmlParser.get_raw_profile`. Missing sections (None) become "".
+    """
+    def formatted(key, formatter=None):
+        value = raw.get(key)
+        if value is None:
+            return ""
+        return formatter(value) if formatter else value
+
+    speciality = raw.get("speciality")
+
+    return {
+        "name": formatted("name"),
+        "speciality": "" if speciality is None else (speciality, raw.get("is_establishment", False)),
+        "address": formatted("address"),
+        "skills": formatted("skills", format_skills),
+        "languages": formatted("languages", format_languages),
+        "summary": formatted("summary"),
+        "website": formatted("website"),
+        "contact_details": formatted("contact_details", format_contact_details),
+        "prices": formatted("prices", format_prices),
+        "history": formatted("history", format_history)
+    }
+
+def format_card(href:str, content:list[str], query_input:str, place_input:str, only_href:bool=False):
+    if only_href:
+        return {
+            "Page_doctolib":href.split('&')[0],
+            "Nom_Recherche":query_input,
+            "Lieu_Recherche":place_input
+        }
+
+    return {
+        "Pratiquant":content[0],
+        "Intitulé":content[1],
+        "Adresse":content[2],
+        "Ville":content[3],
+        "Page_doctolib":href.split('&')[0],
+        "Nom_Recherche":query_input,
+        "Lieu_Recherche":place_input
+    }
+
+def format_location(raw:dict):
+    """
+    Location-level fields only (see `LOCATION_FIELDS`), from a raw location as returned by
+    `HtmlParser.get_raw_location`. Missing sections (None) become "".
+    """
+    return {
+        "address": "" if raw.get("address") is None else raw["address"],
+        "contact_details": "" if raw.get("contact_details") is None else format_contact_details(raw["contact_details"]),
+        "prices": "" if raw.get("prices") is None else format_prices(raw["prices"])
+    }
@@ -0,0 +1,162 @@
+import sqlite3, threading, time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+def normalize_url(url:str):
+    """
+    Canonical form used as frontier key: lowercase scheme and host, no fragment,
+    no trailing slash and sorted query parameters.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+class Frontier:
+    """
+    On-disk record of the URLs to scrape, shared across runs and scrapers (SQLite).
+
+    Each normalized URL has a status (pending/done/failed) and the time it was last scraped.
+    A done URL is fetched again only once it is older than `ttl`.
+    The frontier is thread-safe, so one instance can be shared by the workers of a `ProfilePool`.
+
+    Methods
+    -------
+    __init__(db_path: str = "frontier.sqlite", ttl: float | None = None)
+        Opens (or creates) the database. `ttl` is in seconds; None means done URLs are never refreshed.
+
+    add(urls: List[str]) -> int
+        Registers URLs as pending, ignoring the ones already known. Returns how many were new.
+
+    should_fetch(url: str) -> bool
+        True if the URL is unknown, pending, failed, or done longer than `ttl` ago.
+
+    mark_done(url: str)
+        Marks the URL as scraped now.
+
+    mark_failed(url: str, error: str = "")
+        Marks the URL as failed and increments its attempt count.
+
+    pending(limit: int | None = None) -> List[str]
+        URLs still to be scraped (pending, failed, or expired), oldest first.
+
+    status(url: str) -> str | None
+        Current status of the URL, None if unknown.
+
+    stats() -> Dict[str, int]
+        Number of URLs per status.
+
+    close()
+        Closes the database.
+    """
+
+    def __init__(self, db_path:str="frontier.sqlite", ttl:float|None=None):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS frontier (
+                url TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                added_at REAL NOT NULL,
+                last_scraped REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS frontier_status ON frontier (status)")
+        self._conn.commit()
+
+    def _expired_before(self):
+        return None if self.ttl is None else time.time() - self.ttl
+
+    def add(self, urls:list[str]):
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.executemany(
+                "INSERT OR IGNORE INTO frontier (url, status, added_at) VALUES (?, ?, ?)",
+                [(normalize_url(url), PENDING, now) for url in urls]
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def should_fetch(self, url:str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, last_scraped FROM frontier WHERE url = ?",
+                (normalize_url(url),)
+            ).fetchone()
+
+        if row is None or row[0] != DONE:
+            return True
+
+        expired_before = self._expired_before()
+        return expired_before is not None and row[1] < expired_before
+
+    def mark_done(self, url:str):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO frontier (url, status, added_at, last_scraped, attempts) VALUES (?, ?, ?, ?, 1)
+                ON CONFLICT(url) DO UPDATE SET
+                    status = excluded.status,
+                    last_scraped = excluded.last_scraped,
+                    attempts = attempts + 1,
+                    error = NULL
+                """,
+                (normalize_url(url), DONE, now, now)
+            )
+            self._conn.commit()
+
+    def mark_failed(self, url:str, error:str=""):
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO frontier (url, status, added_at, attempts, error) VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    status = excluded.status,
+                    attempts = attempts + 1,
+                    error = excluded.error
+                """,
+                (normalize_url(url), FAILED, time.time(), error)
+            )
+            self._conn.commit()
+
+    def pending(self, limit:int|None=None):
+        expired_before = self._expired_before()
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT url FROM frontier
+                WHERE status != ? OR (? IS NOT NULL AND last_scraped < ?)
+                ORDER BY added_at
+                LIMIT ?
+                """,
+                (DONE, expired_before, expired_before, -1 if limit is None else limit)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def status(self, url:str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM frontier WHERE url = ?",
+                (normalize_url(url),)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def stats(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM frontier GROUP BY status"
+            ).fetchall()
+        return {PENDING: 0, DONE: 0, FAILED: 0, **dict(rows)}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,5 +1,6 @@
-import time, random, logging, json
+import time, random, logging, json, os
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
 def human_delay(lowest:int=5, low:int=1, high:int=2, alpha:float=1):
     time.sleep(random.uniform(min(low, lowest), high*alpha))
@@ -8,6 +9,10 @@ def init_logger():
     lg = logging.getLogger(__name__)
     lg.setLevel(logging.INFO)
 
+    # scrapers share this logger: only attach the handler once
+    if lg.handlers:
+        return lg
+
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
 
@@ -20,6 +25,24 @@ def init_logger():
 
     return lg
 
+def page_number(url:str):
+    """
+    Search page number of `url` (its `page` query parameter), 1 if absent.
+    """
+    for key, value in parse_qsl(urlsplit(url).query):
+        if key == "page" and value.isdigit():
+            return int(value)
+    return 1
+
+def page_url(url:str, page:int):
+    """
+    `url` with its `page` query parameter set to `page`, the other parameters kept in order.
+    """
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != "page"]
+    query.append(("page", str(page)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
 def store_json_data(data:list[dict], target_path:str):
     """
     Store line by line
@@ -32,7 +55,33 @@ def store_json_data(data:list[dict], target_path:str):
         with open(path, "r", encoding="utf-8") as f:
             output = json.load(f)
 
-    output += data
+    output += [record if isinstance(record, dict) else record.to_dict() for record in data]
 
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=4, ensure_ascii=False)
\ No newline at end of file
+        json.dump(output, f, indent=4, ensure_ascii=False)
+
+def save_checkpoint(checkpoint:dict, checkpoint_path:str):
+    """
+    Atomically replace the checkpoint file, so a crash never leaves a half-written one.
+    """
+    path = Path(checkpoint_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+
+def load_checkpoint(checkpoint_path:str):
+    """
+    Returns the checkpoint stored at `checkpoint_path`, or None if there is none.
+    """
+    path = Path(checkpoint_path)
+
+    if not path.exists():
+        return None
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,171 @@
+import functools, json, threading, time
+from contextlib import contextmanager
+
+class Metrics:
+    """
+    Wall-time and event counters for the hot paths of the scrapers.
+
+    Every scraper owns one (or shares one passed at init), recording the time spent per phase
+    (navigation, cookies, readiness waits, pauses, each `get_*` getter, ...) and counting events
+    such as timeouts or "Retry later" pages. It is thread-safe, so a pool of workers can share it.
+
+    Methods
+    -------
+    timer(phase: str)
+        Context manager recording the wall time of its block under `phase`.
+
+    record(phase: str, seconds: float)
+        Records a duration measured elsewhere.
+
+    incr(event: str, label: str = "", value: int = 1)
+        Increments the `event` counter, optionally split by `label` (e.g. the getter that timed out).
+
+    summary() -> Dict
+        `timings` (count, total, mean and max seconds per phase) and `counters`.
+
+    to_json() -> str
+        Summary as JSON.
+
+    to_prometheus(prefix: str = "scraptolib") -> str
+        Summary in the Prometheus text exposition format.
+
+    dump(target_path: str, fmt: str = "json")
+        Writes the summary to a file, as "json" or "prometheus".
+
+    reset()
+        Clears everything, e.g. between two runs.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.timings = {}
+            self.counters = {}
+
+    @contextmanager
+    def timer(self, phase:str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def record(self, phase:str, seconds:float):
+        with self._lock:
+            timing = self.timings.setdefault(phase, {"count": 0, "total": 0.0, "max": 0.0})
+            timing["count"] += 1
+            timing["total"] += seconds
+            timing["max"] = max(timing["max"], seconds)
+
+    def incr(self, event:str, label:str="", value:int=1):
+        with self._lock:
+            self.counters[(event, label)] = self.counters.get((event, label), 0) + value
+
+    def summary(self):
+        with self._lock:
+            timings = {
+                phase: {
+                    "count": timing["count"],
+                    "total": round(timing["total"], 4),
+                    "mean": round(timing["total"] / timing["count"], 4),
+                    "max": round(timing["max"], 4)
+                }
+                for phase, timing in sorted(self.timings.items())
+            }
+            labelled = {event for event, label in self.counters if label}
+            counters = {}
+            for (event, label), value in sorted(self.counters.items()):
+                if event in labelled:
+                    counters.setdefault(event, {})[label] = value
+                else:
+                    counters[event] = value
+        return {"timings": timings, "counters": counters}
+
+    def to_json(self):
+        return json.dumps(self.summary(), indent=4, ensure_ascii=False)
+
+    def to_prometheus(self, prefix:str="scraptolib"):
+        with self._lock:
+            timings = sorted(self.timings.items())
+            counters = sorted(self.counters.items())
+
+        lines = [
+            f"# TYPE {prefix}_phase_seconds summary",
+        ]
+        for phase, timing in timings:
+            lines.append(f'{prefix}_phase_seconds_sum{{phase="{phase}"}} {timing["total"]:.6f}')
+            lines.append(f'{prefix}_phase_seconds_count{{phase="{phase}"}} {timing["count"]}')
+
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for (event, label), value in counters:
+            labels = f'event="{event}"' + (f',label="{label}"' if label else "")
+            lines.append(f"{prefix}_events_total{{{labels}}} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def dump(self, target_path:str, fmt:str="json"):
+        if fmt == "json":
+            content = self.to_json()
+        elif fmt == "prometheus":
+            content = self.to_prometheus()
+        else:
+            raise ValueError(f"Unknown metrics format: {fmt}")
+
+        with open(target_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+def timed(phase:str):
+    """
+    Decorator recording the wall time of a scraper method in `self.metrics` under `phase`.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.timer(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+def page_stats(metrics, profile:str="default"):
+    """
+    Per-page averages recorded by `Scraper.navigate` for a driver profile, None if no page was loaded.
+    `metrics` is a `Metrics` or one of its summaries.
+    """
+    summary = metrics.summary() if isinstance(metrics, Metrics) else metrics
+    counters = summary["counters"]
+
+    pages = counters.get("pages", {}).get(profile, 0)
+    if not pages:
+        return None
+
+    load = summary["timings"].get(f"page_load[{profile}]")
+    return {
+        "pages": pages,
+        "bytes_per_page": counters.get("page_bytes", {}).get(profile, 0) / pages,
+        "requests_per_page": counters.get("page_requests", {}).get(profile, 0) / pages,
+        "load_seconds_per_page": load["mean"] if load else None
+    }
+
+def compare_page_stats(baseline, candidate, baseline_profile:str="default", candidate_profile:str="fast"):
+    """
+    Bytes and load time saved per page by `candidate_profile` compared with `baseline_profile`.
+    Both runs may share the same `Metrics`, since page stats are labelled by profile.
+    """
+    before = page_stats(baseline, baseline_profile)
+    after = page_stats(candidate, candidate_profile)
+    if before is None or after is None:
+        raise ValueError("Both profiles need at least one loaded page to be compared")
+
+    seconds_saved = None
+    if before["load_seconds_per_page"] is not None and after["load_seconds_per_page"] is not None:
+        seconds_saved = round(before["load_seconds_per_page"] - after["load_seconds_per_page"], 4)
+
+    return {
+        baseline_profile: before,
+        candidate_profile: after,
+        "bytes_saved_per_page": round(before["bytes_per_page"] - after["bytes_per_page"]),
+        "seconds_saved_per_page": seconds_saved
+    }
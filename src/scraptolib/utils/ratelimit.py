@@ -0,0 +1,110 @@
+import asyncio, random, threading, time
+
+class RateLimiter:
+    """
+    Shared token-bucket limiter with AIMD rate control, meant to replace the fixed
+    `human_delay` pauses and the flat 1200s "Retry later" backoff.
+
+    The rate grows additively while pages load cleanly and is cut multiplicatively
+    when a "Retry later" page is hit. One instance can be shared by every scraper and worker
+    (it is thread-safe), so the whole crawl stays under a single request budget.
+
+    Methods
+    -------
+    __init__(rate: float = 0.5, min_rate: float = 0.05, max_rate: float = 2.0, increase: float = 0.05,
+             decrease: float = 0.5, burst: int = 1, backoff_base: float = 30, backoff_max: float = 1200, jitter: float = 0.25)
+        `rate`, `min_rate` and `max_rate` are in requests per second. Each success adds `increase`
+        to the rate, each "Retry later" multiplies it by `decrease`. `burst` is the bucket size.
+
+    reserve() -> float
+        Takes a token and returns how long the caller must wait before using it.
+
+    acquire()
+        Blocks until a token is available.
+
+    acquire_async()
+        Awaitable `acquire`: waits on the event loop instead of blocking the thread.
+
+    on_success()
+        Reports a cleanly loaded page: raises the rate.
+
+    on_retry_later()
+        Reports a "Retry later" page: cuts the rate.
+
+    backoff_delay(attempt: int) -> float
+        Exponential backoff with jitter for the `attempt`-th consecutive "Retry later" (starting at 0).
+
+    stats() -> Dict
+        Current rate, number of requests, successes and "Retry later" hits, and total time waited.
+    """
+
+    def __init__(self, rate:float=0.5, min_rate:float=0.05, max_rate:float=2.0, increase:float=0.05,
+                 decrease:float=0.5, burst:int=1, backoff_base:float=30, backoff_max:float=1200, jitter:float=0.25):
+        self.rate = min(max_rate, max(min_rate, rate))
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.burst = burst
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+
+        self.requests = 0
+        self.successes = 0
+        self.retry_later_hits = 0
+        self.waited = 0.0
+
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def reserve(self):
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            self.requests += 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            # jitter keeps parallel workers from firing in lockstep
+            wait *= random.uniform(1, 1 + self.jitter)
+            self.waited += wait
+            return wait
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            self.successes += 1
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_retry_later(self):
+        with self._lock:
+            self.retry_later_hits += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+    def backoff_delay(self, attempt:int):
+        delay = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+        return random.uniform(delay * (1 - self.jitter), delay)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "rate": round(self.rate, 4),
+                "requests": self.requests,
+                "successes": self.successes,
+                "retry_later_hits": self.retry_later_hits,
+                "waited_seconds": round(self.waited, 3)
+            }
@@ -0,0 +1,236 @@
+import datetime, json, sys
+from dataclasses import dataclass
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Year of the history sections whose entries have no dates
+UNDEFINED_YEAR = "undefined"
+
+def _none_if_empty(value):
+    return None if value == "" else value
+
+def _intern(value):
+    # repeated across records (query, place, specialty, city, section titles, ...): stored once
+    return None if value is None else sys.intern(value)
+
+def _empty_if_none(value):
+    return "" if value is None else value
+
+# Records are slotted (no per-instance __dict__) so millions of them stay compact in memory
+
+@dataclass(slots=True)
+class Card:
+    """
+    Typed search result card. The content fields are None for `only_href` cards.
+    """
+    page: str
+    query: str
+    place: str
+    practitioner: str | None = None
+    title: str | None = None
+    address: str | None = None
+    city: str | None = None
+
+    @classmethod
+    def from_dict(cls, data:dict):
+        return cls(
+            page=data["Page_doctolib"],
+            query=_intern(data["Nom_Recherche"]),
+            place=_intern(data["Lieu_Recherche"]),
+            practitioner=data.get("Pratiquant"),
+            title=_intern(data.get("Intitulé")),
+            address=data.get("Adresse"),
+            city=_intern(data.get("Ville"))
+        )
+
+    def to_dict(self):
+        if self.practitioner is None: # only_href card
+            return {
+                "Page_doctolib": self.page,
+                "Nom_Recherche": self.query,
+                "Lieu_Recherche": self.place
+            }
+        return {
+            "Pratiquant": self.practitioner,
+            "Intitulé": self.title,
+            "Adresse": self.address,
+            "Ville": self.city,
+            "Page_doctolib": self.page,
+            "Nom_Recherche": self.query,
+            "Lieu_Recherche": self.place
+        }
+
+    def to_row(self):
+        return {
+            "page": self.page,
+            "query": self.query,
+            "place": self.place,
+            "practitioner": self.practitioner,
+            "title": self.title,
+            "address": self.address,
+            "city": self.city
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+@dataclass(slots=True)
+class PriceEntry:
+    label: str
+    price: str
+
+@dataclass(slots=True)
+class HistoryEntry:
+    """
+    One line of a history section. Sections without dates have `year` None, and a dated section
+    without any line is kept as a single entry with `year` and `label` None.
+    """
+    section: str
+    year: str | None
+    label: str | None
+
+@dataclass(slots=True)
+class Profile:
+    """
+    Typed profile record of one location.
+
+    The JSON layout of `ProfileScraper` is normalized: missing sections ("") are None,
+    `speciality` is split from `is_establishment`, `prices` and `history` are lists of entries
+    and `scrap_timestamp` is a datetime. `from_dict` and `to_dict` convert losslessly,
+    `to_row` gives the flat columns of the Parquet schema and `to_json` a compact JSON line.
+    """
+    location_name: str
+    location_url: str
+    name: str | None = None
+    speciality: str | None = None
+    is_establishment: bool | None = None
+    address: str | None = None
+    skills: list[str] | None = None
+    languages: list[str] | None = None
+    summary: str | None = None
+    website: str | None = None
+    contact_details: str | None = None
+    prices: list[PriceEntry] | None = None
+    history: list[HistoryEntry] | None = None
+    scrap_timestamp: datetime.datetime | None = None
+
+    @classmethod
+    def from_dict(cls, data:dict):
+        speciality = _none_if_empty(data.get("speciality", ""))
+        prices = _none_if_empty(data.get("prices", ""))
+        history = _none_if_empty(data.get("history", ""))
+        skills = _none_if_empty(data.get("skills", ""))
+        languages = _none_if_empty(data.get("languages", ""))
+        timestamp = data.get("scrap_timestamp")
+
+        return cls(
+            location_name=_intern(data["location"][0]),
+            location_url=data["location"][1],
+            name=_none_if_empty(data.get("name", "")),
+            speciality=None if speciality is None else _intern(speciality[0]),
+            is_establishment=None if speciality is None else speciality[1],
+            address=_none_if_empty(data.get("address", "")),
+            skills=None if skills is None else [_intern(skill) for skill in skills],
+            languages=None if languages is None else [_intern(language) for language in languages],
+            summary=_none_if_empty(data.get("summary", "")),
+            website=_none_if_empty(data.get("website", "")),
+            contact_details=_none_if_empty(data.get("contact_details", "")),
+            prices=None if prices is None else [PriceEntry(_intern(label), _intern(price)) for label, price in prices.items()],
+            history=None if history is None else history_entries(history),
+            scrap_timestamp=None if timestamp is None else datetime.datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+        )
+
+    def to_dict(self):
+        record = {
+            "location": (self.location_name, self.location_url),
+            "name": _empty_if_none(self.name),
+            "speciality": "" if self.speciality is None else (self.speciality, self.is_establishment),
+            "address": _empty_if_none(self.address),
+            "skills": _empty_if_none(self.skills),
+            "languages": _empty_if_none(self.languages),
+            "summary": _empty_if_none(self.summary),
+            "website": _empty_if_none(self.website),
+            "contact_details": _empty_if_none(self.contact_details),
+            "prices": "" if self.prices is None else {entry.label: entry.price for entry in self.prices},
+            "history": "" if self.history is None else history_dict(self.history),
+        }
+        if self.scrap_timestamp is not None:
+            record["scrap_timestamp"] = self.scrap_timestamp.strftime(TIMESTAMP_FORMAT)
+        return record
+
+    def to_row(self):
+        return {
+            "location_name": self.location_name,
+            "location_url": self.location_url,
+            "name": self.name,
+            "speciality": self.speciality,
+            "is_establishment": self.is_establishment,
+            "address": self.address,
+            "skills": self.skills,
+            "languages": self.languages,
+            "summary": self.summary,
+            "website": self.website,
+            "contact_details": self.contact_details,
+            "prices": None if self.prices is None else [
+                {"label": entry.label, "price": entry.price} for entry in self.prices
+            ],
+            "history": None if self.history is None else [
+                {"section": entry.section, "year": entry.year, "label": entry.label} for entry in self.history
+            ],
+            "scrap_timestamp": self.scrap_timestamp
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+def history_entries(history:dict):
+    """
+    Flattens the `history` dict of `format_history` (dated lists or undefined-year sections) into entries.
+    The `[year, label]` pairs and bare labels of older outputs are read too, and written back in the current layout.
+    """
+    entries = []
+    for section, value in history.items():
+        section = sys.intern(section)
+        if isinstance(value, dict): # no dates
+            entries += [HistoryEntry(section, None, label) for label in value["label"]]
+        elif not value:
+            entries.append(HistoryEntry(section, None, None))
+        else:
+            for item in value:
+                if isinstance(item, dict):
+                    entries.append(HistoryEntry(section, _intern(item["year"]), item["label"]))
+                elif isinstance(item, str): # undated labels of older outputs
+                    entries.append(HistoryEntry(section, None, item))
+                else: # [year, label] pairs of older outputs
+                    entries.append(HistoryEntry(section, _intern(item[0]), item[1]))
+    return entries
+
+def history_dict(entries:list[HistoryEntry]):
+    """
+    Inverse of `history_entries`.
+    """
+    sections = {}
+    for entry in entries:
+        sections.setdefault(entry.section, []).append(entry)
+
+    history = {}
+    for section, items in sections.items():
+        if items[0].year is None and items[0].label is None:
+            history[section] = []
+        elif items[0].year is None:
+            history[section] = {"year": UNDEFINED_YEAR, "label": [item.label for item in items]}
+        else:
+            history[section] = [{"year": item.year, "label": item.label} for item in items]
+    return history
+
+def as_dict(record):
+    """
+    JSON-ready dict of a record, whether a dict already or a `Card`/`Profile`.
+    """
+    return record if isinstance(record, dict) else record.to_dict()
+
+def to_record(data:dict):
+    """
+    `Card` or `Profile` of a record dict, depending on its keys.
+    """
+    return Profile.from_dict(data) if "location" in data else Card.from_dict(data)
@@ -0,0 +1,49 @@
+"""
+XPath selectors shared by every extraction path.
+
+The live WebDriver getters, the in-page extraction scripts and the offline
+`HtmlParser` all read the page through these expressions, so a markup change
+only has to be fixed here.
+"""
+
+COOKIES_REFUSE_XPATH = "//button[.//span[text()='Refuser']]"
+
+RETRY_LATER_XPATH = (
+    "//pre[contains(., 'Retry later')]"
+    " | "
+    "//span[contains(., \"Désolé, une erreur s'est produite.\")]"
+)
+
+PROFILE_XPATHS = {
+    "locations": "//div[contains(@class, 'dl-pill-list')]//a",
+    "name": "//span[@itemprop='name']",
+    "speciality": "//div[@class='dl-profile-header-speciality']",
+    "establishment_icon": "//div[@class='dl-profile-organization-icon']",
+    "address": "//div[contains(@data-test, 'location')]",
+    "skills": "//div[@class='dl-profile-skills']",
+    "languages": "//h3[contains(text(), 'Langues parlées')]/parent::div",
+    "summary": "//div[contains(@class, 'dl-profile-bio')]",
+    "website": "//h3[contains(text(), 'Site web')]/parent::div//a",
+    "contact_details": "//h3[contains(text(), 'Coordonnées')]/parent::div//div",
+    "prices": "//h2[contains(text(), 'Tarifs')]/parent::div/ul/li",
+    "history": "//div[contains(@class, 'dl-profile-history')]",
+}
+
+# Any of these present means the profile content has rendered
+PROFILE_READY_XPATHS = [
+    PROFILE_XPATHS["name"],
+    PROFILE_XPATHS["locations"],
+]
+
+# Fields that differ from one location of a practitioner to another; the others
+# (name, speciality, skills, languages, summary, website, history) are the same on every location page
+LOCATION_FIELDS = ("address", "contact_details", "prices")
+
+# CSS equivalents: "div.dl-card-variant-default", "a" and "div.p-16 h2, div.p-16 p"
+SEARCH_XPATHS = {
+    "cards": "//div[contains(concat(' ', normalize-space(@class), ' '), ' dl-card-variant-default ')]",
+    "card_link": ".//a",
+    "card_content": ".//div[contains(concat(' ', normalize-space(@class), ' '), ' p-16 ')]//*[self::h2 or self::p]",
+    "next_page": "//a[@rel='next']",
+    "page_links": "//a[contains(@href, 'page=')]",
+}
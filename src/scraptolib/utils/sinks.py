@@ -0,0 +1,226 @@
+import json, os, queue, threading
+from pathlib import Path
+
+class JsonlSink:
+    """
+    Append-only JSON Lines writer for scraped records.
+
+    Each record is one line, so writing costs the same whatever the file size and a crash
+    can at worst truncate the last line (which `read_jsonl` skips).
+    The sink is thread-safe and can be shared by several scrapers or workers.
+
+    Methods
+    -------
+    __init__(target_path: str, compact: bool = True, flush_every: int = 100, fsync: bool = True, append: bool = True)
+        Opens `target_path` in append mode (truncates it if `append` is False).
+        When appending, a partial last line left by a crash is cut first, so new records start on a line of their own.
+        Records are flushed (and fsynced if `fsync`) every `flush_every` records.
+        `compact` drops the spaces after separators.
+
+    write(record: Dict | Card | Profile)
+        Appends one record.
+
+    write_many(records: List[Dict | Card | Profile])
+        Appends several records.
+
+    flush()
+        Pushes buffered records to disk.
+
+    close()
+        Flushes and closes the file. The sink is also a context manager.
+    """
+
+    def __init__(self, target_path:str, compact:bool=True, flush_every:int=100, fsync:bool=True, append:bool=True):
+        self.path = Path(target_path)
+        self.separators = (",", ":") if compact else (", ", ": ")
+        self.flush_every = flush_every
+        self.fsync = fsync
+        self.count = 0
+
+        self._pending = 0
+        self._lock = threading.Lock()
+        if append:
+            drop_partial_line(self.path)
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+
+    def _write(self, record:dict):
+        if not isinstance(record, dict): # Card / Profile
+            record = record.to_dict()
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=self.separators) + "\n")
+        self.count += 1
+        self._pending += 1
+
+    def write(self, record:dict):
+        with self._lock:
+            self._write(record)
+            if self._pending >= self.flush_every:
+                self._flush()
+
+    def write_many(self, records:list[dict]):
+        with self._lock:
+            for record in records:
+                self._write(record)
+            if self._pending >= self.flush_every:
+                self._flush()
+
+    def _flush(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._flush()
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class SinkClosed(Exception):
+    """
+    Raised by `QueueSink.write` once the consumer side cancelled the stream.
+    """
+
+class QueueSink:
+    """
+    Bounded in-memory sink connecting a scraper (producer) to a consumer iterating over it.
+
+    `write` blocks while `maxsize` records are waiting, so a fast producer is held back by a
+    slow consumer (backpressure) and memory stays flat. The producer ends the stream with
+    `close`, optionally passing the exception that stopped it, which is raised again on the
+    consumer side. A consumer giving up early calls `cancel`: the blocked producer then gets
+    a `SinkClosed` instead of waiting forever.
+
+    Methods
+    -------
+    __init__(maxsize: int = 100)
+        `maxsize` records at most are buffered.
+
+    write(record) / write_many(records: List)
+        Queues records, waiting for room.
+
+    close(error: Exception | None = None)
+        Ends the stream (producer side).
+
+    cancel()
+        Stops the stream and drops the buffered records (consumer side).
+
+    __iter__()
+        Yields the records until the stream is closed.
+    """
+
+    _END = object()
+
+    def __init__(self, maxsize:int=100):
+        self.count = 0
+        self._queue = queue.Queue(maxsize)
+        self._cancelled = threading.Event()
+
+    def _put(self, item):
+        while True:
+            if self._cancelled.is_set():
+                raise SinkClosed("The consumer cancelled the stream")
+            try:
+                self._queue.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def write(self, record):
+        self._put(record)
+        self.count += 1
+
+    def write_many(self, records:list):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        pass
+
+    def close(self, error:Exception|None=None):
+        try:
+            self._put((self._END, error))
+        except SinkClosed:
+            pass
+
+    def cancel(self):
+        self._cancelled.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def __iter__(self):
+        while True:
+            item = self._queue.get()
+            if isinstance(item, tuple) and len(item) == 2 and item[0] is self._END:
+                if item[1] is not None:
+                    raise item[1]
+                return
+            yield item
+
+def drop_partial_line(path:str, chunk_size:int=65536):
+    """
+    Truncates the file after its last newline, removing a line cut by an interrupted write.
+    """
+    path = Path(path)
+    if not path.exists():
+        return
+
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - chunk_size)
+            f.seek(start)
+            chunk = f.read(position - start)
+            newline = chunk.rfind(b"\n")
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+
+        if position < end:
+            f.truncate(position)
+
+def read_jsonl(source_path:str):
+    """
+    Yields the records of a JSON Lines file. A truncated last line (interrupted write) is skipped.
+    """
+    with open(source_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                if line.endswith("\n"):
+                    raise
+                # last line cut by a crash
+
+def json_to_jsonl(source_path:str, target_path:str, compact:bool=True):
+    """
+    Converts a JSON array file (as written by `store_json_data`) to JSON Lines.
+    """
+    with open(source_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    with JsonlSink(target_path, compact=compact, flush_every=len(data) or 1, append=False) as sink:
+        sink.write_many(data)
+
+def jsonl_to_json(source_path:str, target_path:str):
+    """
+    Converts a JSON Lines file back to the JSON array format of `store_json_data`.
+    """
+    with open(target_path, "w", encoding="utf-8") as f:
+        json.dump(list(read_jsonl(source_path)), f, indent=4, ensure_ascii=False)
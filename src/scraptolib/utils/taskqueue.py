@@ -0,0 +1,442 @@
+import os, socket, sqlite3, threading, time
+from abc import ABC, abstractmethod
+
+try:
+    import redis
+except ImportError: # optional dependency, see the "redis" extra
+    redis = None
+
+from scraptolib.utils.frontier import normalize_url
+
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+def default_worker_id():
+    """
+    `host:pid:thread`, unique across the processes and nodes sharing a queue.
+    """
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+class BaseTaskQueue(ABC):
+    """
+    Work queue of profile URLs shared by several workers, whatever the storage backend.
+
+    Hrefs are published as tasks (once per normalized URL); a worker claims tasks with a lease,
+    then acknowledges them (`ack`) or gives them back (`nack`). A task whose lease expires, e.g.
+    because its worker died, goes back to the queue. Tasks failing `max_attempts` times are
+    kept as failed. Claims are atomic, so any number of workers can consume the same queue.
+    The queue has the `write`/`write_many` interface of `JsonlSink`, so `CardsScraper` can publish
+    the cards it finds directly (`sink=queue`).
+
+    Backends: `TaskQueue` (SQLite, workers of a single machine) and `RedisTaskQueue`
+    (Redis server, workers on any number of machines).
+
+    Methods
+    -------
+    publish(hrefs: List[str]) -> int
+        Queues hrefs, ignoring the ones already published. Returns how many were new.
+
+    write(card: Dict | Card) / write_many(cards: List[Dict | Card])
+        Publishes the profile URL of cards.
+
+    claim(worker_id: str | None = None, limit: int = 1) -> List[Dict]
+        Leases up to `limit` queued tasks (`id`, `href`, `attempts`) for `lease_seconds`.
+
+    extend(task_id: int, worker_id: str | None = None) -> bool
+        Renews a lease still held by `worker_id`, for long tasks.
+
+    ack(task_id: int, records: int = 0, worker_id: str | None = None) -> bool
+        Marks a task done, with the number of records it produced.
+
+    nack(task_id: int, error: str = "", worker_id: str | None = None) -> bool
+        Gives a task back to the queue, or marks it failed after `max_attempts` attempts.
+
+    `ack` and `nack` only apply while `worker_id` still holds the lease and return False otherwise:
+    a task whose lease expired may already be claimed by another worker.
+
+    requeue_stale() -> int
+        Re-queues the tasks whose lease expired. Called by `claim`.
+
+    stats() -> Dict[str, int]
+        Number of tasks per status.
+
+    close()
+        Closes the connection to the backend.
+    """
+
+    lease_seconds: float
+    max_attempts: int
+
+    @abstractmethod
+    def publish(self, hrefs:list[str]):
+        pass
+
+    def write(self, card):
+        self.write_many([card])
+
+    def write_many(self, cards):
+        self.publish([
+            card["Page_doctolib"] if isinstance(card, dict) else card.page
+            for card in cards
+        ])
+
+    def flush(self):
+        pass
+
+    @abstractmethod
+    def requeue_stale(self):
+        pass
+
+    @abstractmethod
+    def claim(self, worker_id:str|None=None, limit:int=1):
+        pass
+
+    @abstractmethod
+    def extend(self, task_id:int, worker_id:str|None=None):
+        pass
+
+    @abstractmethod
+    def ack(self, task_id:int, records:int=0, worker_id:str|None=None):
+        pass
+
+    @abstractmethod
+    def nack(self, task_id:int, error:str="", worker_id:str|None=None):
+        pass
+
+    @abstractmethod
+    def stats(self):
+        pass
+
+    @abstractmethod
+    def close(self):
+        pass
+
+class TaskQueue(BaseTaskQueue):
+    """
+    `BaseTaskQueue` stored in SQLite, for the worker processes of a single machine.
+
+    Claims are atomic across processes. The database is in WAL mode, which needs shared memory:
+    keep it on a local disk, never on a network file system. To spread workers over several
+    machines, use `RedisTaskQueue`.
+
+    Methods
+    -------
+    __init__(db_path: str = "tasks.sqlite", lease_seconds: float = 600, max_attempts: int = 3)
+        Opens (or creates) the queue.
+
+    See `BaseTaskQueue` for the queue interface.
+    """
+
+    def __init__(self, db_path:str="tasks.sqlite", lease_seconds:float=600, max_attempts:int=3):
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        # autocommit: claims open their own write transaction
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                href TEXT NOT NULL UNIQUE,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                worker TEXT,
+                lease_expires REAL,
+                published_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                records INTEGER,
+                error TEXT
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, id)")
+
+    def publish(self, hrefs:list[str]):
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.executemany(
+                "INSERT OR IGNORE INTO tasks (href, status, published_at, updated_at) VALUES (?, ?, ?, ?)",
+                [(normalize_url(href), QUEUED, now, now) for href in hrefs]
+            )
+        return cursor.rowcount
+
+    def requeue_stale(self):
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                requeued = self._requeue_stale(now)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return requeued
+
+    def _requeue_stale(self, now:float):
+        self._conn.execute(
+            """
+            UPDATE tasks SET status = ?, worker = NULL, lease_expires = NULL, updated_at = ?,
+                error = 'lease expired'
+            WHERE status = ? AND lease_expires < ? AND attempts >= ?
+            """,
+            (FAILED, now, LEASED, now, self.max_attempts)
+        )
+        return self._conn.execute(
+            """
+            UPDATE tasks SET status = ?, worker = NULL, lease_expires = NULL, updated_at = ?
+            WHERE status = ? AND lease_expires < ?
+            """,
+            (QUEUED, now, LEASED, now)
+        ).rowcount
+
+    def claim(self, worker_id:str|None=None, limit:int=1):
+        worker_id = worker_id or default_worker_id()
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._requeue_stale(now)
+                rows = self._conn.execute(
+                    "SELECT id, href, attempts FROM tasks WHERE status = ? ORDER BY id LIMIT ?",
+                    (QUEUED, limit)
+                ).fetchall()
+                self._conn.executemany(
+                    """
+                    UPDATE tasks SET status = ?, worker = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    [(LEASED, worker_id, now + self.lease_seconds, now, row[0]) for row in rows]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [{"id": row[0], "href": row[1], "attempts": row[2] + 1} for row in rows]
+
+    def extend(self, task_id:int, worker_id:str|None=None):
+        worker_id = worker_id or default_worker_id()
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET lease_expires = ?, updated_at = ? WHERE id = ? AND status = ? AND worker = ?",
+                (now + self.lease_seconds, now, task_id, LEASED, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def ack(self, task_id:int, records:int=0, worker_id:str|None=None):
+        worker_id = worker_id or default_worker_id()
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                UPDATE tasks SET status = ?, worker = NULL, lease_expires = NULL, updated_at = ?,
+                    records = ?, error = NULL
+                WHERE id = ? AND status = ? AND worker = ?
+                """,
+                (DONE, time.time(), records, task_id, LEASED, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def nack(self, task_id:int, error:str="", worker_id:str|None=None):
+        worker_id = worker_id or default_worker_id()
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                UPDATE tasks SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END,
+                    worker = NULL, lease_expires = NULL, updated_at = ?, error = ?
+                WHERE id = ? AND status = ? AND worker = ?
+                """,
+                (self.max_attempts, FAILED, QUEUED, time.time(), error, task_id, LEASED, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def stats(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+            ).fetchall()
+        return {QUEUED: 0, LEASED: 0, DONE: 0, FAILED: 0, **dict(rows)}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+# Lua scripts run atomically on the Redis server, so claims never race between machines.
+# Times come from the server clock (TIME) to keep leases consistent whatever the worker clocks.
+# Keys: <name>:ids (href -> id), <name>:seq, <name>:task:<id> (task hash),
+# <name>:queued (ids by id), <name>:leased (ids by lease expiry), <name>:done and <name>:failed (sets).
+_REDIS_PRELUDE = """
+local prefix = ARGV[1]
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local function requeue_stale(max_attempts)
+    local requeued = 0
+    for _, id in ipairs(redis.call('ZRANGEBYSCORE', prefix .. ':leased', '-inf', '(' .. now)) do
+        local key = prefix .. ':task:' .. id
+        redis.call('ZREM', prefix .. ':leased', id)
+        redis.call('HDEL', key, 'worker', 'lease_expires')
+        if tonumber(redis.call('HGET', key, 'attempts')) >= max_attempts then
+            redis.call('HSET', key, 'status', 'failed', 'error', 'lease expired', 'updated_at', now)
+            redis.call('SADD', prefix .. ':failed', id)
+        else
+            redis.call('HSET', key, 'status', 'queued', 'updated_at', now)
+            redis.call('ZADD', prefix .. ':queued', id, id)
+            requeued = requeued + 1
+        end
+    end
+    return requeued
+end
+
+local function holds_lease(key, worker)
+    return redis.call('HGET', key, 'status') == 'leased' and redis.call('HGET', key, 'worker') == worker
+end
+"""
+
+_REDIS_SCRIPTS = {
+    # ARGV: prefix, href...
+    "publish": """
+local published = 0
+for i = 2, #ARGV do
+    local href = ARGV[i]
+    if redis.call('HEXISTS', prefix .. ':ids', href) == 0 then
+        local id = redis.call('INCR', prefix .. ':seq')
+        redis.call('HSET', prefix .. ':ids', href, id)
+        redis.call('HSET', prefix .. ':task:' .. id, 'href', href, 'status', 'queued', 'attempts', 0,
+            'published_at', now, 'updated_at', now)
+        redis.call('ZADD', prefix .. ':queued', id, id)
+        published = published + 1
+    end
+end
+return published
+""",
+    # ARGV: prefix, max_attempts
+    "requeue_stale": """
+return requeue_stale(tonumber(ARGV[2]))
+""",
+    # ARGV: prefix, max_attempts, worker, limit, lease_seconds
+    "claim": """
+requeue_stale(tonumber(ARGV[2]))
+local expires = now + tonumber(ARGV[5])
+local claimed = {}
+for _, id in ipairs(redis.call('ZRANGE', prefix .. ':queued', 0, tonumber(ARGV[4]) - 1)) do
+    local key = prefix .. ':task:' .. id
+    redis.call('ZREM', prefix .. ':queued', id)
+    local attempts = redis.call('HINCRBY', key, 'attempts', 1)
+    redis.call('HSET', key, 'status', 'leased', 'worker', ARGV[3], 'lease_expires', expires, 'updated_at', now)
+    redis.call('ZADD', prefix .. ':leased', expires, id)
+    table.insert(claimed, {tonumber(id), redis.call('HGET', key, 'href'), attempts})
+end
+return claimed
+""",
+    # ARGV: prefix, task_id, worker, lease_seconds
+    "extend": """
+local key = prefix .. ':task:' .. ARGV[2]
+if not holds_lease(key, ARGV[3]) then return 0 end
+local expires = now + tonumber(ARGV[4])
+redis.call('HSET', key, 'lease_expires', expires, 'updated_at', now)
+redis.call('ZADD', prefix .. ':leased', expires, ARGV[2])
+return 1
+""",
+    # ARGV: prefix, task_id, worker, records
+    "ack": """
+local key = prefix .. ':task:' .. ARGV[2]
+if not holds_lease(key, ARGV[3]) then return 0 end
+redis.call('ZREM', prefix .. ':leased', ARGV[2])
+redis.call('HDEL', key, 'worker', 'lease_expires', 'error')
+redis.call('HSET', key, 'status', 'done', 'records', ARGV[4], 'updated_at', now)
+redis.call('SADD', prefix .. ':done', ARGV[2])
+return 1
+""",
+    # ARGV: prefix, task_id, worker, error, max_attempts
+    "nack": """
+local key = prefix .. ':task:' .. ARGV[2]
+if not holds_lease(key, ARGV[3]) then return 0 end
+redis.call('ZREM', prefix .. ':leased', ARGV[2])
+redis.call('HDEL', key, 'worker', 'lease_expires')
+if tonumber(redis.call('HGET', key, 'attempts')) >= tonumber(ARGV[5]) then
+    redis.call('HSET', key, 'status', 'failed', 'error', ARGV[4], 'updated_at', now)
+    redis.call('SADD', prefix .. ':failed', ARGV[2])
+else
+    redis.call('HSET', key, 'status', 'queued', 'error', ARGV[4], 'updated_at', now)
+    redis.call('ZADD', prefix .. ':queued', ARGV[2], ARGV[2])
+end
+return 1
+""",
+}
+
+class RedisTaskQueue(BaseTaskQueue):
+    """
+    `BaseTaskQueue` stored on a Redis server, for workers spread over several machines.
+
+    Every operation is a Lua script run atomically by the server, and leases are timed with the
+    server clock, so workers on different nodes never claim the same task. Tasks live under keys
+    prefixed with `name`: several queues can share a server. Needs Redis 5 or later.
+    Requires the optional `redis` dependency (`pip install scraptolib[redis]`).
+
+    Methods
+    -------
+    __init__(url: str = "redis://localhost:6379/0", name: str = "scraptolib:tasks", lease_seconds: float = 600, max_attempts: int = 3, client: redis.Redis | None = None)
+        Connects to the queue at `url`, or uses an existing `client`.
+
+    See `BaseTaskQueue` for the queue interface.
+    """
+
+    def __init__(self, url:str="redis://localhost:6379/0", name:str="scraptolib:tasks", lease_seconds:float=600, max_attempts:int=3, client=None):
+        if client is None:
+            if redis is None:
+                raise ImportError("RedisTaskQueue requires redis: pip install scraptolib[redis]")
+            client = redis.Redis.from_url(url)
+
+        self.name = name
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._redis = client
+        self._scripts = {
+            op: client.register_script(_REDIS_PRELUDE + script)
+            for op, script in _REDIS_SCRIPTS.items()
+        }
+
+    def _run(self, op:str, *args):
+        return self._scripts[op](args=[self.name, *args])
+
+    def publish(self, hrefs:list[str]):
+        hrefs = [normalize_url(href) for href in hrefs]
+        return self._run("publish", *hrefs) if hrefs else 0
+
+    def requeue_stale(self):
+        return self._run("requeue_stale", self.max_attempts)
+
+    def claim(self, worker_id:str|None=None, limit:int=1):
+        worker_id = worker_id or default_worker_id()
+        rows = self._run("claim", self.max_attempts, worker_id, limit, self.lease_seconds)
+        return [
+            {"id": int(row[0]), "href": row[1].decode() if isinstance(row[1], bytes) else row[1], "attempts": int(row[2])}
+            for row in rows
+        ]
+
+    def extend(self, task_id:int, worker_id:str|None=None):
+        worker_id = worker_id or default_worker_id()
+        return self._run("extend", task_id, worker_id, self.lease_seconds) == 1
+
+    def ack(self, task_id:int, records:int=0, worker_id:str|None=None):
+        worker_id = worker_id or default_worker_id()
+        return self._run("ack", task_id, worker_id, records) == 1
+
+    def nack(self, task_id:int, error:str="", worker_id:str|None=None):
+        worker_id = worker_id or default_worker_id()
+        return self._run("nack", task_id, worker_id, error, self.max_attempts) == 1
+
+    def stats(self):
+        with self._redis.pipeline() as pipe:
+            pipe.zcard(f"{self.name}:queued")
+            pipe.zcard(f"{self.name}:leased")
+            pipe.scard(f"{self.name}:done")
+            pipe.scard(f"{self.name}:failed")
+            queued, leased, done, failed = pipe.execute()
+        return {QUEUED: queued, LEASED: leased, DONE: done, FAILED: failed}
+
+    def close(self):
+        self._redis.close()
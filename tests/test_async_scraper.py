@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from scraptolib.scrapers.AsyncScraper import AsyncScraper
+
+class FakeScraper:
+    def __init__(self, fail):
+        self.fail = fail
+        self.started = False
+        self.stopped = False
+
+    def start_driver(self):
+        if self.fail:
+            raise RuntimeError("chrome crashed")
+        self.started = True
+
+    def stop_driver(self):
+        self.stopped = True
+
+class FakeAsyncScraper(AsyncScraper):
+    def __init__(self, failing:set[int], browsers:int=3):
+        super().__init__("chromedriver", browsers=browsers)
+        self.failing = failing
+        self.made = []
+
+    def make_scraper(self):
+        scraper = FakeScraper(fail=len(self.made) in self.failing)
+        self.made.append(scraper)
+        return scraper
+
+def test_start_stops_started_browsers_when_one_fails():
+    scraper = FakeAsyncScraper(failing={1})
+
+    with pytest.raises(RuntimeError, match="chrome crashed"):
+        asyncio.run(scraper.start())
+
+    assert [s.started for s in scraper.made] == [True, False, True]
+    assert [s.stopped for s in scraper.made] == [True, False, True]
+    assert scraper.scrapers == []
+    assert scraper._executor._shutdown
+
+def test_context_manager_starts_and_stops_every_browser():
+    scraper = FakeAsyncScraper(failing=set())
+
+    async def run():
+        async with scraper:
+            async with scraper.lease() as leased:
+                assert leased.started
+
+    asyncio.run(run())
+    assert all(s.stopped for s in scraper.made)
@@ -0,0 +1,53 @@
+from scraptolib.scrapers.ProfileScraper import ProfileScraper
+from scraptolib.utils.selectors import PROFILE_XPATHS
+
+HEADER_ONLY = """<html><body><span itemprop='name'>Dr X</span>
+<div class='dl-pill-list'><a href='/a?pid=1'>A</a><a href='/a?pid=2'>B</a></div></body></html>"""
+
+FULL = """<html><body><span itemprop='name'>Dr X</span>
+<div class='dl-pill-list'><a href='/a?pid=1'>A</a><a href='/a?pid=2'>B</a></div>
+<div data-test='location-address'>1 Rue du Port, 33000 Bordeaux</div>
+<div><h2>Tarifs</h2><ul><li><span>Consultation</span><br><span>60 €</span></li></ul></div>
+</body></html>"""
+
+class StaticFetcher:
+    def __init__(self, html):
+        self.html = html
+
+    def fetch(self, url):
+        return self.html
+
+    def update_cookies(self, driver):
+        pass
+
+class NoFetchDriver:
+    def execute_async_script(self, script, url):
+        return None
+
+def make_scraper(html):
+    scraper = ProfileScraper("chromedriver", fetcher=StaticFetcher(html))
+    scraper.pace = lambda alpha=1: None
+    return scraper
+
+def test_header_only_page_falls_back():
+    scraper = make_scraper(HEADER_ONLY)
+    xpaths = [PROFILE_XPATHS["name"], PROFILE_XPATHS["address"], PROFILE_XPATHS["prices"]]
+    assert scraper.fetch_parser("https://x/a?pid=2", xpaths) is None
+    assert scraper.metrics.summary()["counters"]["http_fallback"] == 1
+
+def test_page_with_sections_is_parsed():
+    scraper = make_scraper(FULL)
+    xpaths = [PROFILE_XPATHS["name"], PROFILE_XPATHS["address"], PROFILE_XPATHS["prices"]]
+    assert scraper.fetch_parser("https://x/a?pid=2", xpaths) is not None
+
+def test_location_data_needs_the_location_sections():
+    locations = [("B", "https://x/a?pid=2")]
+
+    scraper = make_scraper(HEADER_ONLY)
+    scraper.driver = NoFetchDriver()
+    assert scraper.get_location_data(locations, ["address", "prices"]) == [None]
+
+    scraper = make_scraper(FULL)
+    [data] = scraper.get_location_data(locations, ["address", "prices"])
+    assert data["address"] == "1 Rue du Port, 33000 Bordeaux"
+    assert data["prices"] == {"Consultation": "60 €"}